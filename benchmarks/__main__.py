@@ -0,0 +1,61 @@
+"""
+Benchmarks for the hot paths of "multiversx_sdk_core". They run offline, without a network.
+
+    python -m benchmarks run [--output results.json] [--case NAME ...] [--repeats 5] [--scale 1.0]
+    python -m benchmarks compare baseline.json current.json [--threshold 0.15]
+
+"compare" exits with a non-zero code if any case got slower than the baseline by more than the threshold.
+"""
+
+import argparse
+import json
+import sys
+from pathlib import Path
+from typing import List
+
+from benchmarks.cases import CASES
+from benchmarks.compare import (DEFAULT_THRESHOLD, find_regressions,
+                                format_comparison)
+from benchmarks.runner import run_cases
+
+
+def main(cli_args: List[str]) -> int:
+    parser = argparse.ArgumentParser(prog="python -m benchmarks")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    run_parser = subparsers.add_parser("run", help="run the benchmarks and output the results as JSON")
+    run_parser.add_argument("--output", type=Path, help="where to save the results (default: stdout)")
+    run_parser.add_argument("--case", action="append", choices=[case.name for case in CASES], help="run only the given case(s)")
+    run_parser.add_argument("--repeats", type=int, default=5)
+    run_parser.add_argument("--scale", type=float, default=1.0, help="multiplier for the number of operations per case")
+
+    compare_parser = subparsers.add_parser("compare", help="compare two results files")
+    compare_parser.add_argument("baseline", type=Path)
+    compare_parser.add_argument("current", type=Path)
+    compare_parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD, help="allowed slowdown, as a fraction (default: %(default)s)")
+
+    args = parser.parse_args(cli_args)
+
+    if args.command == "run":
+        results = run_cases(args.case, args.repeats, args.scale)
+        output = json.dumps(results, indent=4)
+
+        if args.output:
+            args.output.write_text(output)
+        else:
+            print(output)
+        return 0
+
+    baseline = json.loads(args.baseline.read_text())
+    current = json.loads(args.current.read_text())
+    print(format_comparison(baseline, current))
+
+    regressions = find_regressions(baseline, current, args.threshold)
+    for regression in regressions:
+        print(f"REGRESSION: {regression.name} is {regression.ratio:.2f}x slower", file=sys.stderr)
+
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
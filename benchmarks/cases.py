@@ -0,0 +1,209 @@
+"""
+Benchmark cases. Each case is a setup function that returns a callable, which performs `operations` operations when called.
+"""
+
+from typing import Callable, Dict, List, NamedTuple
+
+from multiversx_sdk_core.address import Address
+from multiversx_sdk_core.proto.transaction_serializer import ProtoSerializer
+from multiversx_sdk_core.serializer import args_to_strings
+from multiversx_sdk_core.token_payment import TokenPayment
+from multiversx_sdk_core.tokens import Token, TokenComputer, TokenTransfer
+from multiversx_sdk_core.transaction import Transaction, TransactionComputer
+from multiversx_sdk_core.transaction_factories.transactions_factory_config import \
+    TransactionsFactoryConfig
+from multiversx_sdk_core.transaction_factories.transfer_transactions_factory import \
+    TransferTransactionsFactory
+
+ALICE = "erd1qyu5wthldzr8wx5c9ucg8kjagg0jfs53s8nr3zpz3hypefsdd8ssycr6th"
+BOB = "erd1spyavw0956vq68xj8y4tenjpq2wd5a9p2c6j8gsz7ztyrnpxrruqzu66jx"
+
+
+class BenchmarkCase(NamedTuple):
+    name: str
+    kind: str
+    operations: int
+    setup: Callable[[int], Callable[[], None]]
+
+
+def _create_transaction() -> Transaction:
+    return Transaction(
+        sender=ALICE,
+        receiver=BOB,
+        gas_limit=50000,
+        chain_id="D",
+        nonce=42,
+        value=1000000000000000000,
+        data=b"test data"
+    )
+
+
+def _setup_address_to_bech32(operations: int) -> Callable[[], None]:
+    address = Address.new_from_bech32(ALICE)
+
+    def run() -> None:
+        for _ in range(operations):
+            address.to_bech32()
+
+    return run
+
+
+def _setup_address_from_bech32(operations: int) -> Callable[[], None]:
+    def run() -> None:
+        for _ in range(operations):
+            Address.new_from_bech32(ALICE)
+
+    return run
+
+
+def _setup_compute_bytes_for_signing(operations: int) -> Callable[[], None]:
+    computer = TransactionComputer()
+    transaction = _create_transaction()
+
+    def run() -> None:
+        for _ in range(operations):
+            computer.compute_bytes_for_signing(transaction)
+
+    return run
+
+
+def _setup_compute_hash_for_signing(operations: int) -> Callable[[], None]:
+    computer = TransactionComputer()
+    transaction = _create_transaction()
+
+    def run() -> None:
+        for _ in range(operations):
+            computer.compute_hash_for_signing(transaction)
+
+    return run
+
+
+def _setup_compute_transaction_hash(operations: int) -> Callable[[], None]:
+    computer = TransactionComputer()
+    transaction = _create_transaction()
+    transaction.signature = bytes(64)
+
+    def run() -> None:
+        for _ in range(operations):
+            computer.compute_transaction_hash(transaction)
+
+    return run
+
+
+def _setup_proto_serialize_transaction(operations: int) -> Callable[[], None]:
+    serializer = ProtoSerializer()
+    transaction = _create_transaction()
+    transaction.signature = bytes(64)
+
+    def run() -> None:
+        for _ in range(operations):
+            serializer.serialize_transaction(transaction)
+
+    return run
+
+
+def _setup_args_to_strings(operations: int) -> Callable[[], None]:
+    args = [42, "test", b"\x01\x02", -836623209073744937290891644, 0]
+
+    def run() -> None:
+        for _ in range(operations):
+            args_to_strings(args)
+
+    return run
+
+
+def _setup_parse_extended_identifier(operations: int) -> Callable[[], None]:
+    computer = TokenComputer()
+
+    def run() -> None:
+        for _ in range(operations):
+            computer.parse_extended_identifier_parts("TEST-123456-0a")
+
+    return run
+
+
+def _setup_token_payment_amounts(operations: int) -> Callable[[], None]:
+    def run() -> None:
+        for _ in range(operations):
+            payment = TokenPayment.egld_from_amount("1.123456789")
+            payment.to_amount_string()
+
+    return run
+
+
+def _setup_native_transfer_factory(operations: int) -> Callable[[], None]:
+    factory = TransferTransactionsFactory(TransactionsFactoryConfig("D"), TokenComputer())
+    alice = Address.new_from_bech32(ALICE)
+    bob = Address.new_from_bech32(BOB)
+
+    def run() -> None:
+        for _ in range(operations):
+            factory.create_transaction_for_native_token_transfer(alice, bob, 1000000000000000000)
+
+    return run
+
+
+def _setup_native_transfers_batch_factory(operations: int) -> Callable[[], None]:
+    factory = TransferTransactionsFactory(TransactionsFactoryConfig("D"), TokenComputer())
+    alice = Address.new_from_bech32(ALICE)
+    receivers = [Address.new_from_bech32(BOB)] * operations
+    amounts = [1000000000000000000] * operations
+
+    def run() -> None:
+        factory.create_transactions_for_native_token_transfers(alice, receivers, amounts)
+
+    return run
+
+
+def _setup_esdt_transfer_factory(operations: int) -> Callable[[], None]:
+    factory = TransferTransactionsFactory(TransactionsFactoryConfig("D"), TokenComputer())
+    alice = Address.new_from_bech32(ALICE)
+    bob = Address.new_from_bech32(BOB)
+    transfers = [TokenTransfer(Token("NFT-123456", 10), 1)]
+
+    def run() -> None:
+        for _ in range(operations):
+            factory.create_transaction_for_esdt_token_transfer(alice, bob, transfers)
+
+    return run
+
+
+def _setup_build_hash_serialize_transfers(operations: int) -> Callable[[], None]:
+    factory = TransferTransactionsFactory(TransactionsFactoryConfig("D"), TokenComputer())
+    computer = TransactionComputer()
+    alice = Address.new_from_bech32(ALICE)
+    bob = Address.new_from_bech32(BOB)
+
+    def run() -> None:
+        for nonce in range(operations):
+            transaction = factory.create_transaction_for_native_token_transfer(alice, bob, 1000000000000000000)
+            transaction.nonce = nonce
+            computer.compute_hash_for_signing(transaction)
+            transaction.signature = bytes(64)
+            computer.compute_transaction_hash(transaction)
+
+    return run
+
+
+MICRO_OPERATIONS = 2000
+MACRO_OPERATIONS = 100_000
+
+CASES: List[BenchmarkCase] = [
+    BenchmarkCase("address_to_bech32", "micro", MICRO_OPERATIONS, _setup_address_to_bech32),
+    BenchmarkCase("address_from_bech32", "micro", MICRO_OPERATIONS, _setup_address_from_bech32),
+    BenchmarkCase("transaction_compute_bytes_for_signing", "micro", MICRO_OPERATIONS, _setup_compute_bytes_for_signing),
+    BenchmarkCase("transaction_compute_hash_for_signing", "micro", MICRO_OPERATIONS, _setup_compute_hash_for_signing),
+    BenchmarkCase("transaction_compute_transaction_hash", "micro", MICRO_OPERATIONS, _setup_compute_transaction_hash),
+    BenchmarkCase("proto_serialize_transaction", "micro", MICRO_OPERATIONS, _setup_proto_serialize_transaction),
+    BenchmarkCase("args_to_strings", "micro", MICRO_OPERATIONS, _setup_args_to_strings),
+    BenchmarkCase("token_computer_parse_extended_identifier", "micro", MICRO_OPERATIONS, _setup_parse_extended_identifier),
+    BenchmarkCase("token_payment_amounts", "micro", MICRO_OPERATIONS, _setup_token_payment_amounts),
+    BenchmarkCase("factory_native_transfer", "micro", MICRO_OPERATIONS, _setup_native_transfer_factory),
+    BenchmarkCase("factory_native_transfers_batch", "micro", MICRO_OPERATIONS, _setup_native_transfers_batch_factory),
+    BenchmarkCase("factory_esdt_nft_transfer", "micro", MICRO_OPERATIONS, _setup_esdt_transfer_factory),
+    BenchmarkCase("build_hash_serialize_transfers", "macro", MACRO_OPERATIONS, _setup_build_hash_serialize_transfers),
+]
+
+
+def get_cases_by_name() -> Dict[str, BenchmarkCase]:
+    return {case.name: case for case in CASES}
@@ -0,0 +1,47 @@
+from typing import Any, Dict, List, NamedTuple
+
+DEFAULT_THRESHOLD = 0.15
+METRIC = "ns_per_op_min"
+
+
+class Regression(NamedTuple):
+    name: str
+    baseline: float
+    current: float
+
+    @property
+    def ratio(self) -> float:
+        return self.current / self.baseline
+
+
+def find_regressions(baseline: Dict[str, Any], current: Dict[str, Any], threshold: float = DEFAULT_THRESHOLD) -> List[Regression]:
+    """Cases missing from either of the results are ignored."""
+    regressions: List[Regression] = []
+
+    for name, current_result in current["results"].items():
+        baseline_result = baseline["results"].get(name)
+        if baseline_result is None:
+            continue
+
+        baseline_value = baseline_result[METRIC]
+        current_value = current_result[METRIC]
+
+        if baseline_value > 0 and current_value > baseline_value * (1 + threshold):
+            regressions.append(Regression(name, baseline_value, current_value))
+
+    return regressions
+
+
+def format_comparison(baseline: Dict[str, Any], current: Dict[str, Any]) -> str:
+    lines: List[str] = []
+
+    for name, current_result in current["results"].items():
+        baseline_result = baseline["results"].get(name)
+        if baseline_result is None:
+            lines.append(f"{name:<45} {current_result[METRIC]:>14.1f} ns/op (new)")
+            continue
+
+        change = current_result[METRIC] / baseline_result[METRIC] - 1
+        lines.append(f"{name:<45} {baseline_result[METRIC]:>14.1f} -> {current_result[METRIC]:>14.1f} ns/op ({change:+.1%})")
+
+    return "\n".join(lines)
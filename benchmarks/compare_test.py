@@ -0,0 +1,20 @@
+from benchmarks.cases import CASES
+from benchmarks.compare import find_regressions
+from benchmarks.runner import run_cases
+
+
+def test_find_regressions():
+    baseline = {"results": {"a": {"ns_per_op_min": 100.0}, "b": {"ns_per_op_min": 100.0}}}
+    current = {"results": {"a": {"ns_per_op_min": 111.0}, "b": {"ns_per_op_min": 125.0}, "c": {"ns_per_op_min": 1.0}}}
+
+    regressions = find_regressions(baseline, current, threshold=0.15)
+
+    assert [regression.name for regression in regressions] == ["b"]
+    assert regressions[0].ratio == 1.25
+
+
+def test_run_cases():
+    results = run_cases(repeats=1, scale=0.00001)
+
+    assert sorted(results["results"]) == sorted(case.name for case in CASES)
+    assert all(result["operations"] == 1 for result in results["results"].values())
@@ -0,0 +1,91 @@
+"""
+Measures the cold import of "multiversx_sdk_core" (wall time and allocated memory) in fresh interpreters,
+and checks the measurements against a budget.
+
+    python -m benchmarks.import_time [--runs 10] [--max-time-ms 60] [--max-memory-kb 2048]
+"""
+
+import argparse
+import json
+import statistics
+import subprocess
+import sys
+from typing import Any, Dict, List
+
+DEFAULT_RUNS = 10
+DEFAULT_MAX_TIME_MS = 60.0
+DEFAULT_MAX_MEMORY_KB = 2048.0
+
+# Modules that must not be loaded by a plain "import multiversx_sdk_core".
+HEAVY_MODULES = [
+    "google.protobuf",
+    "multiversx_sdk_core.proto.transaction_pb2",
+    "Cryptodome.Hash.keccak",
+    "decimal",
+    "multiversx_sdk_core.transaction_factories",
+]
+
+_MEASURE_SCRIPT = """
+import json, sys, time, tracemalloc, warnings
+warnings.simplefilter("ignore")
+tracemalloc.start()
+start = time.perf_counter()
+import multiversx_sdk_core
+elapsed = time.perf_counter() - start
+_, peak = tracemalloc.get_traced_memory()
+heavy = [name for name in json.loads(sys.argv[1]) if name in sys.modules]
+print(json.dumps({"time_ms": elapsed * 1000, "memory_kb": peak / 1024, "loaded_heavy_modules": heavy}))
+"""
+
+
+def measure_once() -> Dict[str, Any]:
+    output = subprocess.check_output([sys.executable, "-c", _MEASURE_SCRIPT, json.dumps(HEAVY_MODULES)])
+    return json.loads(output)
+
+
+def measure(runs: int) -> Dict[str, Any]:
+    samples = [measure_once() for _ in range(runs)]
+    times: List[float] = [sample["time_ms"] for sample in samples]
+    memory: List[float] = [sample["memory_kb"] for sample in samples]
+
+    return {
+        "runs": runs,
+        "time_ms_median": statistics.median(times),
+        "time_ms_min": min(times),
+        "memory_kb_median": statistics.median(memory),
+        "loaded_heavy_modules": samples[-1]["loaded_heavy_modules"],
+    }
+
+
+def check_budget(result: Dict[str, Any], max_time_ms: float, max_memory_kb: float) -> List[str]:
+    violations: List[str] = []
+
+    if result["time_ms_median"] > max_time_ms:
+        violations.append(f"import time {result['time_ms_median']:.2f} ms > {max_time_ms} ms")
+    if result["memory_kb_median"] > max_memory_kb:
+        violations.append(f"import allocations {result['memory_kb_median']:.1f} KiB > {max_memory_kb} KiB")
+    if result["loaded_heavy_modules"]:
+        violations.append(f"heavy modules loaded at import: {', '.join(result['loaded_heavy_modules'])}")
+
+    return violations
+
+
+def main(cli_args: List[str]) -> int:
+    parser = argparse.ArgumentParser(description="Measure the import time of multiversx_sdk_core")
+    parser.add_argument("--runs", type=int, default=DEFAULT_RUNS)
+    parser.add_argument("--max-time-ms", type=float, default=DEFAULT_MAX_TIME_MS)
+    parser.add_argument("--max-memory-kb", type=float, default=DEFAULT_MAX_MEMORY_KB)
+    args = parser.parse_args(cli_args)
+
+    result = measure(args.runs)
+    print(json.dumps(result, indent=4))
+
+    violations = check_budget(result, args.max_time_ms, args.max_memory_kb)
+    for violation in violations:
+        print(f"BUDGET EXCEEDED: {violation}", file=sys.stderr)
+
+    return 1 if violations else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
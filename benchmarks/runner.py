@@ -0,0 +1,58 @@
+import platform
+import statistics
+import subprocess
+import sys
+import time
+from typing import Any, Dict, List, Optional, Sequence
+
+from benchmarks.cases import CASES, BenchmarkCase
+
+
+def run_case(case: BenchmarkCase, repeats: int, scale: float) -> Dict[str, Any]:
+    operations = max(1, int(case.operations * scale))
+    run = case.setup(operations)
+
+    # warm-up (also triggers the lazy imports and caches)
+    case.setup(1)()
+
+    durations: List[float] = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        run()
+        durations.append(time.perf_counter() - start)
+
+    per_operation = [duration / operations for duration in durations]
+
+    return {
+        "kind": case.kind,
+        "operations": operations,
+        "repeats": repeats,
+        "ns_per_op_min": min(per_operation) * 1e9,
+        "ns_per_op_median": statistics.median(per_operation) * 1e9,
+    }
+
+
+def run_cases(names: Optional[Sequence[str]] = None, repeats: int = 5, scale: float = 1.0) -> Dict[str, Any]:
+    selected = [case for case in CASES if not names or case.name in names]
+
+    return {
+        "metadata": _get_metadata(),
+        "results": {case.name: run_case(case, repeats, scale) for case in selected},
+    }
+
+
+def _get_metadata() -> Dict[str, Any]:
+    return {
+        "commit": _get_git_commit(),
+        "python": sys.version.split()[0],
+        "implementation": platform.python_implementation(),
+        "platform": platform.platform(),
+        "timestamp": int(time.time()),
+    }
+
+
+def _get_git_commit() -> str:
+    try:
+        return subprocess.check_output(["git", "rev-parse", "HEAD"], stderr=subprocess.DEVNULL).decode().strip()
+    except (OSError, subprocess.CalledProcessError):
+        return ""
@@ -1,25 +1,70 @@
 import warnings
+from importlib import import_module
+from typing import TYPE_CHECKING, Any, Dict, List
 
-from multiversx_sdk_core.account import AccountNonceHolder
-from multiversx_sdk_core.address import (Address, AddressComputer,
-                                         AddressFactory)
-from multiversx_sdk_core.code_metadata import CodeMetadata
-from multiversx_sdk_core.contract_query import ContractQuery
-from multiversx_sdk_core.contract_query_builder import ContractQueryBuilder
-from multiversx_sdk_core.message import Message, MessageComputer
-from multiversx_sdk_core.token_payment import TokenPayment
-from multiversx_sdk_core.tokens import (Token, TokenComputer,
-                                        TokenIdentifierParts, TokenTransfer)
-from multiversx_sdk_core.transaction import Transaction, TransactionComputer
-from multiversx_sdk_core.transaction_payload import TransactionPayload
+if TYPE_CHECKING:
+    from multiversx_sdk_core.account import AccountNonceHolder
+    from multiversx_sdk_core.address import (Address, AddressComputer,
+                                             AddressFactory)
+    from multiversx_sdk_core.code_metadata import CodeMetadata
+    from multiversx_sdk_core.contract_query import ContractQuery
+    from multiversx_sdk_core.contract_query_builder import ContractQueryBuilder
+    from multiversx_sdk_core.message import Message, MessageComputer
+    from multiversx_sdk_core.token_payment import TokenPayment
+    from multiversx_sdk_core.tokens import (Token, TokenComputer,
+                                            TokenIdentifierParts, TokenLedger,
+                                            TokenTransfer)
+    from multiversx_sdk_core.transaction import Transaction, TransactionComputer
+    from multiversx_sdk_core.transaction_payload import TransactionPayload
+    from multiversx_sdk_core.typed_codec import TypedCodec, TypedValue
 
 warnings.warn('This package is deprecated and will no longer be maintained. Instead, please use "multiversx-sdk".')
 
+# The public names are resolved on first access (PEP 562), so that importing the package
+# does not eagerly load the heavier dependencies (e.g. protobuf, pycryptodome, decimal).
+_LAZY_IMPORTS: Dict[str, str] = {
+    "AccountNonceHolder": "multiversx_sdk_core.account",
+    "Address": "multiversx_sdk_core.address",
+    "AddressComputer": "multiversx_sdk_core.address",
+    "AddressFactory": "multiversx_sdk_core.address",
+    "CodeMetadata": "multiversx_sdk_core.code_metadata",
+    "ContractQuery": "multiversx_sdk_core.contract_query",
+    "ContractQueryBuilder": "multiversx_sdk_core.contract_query_builder",
+    "Message": "multiversx_sdk_core.message",
+    "MessageComputer": "multiversx_sdk_core.message",
+    "TokenPayment": "multiversx_sdk_core.token_payment",
+    "Token": "multiversx_sdk_core.tokens",
+    "TokenComputer": "multiversx_sdk_core.tokens",
+    "TokenIdentifierParts": "multiversx_sdk_core.tokens",
+    "TokenLedger": "multiversx_sdk_core.tokens",
+    "TokenTransfer": "multiversx_sdk_core.tokens",
+    "Transaction": "multiversx_sdk_core.transaction",
+    "TransactionComputer": "multiversx_sdk_core.transaction",
+    "TransactionPayload": "multiversx_sdk_core.transaction_payload",
+    "TypedCodec": "multiversx_sdk_core.typed_codec",
+    "TypedValue": "multiversx_sdk_core.typed_codec",
+}
+
+
+def __getattr__(name: str) -> Any:
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    value = getattr(import_module(module_name), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> List[str]:
+    return sorted(set(globals()) | set(__all__))
+
 
 __all__ = [
     "AccountNonceHolder", "Address", "AddressFactory", "AddressComputer",
     "Transaction", "TransactionPayload", "TransactionComputer",
     "Message", "MessageComputer", "CodeMetadata", "TokenPayment",
     "ContractQuery", "ContractQueryBuilder",
-    "Token", "TokenComputer", "TokenTransfer", "TokenIdentifierParts"
+    "Token", "TokenComputer", "TokenTransfer", "TokenIdentifierParts", "TokenLedger",
+    "TypedCodec", "TypedValue"
 ]
@@ -1,11 +1,11 @@
 import logging
 from typing import Protocol, Tuple
 
-from Cryptodome.Hash import keccak
-
 from multiversx_sdk_core import bech32
 from multiversx_sdk_core.constants import DEFAULT_HRP, METACHAIN_ID
 from multiversx_sdk_core.errors import ErrBadAddress, ErrBadPubkeyLength
+from multiversx_sdk_core.hashing import keccak256
+from multiversx_sdk_core.instrumentation import instrumented
 
 SC_HEX_PUBKEY_PREFIX = "0" * 16
 PUBKEY_LENGTH = 32
@@ -32,6 +32,7 @@ class Address:
         self.hrp = hrp
 
     @classmethod
+    @instrumented("address.new_from_bech32")
     def new_from_bech32(cls, value: str) -> 'Address':
         hrp, pubkey = _decode_bech32(value)
         return cls(pubkey, hrp)
@@ -58,6 +59,7 @@ class Address:
         """The `hex()` method is deprecated. Please use `to_hex()` instead"""
         return self.to_hex()
 
+    @instrumented("address.to_bech32")
     def to_bech32(self) -> str:
         converted = bech32.convertbits(self.pubkey, 8, 5)
         assert converted is not None
@@ -88,6 +90,7 @@ class AddressFactory:
     def __init__(self, hrp: str = DEFAULT_HRP) -> None:
         self.hrp = hrp
 
+    @instrumented("address_factory.create_from_bech32")
     def create_from_bech32(self, value: str) -> Address:
         hrp, pubkey = _decode_bech32(value)
         if hrp != self.hrp:
@@ -113,7 +116,7 @@ class AddressComputer:
         deployer_pubkey = deployer.get_public_key()
         nonce_bytes = deployment_nonce.to_bytes(8, byteorder="little")
         bytes_to_hash = deployer_pubkey + nonce_bytes
-        contract_pubkey = keccak.new(digest_bits=256).update(bytes_to_hash).digest()
+        contract_pubkey = keccak256(bytes_to_hash)
         contract_pubkey = bytes([0] * 8) + bytes([5, 0]) + contract_pubkey[10:30] + deployer_pubkey[30:]
         return Address(contract_pubkey, deployer.get_hrp())
 
@@ -14,18 +14,20 @@ class ContractQueryBuilder():
                  call_arguments: Sequence[Any] = [],
                  caller: Optional[IAddress] = None,
                  value: Optional[int] = None,
+                 call_arguments_types: Optional[Sequence[str]] = None
                  ) -> None:
         self.contract = contract
         self.function_name = function
         self.call_arguments = call_arguments
         self.caller = caller
         self.value = value
+        self.call_arguments_types = call_arguments_types
 
     def build(self) -> ContractQuery:
         query = ContractQuery(
             contract=self.contract,
             function=self.function_name,
-            encoded_arguments=args_to_strings(self.call_arguments),
+            encoded_arguments=args_to_strings(self.call_arguments, self.call_arguments_types),
             caller=self.caller,
             value=self.value
         )
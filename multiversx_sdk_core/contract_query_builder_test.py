@@ -21,3 +21,18 @@ def test_contract_query_builder():
     assert query.encoded_arguments == ["2a", "74657374", "fd4bf624f561bc2894c6fe84"]
     assert query.caller == caller
     assert query.value == 1
+
+
+def test_contract_query_builder_with_typed_arguments():
+    contract = Address.new_from_bech32("erd1qqqqqqqqqqqqqpgquzmh78klkqwt0p4rjys0qtp3la07gz4d396qn50nnm")
+
+    builder = ContractQueryBuilder(
+        contract=contract,
+        function="getFoobar",
+        call_arguments=[42, [1, 2], None],
+        call_arguments_types=["u64", "List<u32>", "Option<Address>"]
+    )
+
+    query = builder.build()
+
+    assert query.encoded_arguments == ["2a", "0000000100000002", ""]
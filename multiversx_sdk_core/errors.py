@@ -54,3 +54,13 @@ class InvalidTokenIdentifierError(Exception):
 class InvalidInnerTransactionError(Exception):
     def __init__(self, message: str) -> None:
         super().__init__(message)
+
+
+class InvalidTypeSignatureError(Exception):
+    def __init__(self, message: str) -> None:
+        super().__init__(message)
+
+
+class InvalidRelayedTransactionError(Exception):
+    def __init__(self, message: str) -> None:
+        super().__init__(message)
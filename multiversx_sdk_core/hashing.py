@@ -0,0 +1,165 @@
+"""
+Hashing backends for keccak-256 (used for signing) and blake2b-256 (used for transaction hashes).
+
+The keccak-256 backend is selected on first use (not on import, to keep the package import cheap),
+among the available implementations, in order of preference: a native "pysha3" module,
+hashlib (if the underlying OpenSSL exposes "keccak-256"), then pycryptodome.
+A candidate is accepted only if it passes the known test vectors.
+"""
+
+import hashlib
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+
+from multiversx_sdk_core.constants import DIGEST_SIZE
+from multiversx_sdk_core.errors import BadUsageError
+
+HashFunction = Callable[[bytes], bytes]
+
+KECCAK_256_TEST_VECTORS: List[Tuple[bytes, str]] = [
+    (b"", "c5d2460186f7233c927e7db2dcc703c0e500b653ca82273b7bfad8045d85a470"),
+    (b"abc", "4e03657aea45a94fc7d47ba826c8d667c0d1e6e33a64a036ec44f58fa12d6c45"),
+    (b"hello", "1c8aff950685c2ed4bc3174f3472287b56d9517b9c948127319a09a7a36deac8"),
+    (b"a" * 200, "96ea54061def936c4be90b518992fdc6f12f535068a256229aca54267b4d084d"),
+]
+
+BLAKE2B_256_TEST_VECTORS: List[Tuple[bytes, str]] = [
+    (b"", "0e5751c026e543b2e8ab2eb06099daa1d1e5df47778f7787faab45cdf12fe3a8"),
+    (b"abc", "bddd813c634239723171ef3fee98579b94964e3bb1cb3e427262c8c068d52319"),
+    (b"hello", "324dcf027dd4a30a932c441f365a25e86b173defa4b8e58948253471b81b72cf"),
+    (b"a" * 200, "6b6e59aaf00eb730cf93de53560846722184bbd92f8368c21ffa95380c2f9fe6"),
+]
+
+
+def _load_pysha3() -> HashFunction:
+    import sha3  # type: ignore
+
+    keccak_256 = sha3.keccak_256
+
+    def keccak256(data: bytes) -> bytes:
+        return keccak_256(data).digest()
+
+    return keccak256
+
+
+def _load_hashlib() -> HashFunction:
+    # raises ValueError if the underlying OpenSSL does not provide it
+    hashlib.new("keccak-256")
+
+    def keccak256(data: bytes) -> bytes:
+        return hashlib.new("keccak-256", data).digest()
+
+    return keccak256
+
+
+def _load_pycryptodome() -> HashFunction:
+    from Cryptodome.Hash import keccak
+
+    new = keccak.new
+
+    def keccak256(data: bytes) -> bytes:
+        return new(data=data, digest_bits=256).digest()
+
+    return keccak256
+
+
+# Ordered by preference (fastest first).
+_keccak_loaders: Dict[str, Callable[[], HashFunction]] = {
+    "pysha3": _load_pysha3,
+    "hashlib": _load_hashlib,
+    "pycryptodome": _load_pycryptodome,
+}
+
+_keccak_backends: Dict[str, HashFunction] = {}
+
+_selected_keccak256: Optional[HashFunction] = None
+_selected_keccak256_backend_name: str = ""
+
+
+def register_keccak_backend(name: str, function: HashFunction, use: bool = True) -> None:
+    """Registers a custom keccak-256 implementation (validated against the test vectors) and, optionally, selects it."""
+    if not passes_test_vectors(function, KECCAK_256_TEST_VECTORS):
+        raise BadUsageError(f"The keccak-256 backend '{name}' does not pass the test vectors")
+
+    _keccak_backends[name] = function
+
+    if use:
+        use_keccak_backend(name)
+
+
+def use_keccak_backend(name: str) -> None:
+    function = _keccak_backends.get(name) or _try_load_keccak_backend(name)
+    if function is None:
+        raise BadUsageError(f"The keccak-256 backend '{name}' is not available")
+
+    global _selected_keccak256, _selected_keccak256_backend_name
+    _selected_keccak256 = function
+    _selected_keccak256_backend_name = name
+
+
+def get_keccak_backend_name() -> str:
+    _ensure_keccak_backend()
+    return _selected_keccak256_backend_name
+
+
+def get_available_keccak_backends() -> List[str]:
+    for name in _keccak_loaders:
+        _try_load_keccak_backend(name)
+    return list(_keccak_backends)
+
+
+def keccak256(data: bytes) -> bytes:
+    function = _selected_keccak256 or _ensure_keccak_backend()
+    return function(data)
+
+
+def keccak256_many(items: Iterable[bytes]) -> List[bytes]:
+    function = _selected_keccak256 or _ensure_keccak_backend()
+    return [function(item) for item in items]
+
+
+def blake2b256(data: bytes) -> bytes:
+    return hashlib.blake2b(data, digest_size=DIGEST_SIZE).digest()
+
+
+def blake2b256_many(items: Iterable[bytes]) -> List[bytes]:
+    blake2b = hashlib.blake2b
+    return [blake2b(item, digest_size=DIGEST_SIZE).digest() for item in items]
+
+
+def passes_test_vectors(function: HashFunction, test_vectors: List[Tuple[bytes, str]]) -> bool:
+    try:
+        return all(function(data).hex() == expected for data, expected in test_vectors)
+    except Exception:
+        return False
+
+
+def _ensure_keccak_backend() -> HashFunction:
+    if _selected_keccak256 is not None:
+        return _selected_keccak256
+
+    for name in _keccak_loaders:
+        if _try_load_keccak_backend(name) is not None:
+            use_keccak_backend(name)
+            return _keccak_backends[name]
+
+    raise BadUsageError("No keccak-256 implementation is available")
+
+
+def _try_load_keccak_backend(name: str) -> Optional[HashFunction]:
+    if name in _keccak_backends:
+        return _keccak_backends[name]
+
+    loader = _keccak_loaders.get(name)
+    if loader is None:
+        return None
+
+    try:
+        function = loader()
+    except (ImportError, ValueError):
+        return None
+
+    if not passes_test_vectors(function, KECCAK_256_TEST_VECTORS):
+        return None
+
+    _keccak_backends[name] = function
+    return function
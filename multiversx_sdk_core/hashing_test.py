@@ -0,0 +1,51 @@
+import pytest
+from Cryptodome.Hash import keccak
+
+from multiversx_sdk_core import hashing
+from multiversx_sdk_core.errors import BadUsageError
+from multiversx_sdk_core.hashing import (BLAKE2B_256_TEST_VECTORS,
+                                         KECCAK_256_TEST_VECTORS)
+
+
+@pytest.fixture
+def restore_keccak_backend():
+    name = hashing.get_keccak_backend_name()
+    yield
+    hashing.use_keccak_backend(name)
+
+
+@pytest.mark.parametrize("backend", hashing.get_available_keccak_backends())
+def test_keccak_backends_against_test_vectors(backend: str, restore_keccak_backend: None):
+    hashing.use_keccak_backend(backend)
+
+    for data, expected in KECCAK_256_TEST_VECTORS:
+        assert hashing.keccak256(data).hex() == expected
+
+    assert [digest.hex() for digest in hashing.keccak256_many(data for data, _ in KECCAK_256_TEST_VECTORS)] == [expected for _, expected in KECCAK_256_TEST_VECTORS]
+
+
+def test_blake2b_against_test_vectors():
+    for data, expected in BLAKE2B_256_TEST_VECTORS:
+        assert hashing.blake2b256(data).hex() == expected
+
+    assert [digest.hex() for digest in hashing.blake2b256_many(data for data, _ in BLAKE2B_256_TEST_VECTORS)] == [expected for _, expected in BLAKE2B_256_TEST_VECTORS]
+
+
+def test_register_keccak_backend(restore_keccak_backend: None):
+    calls = []
+
+    def custom(data: bytes) -> bytes:
+        calls.append(data)
+        return keccak.new(data=data, digest_bits=256).digest()
+
+    hashing.register_keccak_backend("custom", custom)
+    assert hashing.get_keccak_backend_name() == "custom"
+
+    hashing.keccak256(b"foo")
+    assert calls[-1] == b"foo"
+
+    with pytest.raises(BadUsageError):
+        hashing.register_keccak_backend("bad", lambda data: bytes(32))
+
+    with pytest.raises(BadUsageError):
+        hashing.use_keccak_backend("missing")
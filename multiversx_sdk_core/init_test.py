@@ -0,0 +1,24 @@
+import subprocess
+import sys
+from pathlib import Path
+
+import multiversx_sdk_core
+import multiversx_sdk_core.transaction_factories
+
+
+def test_public_names_are_resolved_lazily():
+    for name in multiversx_sdk_core.__all__:
+        assert getattr(multiversx_sdk_core, name) is not None
+
+    for name in multiversx_sdk_core.transaction_factories.__all__:
+        assert getattr(multiversx_sdk_core.transaction_factories, name) is not None
+
+    assert "Address" in dir(multiversx_sdk_core)
+
+
+def test_import_does_not_load_heavy_modules():
+    script = "import sys, multiversx_sdk_core; print(','.join(name for name in ['google.protobuf', 'Cryptodome', 'decimal'] if name in sys.modules))"
+    root = Path(__file__).parent.parent
+    output = subprocess.check_output([sys.executable, "-W", "ignore", "-c", script], cwd=root)
+
+    assert output.decode().strip() == ""
@@ -0,0 +1,125 @@
+"""
+Counters and timings for the hot paths (address conversions, transaction computer, serializers, factories).
+
+Instrumentation is disabled by default, in which case `@instrumented` returns the decorated function unchanged (zero overhead).
+To enable it, set the environment variable `MULTIVERSX_SDK_INSTRUMENTATION=1` (or call `enable()`) before the SDK modules are imported:
+the flag is checked once, when the functions are decorated. Then, install a sink:
+
+    stats = InstrumentationStats()
+    set_sink(stats)
+    ...
+    print(stats.snapshot())
+"""
+
+import functools
+import os
+from bisect import bisect_left
+from time import perf_counter
+from typing import (Any, Callable, Dict, List, Optional, Protocol, TypeVar,
+                    cast)
+
+ENVIRONMENT_VARIABLE = "MULTIVERSX_SDK_INSTRUMENTATION"
+
+# Upper bounds of the histogram buckets, in seconds (the last bucket is unbounded).
+HISTOGRAM_BUCKETS = [
+    1e-6, 2e-6, 5e-6,
+    1e-5, 2e-5, 5e-5,
+    1e-4, 2e-4, 5e-4,
+    1e-3, 2e-3, 5e-3,
+    1e-2, 1e-1, 1.0
+]
+
+TFunction = TypeVar("TFunction", bound=Callable[..., Any])
+
+
+class ISink(Protocol):
+    def record(self, name: str, duration: float) -> None: ...
+
+
+_enabled: bool = os.environ.get(ENVIRONMENT_VARIABLE, "") not in ("", "0")
+_sink: Optional[ISink] = None
+
+
+class InstrumentationStats:
+    """In-process sink: counts, total durations and duration histograms, per instrumented function."""
+
+    def __init__(self) -> None:
+        self.counts: Dict[str, int] = {}
+        self.total_durations: Dict[str, float] = {}
+        self.histograms: Dict[str, List[int]] = {}
+
+    def record(self, name: str, duration: float) -> None:
+        histogram = self.histograms.get(name)
+        if histogram is None:
+            histogram = self.histograms[name] = [0] * (len(HISTOGRAM_BUCKETS) + 1)
+            self.counts[name] = 0
+            self.total_durations[name] = 0.0
+
+        self.counts[name] += 1
+        self.total_durations[name] += duration
+        histogram[bisect_left(HISTOGRAM_BUCKETS, duration)] += 1
+
+    def reset(self) -> None:
+        self.counts.clear()
+        self.total_durations.clear()
+        self.histograms.clear()
+
+    def snapshot(self) -> Dict[str, Dict[str, Any]]:
+        return {
+            name: {
+                "count": count,
+                "total_seconds": self.total_durations[name],
+                "mean_seconds": self.total_durations[name] / count,
+                "histogram": list(self.histograms[name]),
+            }
+            for name, count in self.counts.items()
+        }
+
+
+class CallbackSink:
+    def __init__(self, callback: Callable[[str, float], None]) -> None:
+        self.callback = callback
+
+    def record(self, name: str, duration: float) -> None:
+        self.callback(name, duration)
+
+
+def enable() -> None:
+    """Only affects the modules imported afterwards."""
+    global _enabled
+    _enabled = True
+
+
+def is_enabled() -> bool:
+    return _enabled
+
+
+def set_sink(sink: Optional[ISink]) -> None:
+    global _sink
+    _sink = sink
+
+
+def get_sink() -> Optional[ISink]:
+    return _sink
+
+
+def instrumented(name: str) -> Callable[[TFunction], TFunction]:
+    def decorator(function: TFunction) -> TFunction:
+        if not _enabled:
+            return function
+
+        @functools.wraps(function)
+        def wrapper(*args: Any, **kwargs: Any) -> Any:
+            sink = _sink
+            if sink is None:
+                return function(*args, **kwargs)
+
+            start = perf_counter()
+            try:
+                return function(*args, **kwargs)
+            finally:
+                sink.record(name, perf_counter() - start)
+
+        return cast(TFunction, wrapper)
+
+    return decorator
@@ -0,0 +1,72 @@
+import json
+import os
+import subprocess
+import sys
+from pathlib import Path
+from typing import List, Tuple
+
+import pytest
+
+from multiversx_sdk_core import instrumentation
+from multiversx_sdk_core.instrumentation import (CallbackSink,
+                                                 InstrumentationStats,
+                                                 instrumented)
+
+
+def foo(value: int) -> int:
+    return value + 1
+
+
+def test_disabled_instrumentation_returns_function_unchanged(monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.setattr(instrumentation, "_enabled", False)
+    assert instrumented("foo")(foo) is foo
+
+
+def test_enabled_instrumentation(monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.setattr(instrumentation, "_enabled", True)
+    instrumented_foo = instrumented("foo")(foo)
+    assert instrumented_foo is not foo
+
+    # without a sink, the calls are passed through
+    assert instrumented_foo(1) == 2
+
+    stats = InstrumentationStats()
+    monkeypatch.setattr(instrumentation, "_sink", stats)
+    instrumented_foo(1)
+    instrumented_foo(2)
+
+    snapshot = stats.snapshot()
+    assert snapshot["foo"]["count"] == 2
+    assert sum(snapshot["foo"]["histogram"]) == 2
+
+    records: List[Tuple[str, float]] = []
+    monkeypatch.setattr(instrumentation, "_sink", CallbackSink(lambda name, duration: records.append((name, duration))))
+    instrumented_foo(3)
+    assert [name for name, _ in records] == ["foo"]
+
+
+def test_instrumentation_of_hot_paths():
+    script = """
+import json
+from multiversx_sdk_core import instrumentation
+from multiversx_sdk_core.address import Address
+from multiversx_sdk_core.transaction import Transaction, TransactionComputer
+
+stats = instrumentation.InstrumentationStats()
+instrumentation.set_sink(stats)
+
+alice = Address.new_from_bech32("erd1qyu5wthldzr8wx5c9ucg8kjagg0jfs53s8nr3zpz3hypefsdd8ssycr6th")
+transaction = Transaction(sender=alice.to_bech32(), receiver=alice.to_bech32(), gas_limit=50000, chain_id="D")
+TransactionComputer().compute_transaction_hash(transaction)
+
+print(json.dumps({name: entry["count"] for name, entry in stats.snapshot().items()}))
+"""
+    root = Path(__file__).parent.parent
+    environment = dict(os.environ, **{instrumentation.ENVIRONMENT_VARIABLE: "1"})
+    output = subprocess.check_output([sys.executable, "-W", "ignore", "-c", script], cwd=root, env=environment)
+    counts = json.loads(output)
+
+    assert counts["address.new_from_bech32"] == 3
+    assert counts["address.to_bech32"] == 2
+    assert counts["transaction_computer.compute_transaction_hash"] == 1
+    assert counts["proto_serializer.serialize_transaction"] == 1
@@ -1,5 +1,4 @@
-from Cryptodome.Hash import keccak
-
+from multiversx_sdk_core.hashing import keccak256
 from multiversx_sdk_core.interfaces import IMessage
 
 
@@ -23,6 +22,6 @@ class MessageComputer:
         PREFIX = bytes.fromhex("17456c726f6e64205369676e6564204d6573736167653a0a")
         size = str(len(message.data)).encode()
         content = PREFIX + size + message.data
-        content_hash = keccak.new(digest_bits=256).update(content).digest()
+        content_hash = keccak256(content)
 
         return content_hash
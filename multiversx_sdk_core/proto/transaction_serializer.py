@@ -3,6 +3,7 @@ from typing import Protocol
 import multiversx_sdk_core.proto.transaction_pb2 as ProtoTransaction
 from multiversx_sdk_core.address import Address
 from multiversx_sdk_core.codec import encode_unsigned_number
+from multiversx_sdk_core.instrumentation import instrumented
 
 
 class ITransaction(Protocol):
@@ -27,6 +28,7 @@ class ProtoSerializer:
     def __init__(self) -> None:
         pass
 
+    @instrumented("proto_serializer.serialize_transaction")
     def serialize_transaction(self, transaction: ITransaction) -> bytes:
         receiver_pubkey = Address.new_from_bech32(transaction.receiver).get_public_key()
         sender_pubkey = Address.new_from_bech32(transaction.sender).get_public_key()
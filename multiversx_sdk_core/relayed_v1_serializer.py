@@ -0,0 +1,93 @@
+"""
+Serializes inner transactions for relayed v1 ("relayedTx@<hex of the JSON>").
+
+The JSON is written directly, from the public keys, into a buffer (no intermediate dict or `json.dumps()`), then hex-encoded in one pass.
+The output is byte-identical to `json.dumps(..., separators=(",", ":"))` over the legacy dict: the integers are plain numbers,
+the byte fields are base64-encoded (thus, never need escaping) and the optional fields are written only if set.
+"""
+
+import binascii
+from base64 import b64encode
+from functools import lru_cache
+from typing import Protocol
+
+from multiversx_sdk_core.address import Address
+
+RELAYED_V1_DATA_PREFIX = b"relayedTx@"
+
+
+class IInnerTransaction(Protocol):
+    sender: str
+    receiver: str
+    gas_limit: int
+    chain_id: str
+    nonce: int
+    value: int
+    sender_username: str
+    receiver_username: str
+    gas_price: int
+    data: bytes
+    version: int
+    options: int
+    guardian: str
+    signature: bytes
+    guardian_signature: bytes
+
+
+def serialize_inner_transaction(transaction: IInnerTransaction) -> bytes:
+    buffer = bytearray(b'{"nonce":')
+    buffer += b"%d" % transaction.nonce
+    buffer += b',"sender":"'
+    buffer += b64encode(_get_public_key(transaction.sender))
+    buffer += b'","receiver":"'
+    buffer += b64encode(_get_public_key(transaction.receiver))
+    buffer += b'","value":'
+    buffer += b"%d" % int(transaction.value)
+    buffer += b',"gasPrice":'
+    buffer += b"%d" % transaction.gas_price
+    buffer += b',"gasLimit":'
+    buffer += b"%d" % transaction.gas_limit
+    buffer += b',"data":"'
+    buffer += b64encode(transaction.data)
+    buffer += b'","signature":"'
+    buffer += b64encode(transaction.signature)
+    buffer += b'","chainID":"'
+    buffer += b64encode(transaction.chain_id.encode())
+    buffer += b'","version":'
+    buffer += b"%d" % transaction.version
+
+    if transaction.options:
+        buffer += b',"options":'
+        buffer += b"%d" % transaction.options
+
+    if transaction.guardian:
+        buffer += b',"guardian":"'
+        buffer += b64encode(_get_public_key(transaction.guardian))
+        buffer += b'"'
+
+    if transaction.guardian_signature:
+        buffer += b',"guardianSignature":"'
+        buffer += b64encode(transaction.guardian_signature)
+        buffer += b'"'
+
+    if transaction.sender_username:
+        buffer += b',"sndUserName":"'
+        buffer += b64encode(transaction.sender_username.encode())
+        buffer += b'"'
+
+    if transaction.receiver_username:
+        buffer += b',"rcvUserName":"'
+        buffer += b64encode(transaction.receiver_username.encode())
+        buffer += b'"'
+
+    buffer += b"}"
+    return bytes(buffer)
+
+
+def compute_relayed_v1_data(transaction: IInnerTransaction) -> bytes:
+    return RELAYED_V1_DATA_PREFIX + binascii.hexlify(serialize_inner_transaction(transaction))
+
+
+@lru_cache(maxsize=4096)
+def _get_public_key(bech32_address: str) -> bytes:
+    return Address.new_from_bech32(bech32_address).get_public_key()
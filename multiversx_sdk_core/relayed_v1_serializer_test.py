@@ -0,0 +1,60 @@
+import base64
+import json
+from typing import Any, Dict
+
+from multiversx_sdk_core.address import Address
+from multiversx_sdk_core.relayed_v1_serializer import (
+    compute_relayed_v1_data, serialize_inner_transaction)
+from multiversx_sdk_core.transaction import Transaction
+
+
+def serialize_with_json_dumps(transaction: Transaction) -> bytes:
+    tx: Dict[str, Any] = {
+        "nonce": transaction.nonce,
+        "sender": base64.b64encode(Address.new_from_bech32(transaction.sender).get_public_key()).decode(),
+        "receiver": base64.b64encode(Address.new_from_bech32(transaction.receiver).get_public_key()).decode(),
+        "value": transaction.value,
+        "gasPrice": transaction.gas_price,
+        "gasLimit": transaction.gas_limit,
+        "data": base64.b64encode(transaction.data).decode(),
+        "signature": base64.b64encode(transaction.signature).decode(),
+        "chainID": base64.b64encode(transaction.chain_id.encode()).decode(),
+        "version": transaction.version,
+    }
+
+    if transaction.options:
+        tx["options"] = transaction.options
+    if transaction.guardian:
+        tx["guardian"] = base64.b64encode(Address.new_from_bech32(transaction.guardian).get_public_key()).decode()
+    if transaction.guardian_signature:
+        tx["guardianSignature"] = base64.b64encode(transaction.guardian_signature).decode()
+    if transaction.sender_username:
+        tx["sndUserName"] = base64.b64encode(transaction.sender_username.encode()).decode()
+    if transaction.receiver_username:
+        tx["rcvUserName"] = base64.b64encode(transaction.receiver_username.encode()).decode()
+
+    return json.dumps(tx, separators=(",", ":")).encode()
+
+
+def test_serialize_inner_transaction_matches_json_dumps():
+    transaction = Transaction(
+        sender="erd1qyu5wthldzr8wx5c9ucg8kjagg0jfs53s8nr3zpz3hypefsdd8ssycr6th",
+        receiver="erd1spyavw0956vq68xj8y4tenjpq2wd5a9p2c6j8gsz7ztyrnpxrruqzu66jx",
+        gas_limit=50000,
+        chain_id="D",
+        nonce=7,
+        value=10**30,
+        data=b"hello\x00\xff",
+        signature=b"\x01" * 64
+    )
+
+    assert serialize_inner_transaction(transaction) == serialize_with_json_dumps(transaction)
+
+    transaction.options = 2
+    transaction.guardian = "erd1k2s324ww2g0yj38qn2ch2jwctdy8mnfxep94q9arncc6xecg3xaq6mjse8"
+    transaction.guardian_signature = b"\x02" * 64
+    transaction.sender_username = "alice"
+    transaction.receiver_username = "bob"
+
+    assert serialize_inner_transaction(transaction) == serialize_with_json_dumps(transaction)
+    assert compute_relayed_v1_data(transaction) == b"relayedTx@" + serialize_with_json_dumps(transaction).hex().encode()
@@ -1,8 +1,10 @@
-from typing import Any, List, Protocol, Sequence, runtime_checkable
+from typing import Any, List, Optional, Protocol, Sequence, runtime_checkable
 
 from multiversx_sdk_core.codec import encode_unsigned_number, encode_signed_number
 from multiversx_sdk_core.constants import ARGS_SEPARATOR
 from multiversx_sdk_core.errors import ErrCannotSerializeArgument
+from multiversx_sdk_core.instrumentation import instrumented
+from multiversx_sdk_core.typed_codec import default_codec
 
 
 @runtime_checkable
@@ -10,17 +12,25 @@ class IArgument(Protocol):
     def serialize(self) -> bytes: ...
 
 
-def args_to_string(args: Sequence[Any]) -> str:
-    strings = args_to_strings(args)
+def args_to_string(args: Sequence[Any], types: Optional[Sequence[str]] = None) -> str:
+    strings = args_to_strings(args, types)
     return ARGS_SEPARATOR.join(strings)
 
 
-def args_to_strings(args: Sequence[Any]) -> List[str]:
-    buffers = args_to_buffers(args)
+@instrumented("serializer.args_to_strings")
+def args_to_strings(args: Sequence[Any], types: Optional[Sequence[str]] = None) -> List[str]:
+    buffers = args_to_buffers(args, types)
     return [buffer.hex() for buffer in buffers]
 
 
-def args_to_buffers(args: Sequence[Any]) -> List[bytes]:
+@instrumented("serializer.args_to_buffers")
+def args_to_buffers(args: Sequence[Any], types: Optional[Sequence[str]] = None) -> List[bytes]:
+    """
+    If `types` (type signatures such as "u32", "List<BigUint>" or "Option<Address>") are provided,
+    the arguments are encoded using the (cached) typed encoders.
+    """
+    if types is not None:
+        return default_codec.encode_args(types, args)
     return [arg_to_buffer(arg) for arg in args]
 
 
@@ -1,11 +1,20 @@
+import re
 from decimal import ROUND_DOWN, Context, Decimal, localcontext
-from typing import Union
+from functools import lru_cache
+from typing import Iterable, List, Optional, Union
 
 from multiversx_sdk_core import typecheck
 from multiversx_sdk_core.constants import (EGLD_NUM_DECIMALS,
                                            EGLD_TOKEN_IDENTIFIER)
 from multiversx_sdk_core.interfaces import INonce, ITokenIdentifier
 
+# Precision of the decimal context used for the conversions. Within it, the integer-arithmetic fast paths give the same results.
+DECIMAL_PRECISION = 128
+_MAX_FAST_PATH_INTEGER = 10 ** DECIMAL_PRECISION
+_PLAIN_DECIMAL_STRING = re.compile(r"([+-]?)([0-9]+)(?:\.([0-9]*))?", re.ASCII)
+
+Amount = Union[Decimal, str, int]
+
 
 class TokenPayment:
     def __init__(self, token_identifier: ITokenIdentifier, token_nonce: INonce, amount_as_integer: int, num_decimals: int) -> None:
@@ -24,7 +33,6 @@ class TokenPayment:
 
     @classmethod
     def egld_from_amount(cls, amount: Union[Decimal, str, int]) -> 'TokenPayment':
-        amount = Decimal(amount)
         amount_as_integer = cls._amount_to_integer(amount, EGLD_NUM_DECIMALS)
         return cls.egld_from_integer(amount_as_integer)
 
@@ -34,7 +42,6 @@ class TokenPayment:
 
     @classmethod
     def fungible_from_amount(cls, token_identifier: ITokenIdentifier, amount: Union[Decimal, str, int], num_decimals: int) -> 'TokenPayment':
-        amount = Decimal(amount)
         amount_as_integer = cls._amount_to_integer(amount, num_decimals)
         return cls.fungible_from_integer(token_identifier, amount_as_integer, num_decimals)
 
@@ -52,7 +59,6 @@ class TokenPayment:
 
     @classmethod
     def meta_esdt_from_amount(cls, token_identifier: ITokenIdentifier, nonce: int, amount: Union[Decimal, str, int], num_decimals: int) -> 'TokenPayment':
-        amount = Decimal(amount)
         amount_as_integer = cls._amount_to_integer(amount, num_decimals)
         return cls.meta_esdt_from_integer(token_identifier, nonce, amount_as_integer, num_decimals)
 
@@ -61,9 +67,17 @@ class TokenPayment:
         return cls(token_identifier, nonce, amount_as_integer, num_decimals)
 
     def to_amount_string(self, normalize: bool = False) -> str:
+        return integer_to_amount_string(self.amount_as_integer, self.num_decimals, normalize)
+
+    @classmethod
+    def _amount_to_integer(cls, amount: Amount, num_decimals: int) -> int:
+        return amount_to_integer(amount, num_decimals)
+
+    @classmethod
+    def _integer_to_amount_string_with_decimal_context(cls, amount_as_integer: int, num_decimals: int, normalize: bool) -> str:
         with localcontext() as ctx:
-            self._adjust_decimal_context(ctx)
-            amount = Decimal(self.amount_as_integer).scaleb(-self.num_decimals)
+            cls._adjust_decimal_context(ctx)
+            amount = Decimal(amount_as_integer).scaleb(-num_decimals)
 
             if normalize:
                 amount = amount.normalize()
@@ -71,7 +85,9 @@ class TokenPayment:
             return f"{amount:f}"
 
     @classmethod
-    def _amount_to_integer(cls, amount: Decimal, num_decimals: int) -> int:
+    def _amount_to_integer_with_decimal_context(cls, amount: Amount, num_decimals: int) -> int:
+        amount = Decimal(amount)
+
         with localcontext() as ctx:
             cls._adjust_decimal_context(ctx)
             amount_as_integer = int(amount.scaleb(num_decimals))
@@ -79,7 +95,7 @@ class TokenPayment:
 
     @ classmethod
     def _adjust_decimal_context(cls, context: Context):
-        context.prec = 128
+        context.prec = DECIMAL_PRECISION
         context.rounding = ROUND_DOWN
 
     def __str__(self) -> str:
@@ -87,3 +103,93 @@ class TokenPayment:
 
     def __repr__(self) -> str:
         return str(self.amount_as_integer)
+
+
+def amount_to_integer(amount: Amount, num_decimals: int) -> int:
+    """Converts an amount to atomic units, truncating the extra fraction digits (toward zero)."""
+    amount_as_integer = _amount_to_integer_fast(amount, num_decimals)
+    if amount_as_integer is None:
+        amount_as_integer = TokenPayment._amount_to_integer_with_decimal_context(amount, num_decimals)
+    return amount_as_integer
+
+
+def amounts_to_integers(amounts: Iterable[Amount], num_decimals: int) -> List[int]:
+    return [amount_to_integer(amount, num_decimals) for amount in amounts]
+
+
+def integer_to_amount_string(amount_as_integer: int, num_decimals: int, normalize: bool = False) -> str:
+    amount_string = _integer_to_amount_string_fast(amount_as_integer, num_decimals, normalize)
+    if amount_string is None:
+        amount_string = TokenPayment._integer_to_amount_string_with_decimal_context(amount_as_integer, num_decimals, normalize)
+    return amount_string
+
+
+def integers_to_amount_strings(amounts_as_integers: Iterable[int], num_decimals: int, normalize: bool = False) -> List[str]:
+    return [integer_to_amount_string(amount_as_integer, num_decimals, normalize) for amount_as_integer in amounts_as_integers]
+
+
+@lru_cache(maxsize=None)
+def _get_scale_factor(num_decimals: int) -> int:
+    return 10 ** num_decimals
+
+
+def _amount_to_integer_fast(amount: Amount, num_decimals: int) -> Optional[int]:
+    """Returns `None` if the amount isn't eligible for the fast path (e.g. it has more significant digits than the decimal precision)."""
+    if not 0 <= num_decimals <= DECIMAL_PRECISION:
+        return None
+
+    if isinstance(amount, int):
+        if -_MAX_FAST_PATH_INTEGER < amount < _MAX_FAST_PATH_INTEGER:
+            return amount * _get_scale_factor(num_decimals)
+        return None
+
+    if isinstance(amount, str):
+        match = _PLAIN_DECIMAL_STRING.fullmatch(amount)
+        if match is None:
+            return None
+
+        sign, integer_digits, fraction_digits = match.groups()
+        fraction_digits = fraction_digits or ""
+        if len(integer_digits) + len(fraction_digits) > DECIMAL_PRECISION:
+            return None
+
+        fraction_digits = fraction_digits[:num_decimals].ljust(num_decimals, "0")
+        magnitude = int(integer_digits + fraction_digits)
+        return -magnitude if sign == "-" else magnitude
+
+    if isinstance(amount, Decimal):
+        sign, digits, exponent = amount.as_tuple()
+        if not isinstance(exponent, int) or len(digits) > DECIMAL_PRECISION or not -DECIMAL_PRECISION <= exponent <= DECIMAL_PRECISION:
+            return None
+
+        magnitude = int("".join(map(str, digits)))
+        shift = exponent + num_decimals
+        if shift >= 0:
+            magnitude *= _get_scale_factor(shift)
+        else:
+            magnitude //= _get_scale_factor(-shift)
+
+        return -magnitude if sign else magnitude
+
+    return None
+
+
+def _integer_to_amount_string_fast(amount_as_integer: int, num_decimals: int, normalize: bool) -> Optional[str]:
+    if not 0 <= num_decimals <= DECIMAL_PRECISION or not -_MAX_FAST_PATH_INTEGER < amount_as_integer < _MAX_FAST_PATH_INTEGER:
+        return None
+
+    sign = "-" if amount_as_integer < 0 else ""
+    digits = str(abs(amount_as_integer))
+    if num_decimals == 0:
+        return sign + digits
+
+    digits = digits.rjust(num_decimals + 1, "0")
+    integer_part = digits[:-num_decimals]
+    fraction_part = digits[-num_decimals:]
+
+    if normalize:
+        fraction_part = fraction_part.rstrip("0")
+        if not fraction_part:
+            return sign + integer_part
+
+    return sign + integer_part + "." + fraction_part
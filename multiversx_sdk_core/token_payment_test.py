@@ -1,10 +1,13 @@
 
 from decimal import Decimal
-from typing import Any
+from typing import Any, List
 
 import pytest
 
-from multiversx_sdk_core.token_payment import TokenPayment
+from multiversx_sdk_core.token_payment import (TokenPayment, amount_to_integer,
+                                               amounts_to_integers,
+                                               integer_to_amount_string,
+                                               integers_to_amount_strings)
 
 
 def test_with_egld():
@@ -80,3 +83,32 @@ def test_misuse_raises_error():
     with pytest.raises(ValueError, match="amount_as_integer must be an integer"):
         amount: Any = "1"
         TokenPayment.fungible_from_integer("USDC-c76f1f", amount, 6)
+
+
+def test_amount_to_integer_fast_path_matches_decimal_context():
+    amounts: List[Any] = [
+        "0", "1", "-1", "+1.5", "0.123456789123456789777", "-0.123456789123456789777", "5.", "007.50",
+        Decimal("1E+3"), Decimal("-0"), Decimal("12.3456789"), Decimal("-12.3456789"), 10, -10,
+        # not eligible for the fast path
+        "1e3", ".5", " 1", "1_000", "1" * 130, 10 ** 130, Decimal("1E-200"),
+    ]
+
+    for num_decimals in [0, 6, 18]:
+        for amount in amounts:
+            expected = TokenPayment._amount_to_integer_with_decimal_context(amount, num_decimals)
+            assert amount_to_integer(amount, num_decimals) == expected
+
+        assert amounts_to_integers(amounts, num_decimals) == [amount_to_integer(amount, num_decimals) for amount in amounts]
+
+
+def test_integer_to_amount_string_fast_path_matches_decimal_context():
+    amounts_as_integers = [0, 1, -1, 100, -100, 1000000, 123456789123456789, -123456789123456789, 10 ** 130]
+
+    for num_decimals in [0, 2, 6, 18]:
+        for normalize in [False, True]:
+            for amount_as_integer in amounts_as_integers:
+                expected = TokenPayment._integer_to_amount_string_with_decimal_context(amount_as_integer, num_decimals, normalize)
+                assert integer_to_amount_string(amount_as_integer, num_decimals, normalize) == expected
+
+    assert integers_to_amount_strings([1, 1500000], 6) == ["0.000001", "1.500000"]
+    assert integers_to_amount_strings([1, 1500000], 6, normalize=True) == ["0.000001", "1.5"]
@@ -1,11 +1,28 @@
-from typing import List
+import heapq
+import sys
+from array import array
+from functools import lru_cache
+from typing import (TYPE_CHECKING, Callable, Dict, Iterable, List, Optional,
+                    Sequence, Tuple, TypeVar)
 
 from multiversx_sdk_core.codec import (decode_unsigned_number,
                                        encode_unsigned_number)
 from multiversx_sdk_core.constants import TOKEN_RANDOM_SEQUENCE_LENGTH
-from multiversx_sdk_core.errors import (BadUsageError,
+from multiversx_sdk_core.errors import (BadUsageError, ErrListsLengthMismatch,
                                         InvalidTokenIdentifierError)
-from multiversx_sdk_core.interfaces import IToken, ITokenIdentifierParts
+from multiversx_sdk_core.interfaces import (IAddress, IToken,
+                                            ITokenIdentifierParts,
+                                            ITokenTransfer)
+
+if TYPE_CHECKING:
+    from functools import _lru_cache_wrapper
+
+DEFAULT_TOKEN_COMPUTER_CACHE_SIZE = 4096
+MAX_TOKEN_NONCE = 2**64 - 1
+
+T = TypeVar("T")
+# (result, None) if the identifier is valid, (None, error message) otherwise
+_Outcome = Tuple[Optional[T], Optional[str]]
 
 
 class Token:
@@ -28,14 +45,178 @@ class TokenIdentifierParts:
         self.nonce = nonce
 
 
+class TokenIdentifierPartsBatch:
+    """
+    Columns of parsed extended identifiers. For a row that could not be parsed, `errors` holds the error message
+    (while the ticker and the random sequence are empty, and the nonce is 0); for the other rows, it holds `None`.
+    """
+
+    def __init__(self, tickers: List[str], random_sequences: List[str], nonces: "array[int]", errors: List[Optional[str]]) -> None:
+        self.tickers = tickers
+        self.random_sequences = random_sequences
+        self.nonces = nonces
+        self.errors = errors
+
+    def __len__(self) -> int:
+        return len(self.tickers)
+
+    def has_errors(self) -> bool:
+        return any(error is not None for error in self.errors)
+
+
+class ExtendedIdentifiersBatch:
+    """For a row that could not be formatted, `errors` holds the error message (while the identifier is empty); for the other rows, it holds `None`."""
+
+    def __init__(self, identifiers: List[str], errors: List[Optional[str]]) -> None:
+        self.identifiers = identifiers
+        self.errors = errors
+
+    def __len__(self) -> int:
+        return len(self.identifiers)
+
+    def has_errors(self) -> bool:
+        return any(error is not None for error in self.errors)
+
+
 class TokenComputer:
-    def __init__(self) -> None:
-        pass
+    def __init__(self, cache_size: int = DEFAULT_TOKEN_COMPUTER_CACHE_SIZE) -> None:
+        """
+        The outcomes of parsing the (extended) identifiers are memoized, in bounded LRU caches of `cache_size` entries each
+        (0 disables the caching). For invalid identifiers, the error messages are cached (the errors are raised anew on each call).
+        """
+        self._nonce_cache = _memoize_outcome(self._extract_nonce_from_extended_identifier, cache_size)
+        self._identifier_cache = _memoize_outcome(self._extract_identifier_from_extended_identifier, cache_size)
+        self._ticker_cache = _memoize_outcome(self._extract_ticker_from_identifier, cache_size)
+        self._parts_cache = _memoize_outcome(self._parse_extended_identifier_parts, cache_size)
 
     def is_fungible(self, token: IToken) -> bool:
         return token.nonce == 0
 
     def extract_nonce_from_extended_identifier(self, identifier: str) -> int:
+        nonce, error = self._nonce_cache(identifier)
+        if error is not None:
+            raise InvalidTokenIdentifierError(error)
+        return nonce  # type: ignore
+
+    def extract_identifier_from_extended_identifier(self, identifier: str) -> str:
+        result, error = self._identifier_cache(identifier)
+        if error is not None:
+            raise InvalidTokenIdentifierError(error)
+        return result  # type: ignore
+
+    def extract_ticker_from_identifier(self, identifier: str) -> str:
+        ticker, error = self._ticker_cache(identifier)
+        if error is not None:
+            raise InvalidTokenIdentifierError(error)
+        return ticker  # type: ignore
+
+    def parse_extended_identifier_parts(self, identifier: str) -> TokenIdentifierParts:
+        parts, error = self._parts_cache(identifier)
+        if error is not None:
+            raise InvalidTokenIdentifierError(error)
+
+        ticker, random_sequence, nonce = parts  # type: ignore
+        return TokenIdentifierParts(ticker, random_sequence, nonce)
+
+    def parse_extended_identifiers_parts(self, identifiers: Sequence[str]) -> TokenIdentifierPartsBatch:
+        """Batch variant of `parse_extended_identifier_parts()`: invalid identifiers are reported in the `errors` column, instead of raising."""
+        tickers: List[str] = []
+        random_sequences: List[str] = []
+        nonces: "array[int]" = array("Q")
+        errors: List[Optional[str]] = []
+        parts_cache = self._parts_cache
+
+        for identifier in identifiers:
+            try:
+                parts, error = parts_cache(identifier)
+            except ValueError:
+                parts, error = None, "The nonce of the extended token identifier is not a valid hex string"
+
+            if parts is not None and parts[2] > MAX_TOKEN_NONCE:
+                parts, error = None, "The nonce of the extended token identifier does not fit in 64 bits"
+
+            if parts is None:
+                tickers.append("")
+                random_sequences.append("")
+                nonces.append(0)
+                errors.append(error)
+            else:
+                tickers.append(parts[0])
+                random_sequences.append(parts[1])
+                nonces.append(parts[2])
+                errors.append(None)
+
+        return TokenIdentifierPartsBatch(tickers, random_sequences, nonces, errors)
+
+    def compute_extended_identifiers_from_identifiers_and_nonces(self, identifiers: Sequence[str], nonces: Sequence[int]) -> ExtendedIdentifiersBatch:
+        """Batch variant of `compute_extended_identifier_from_identifier_and_nonce()`: invalid rows are reported in the `errors` column, instead of raising."""
+        if len(identifiers) != len(nonces):
+            raise ErrListsLengthMismatch("The number of identifiers should match the number of nonces")
+
+        extended_identifiers: List[str] = []
+        errors: List[Optional[str]] = []
+        # the identifiers are validated the same way (and in the same order) as the tickers are extracted
+        ticker_cache = self._ticker_cache
+
+        for identifier, nonce in zip(identifiers, nonces):
+            try:
+                _, error = ticker_cache(identifier)
+            except IndexError:
+                error = "Invalid token identifier provided"
+
+            if error is None and nonce < 0:
+                error = "The token nonce can not be less than 0"
+            elif error is None and nonce > MAX_TOKEN_NONCE:
+                error = "The token nonce does not fit in 64 bits"
+
+            if error is not None:
+                extended_identifiers.append("")
+                errors.append(error)
+            elif nonce == 0:
+                extended_identifiers.append(identifier)
+                errors.append(None)
+            else:
+                extended_identifiers.append(identifier + "-" + encode_unsigned_number(nonce).hex())
+                errors.append(None)
+
+        return ExtendedIdentifiersBatch(extended_identifiers, errors)
+
+    def get_cache_stats(self) -> Dict[str, Dict[str, Optional[int]]]:
+        caches = {
+            "extract_nonce_from_extended_identifier": self._nonce_cache,
+            "extract_identifier_from_extended_identifier": self._identifier_cache,
+            "extract_ticker_from_identifier": self._ticker_cache,
+            "parse_extended_identifier_parts": self._parts_cache,
+        }
+
+        return {name: cache.cache_info()._asdict() for name, cache in caches.items()}
+
+    def clear_caches(self) -> None:
+        self._nonce_cache.cache_clear()
+        self._identifier_cache.cache_clear()
+        self._ticker_cache.cache_clear()
+        self._parts_cache.cache_clear()
+
+    def compute_extended_identifier_from_identifier_and_nonce(self, identifier: str, nonce: int) -> str:
+        identifier_parts = identifier.split("-")
+
+        self._check_length_of_random_sequence(identifier_parts[1])
+        self._ensure_token_ticker_validity(identifier_parts[0])
+
+        if nonce < 0:
+            raise BadUsageError("The token nonce can not be less than 0")
+
+        if nonce == 0:
+            return identifier
+
+        nonce_hex = encode_unsigned_number(nonce).hex()
+        return identifier + "-" + nonce_hex
+
+    def compute_extended_identifier_from_parts(self, parts: ITokenIdentifierParts) -> str:
+        identifier = parts.ticker + "-" + parts.random_sequence
+        return self.compute_extended_identifier_from_identifier_and_nonce(identifier, parts.nonce)
+
+    def _extract_nonce_from_extended_identifier(self, identifier: str) -> int:
         parts = identifier.split("-")
 
         self._check_if_extended_identifier_was_provided(parts)
@@ -48,23 +229,23 @@ class TokenComputer:
         hex_nonce = bytes.fromhex(parts[2])
         return decode_unsigned_number(hex_nonce)
 
-    def extract_identifier_from_extended_identifier(self, identifier: str) -> str:
+    def _extract_identifier_from_extended_identifier(self, identifier: str) -> str:
         parts = identifier.split("-")
 
         self._check_if_extended_identifier_was_provided(parts)
         self._ensure_token_ticker_validity(parts[0])
         self._check_length_of_random_sequence(parts[1])
 
-        return parts[0] + "-" + parts[1]
+        return sys.intern(parts[0] + "-" + parts[1])
 
-    def extract_ticker_from_identifier(self, identifier: str) -> str:
+    def _extract_ticker_from_identifier(self, identifier: str) -> str:
         parts = identifier.split("-")
 
         self._check_length_of_random_sequence(parts[1])
         self._ensure_token_ticker_validity(parts[0])
-        return parts[0]
+        return sys.intern(parts[0])
 
-    def parse_extended_identifier_parts(self, identifier: str) -> TokenIdentifierParts:
+    def _parse_extended_identifier_parts(self, identifier: str) -> Tuple[str, str, int]:
         parts = identifier.split("-")
 
         self._check_if_extended_identifier_was_provided(parts)
@@ -72,26 +253,7 @@ class TokenComputer:
         self._ensure_token_ticker_validity(parts[0])
 
         nonce = decode_unsigned_number(bytes.fromhex(parts[2])) if len(parts) == 3 else 0
-        return TokenIdentifierParts(parts[0], parts[1], nonce)
-
-    def compute_extended_identifier_from_identifier_and_nonce(self, identifier: str, nonce: int) -> str:
-        identifier_parts = identifier.split("-")
-
-        self._check_length_of_random_sequence(identifier_parts[1])
-        self._ensure_token_ticker_validity(identifier_parts[0])
-
-        if nonce < 0:
-            raise BadUsageError("The token nonce can not be less than 0")
-
-        if nonce == 0:
-            return identifier
-
-        nonce_hex = encode_unsigned_number(nonce).hex()
-        return identifier + "-" + nonce_hex
-
-    def compute_extended_identifier_from_parts(self, parts: ITokenIdentifierParts) -> str:
-        identifier = parts.ticker + "-" + parts.random_sequence
-        return self.compute_extended_identifier_from_identifier_and_nonce(identifier, parts.nonce)
+        return sys.intern(parts[0]), sys.intern(parts[1]), nonce
 
     def _check_if_extended_identifier_was_provided(self, token_parts: List[str]) -> None:
         # this is for the identifiers of fungible tokens
@@ -118,3 +280,130 @@ class TokenComputer:
     def _check_length_of_random_sequence(self, random_sequence: str) -> None:
         if len(random_sequence) != TOKEN_RANDOM_SEQUENCE_LENGTH:
             raise InvalidTokenIdentifierError("The identifier is not valid. The random sequence does not have the right length")
+
+
+class TokenLedger:
+    """
+    Columnar ledger of token amounts, per (token, address).
+
+    Each recorded row is held in three columns: `token_ids` (indexes into `tokens`, the distinct (identifier, nonce) pairs),
+    `address_indexes` (indexes into `addresses`, the distinct addresses) and `amounts` (arbitrary precision integers, negative for debits).
+    """
+
+    def __init__(self) -> None:
+        self.tokens: List[Tuple[str, int]] = []
+        self.addresses: List[IAddress] = []
+        self.token_ids: "array[int]" = array("I")
+        self.address_indexes: "array[int]" = array("I")
+        self.amounts: List[int] = []
+
+        self._token_id_by_key: Dict[Tuple[str, int], int] = {}
+        self._address_index_by_hex: Dict[str, int] = {}
+
+    def __len__(self) -> int:
+        return len(self.amounts)
+
+    def record(self, address: IAddress, token: IToken, amount: int) -> None:
+        self.token_ids.append(self._get_token_id(token.identifier, token.nonce))
+        self.address_indexes.append(self._get_address_index(address))
+        self.amounts.append(amount)
+
+    def record_transfer(self, sender: IAddress, receiver: IAddress, transfer: ITokenTransfer) -> None:
+        """Records a debit for the sender and a credit for the receiver."""
+        token_id = self._get_token_id(transfer.token.identifier, transfer.token.nonce)
+
+        self.token_ids.append(token_id)
+        self.address_indexes.append(self._get_address_index(sender))
+        self.amounts.append(-transfer.amount)
+
+        self.token_ids.append(token_id)
+        self.address_indexes.append(self._get_address_index(receiver))
+        self.amounts.append(transfer.amount)
+
+    def ingest(self, transfers: Iterable[Tuple[IAddress, IAddress, ITokenTransfer]]) -> int:
+        """Records a stream of (sender, receiver, transfer) rows. Returns the number of ingested transfers."""
+        count = 0
+
+        for sender, receiver, transfer in transfers:
+            self.record_transfer(sender, receiver, transfer)
+            count += 1
+
+        return count
+
+    def sum_by_token(self) -> Dict[Tuple[str, int], int]:
+        sums = [0] * len(self.tokens)
+
+        for token_id, amount in zip(self.token_ids, self.amounts):
+            sums[token_id] += amount
+
+        return dict(zip(self.tokens, sums))
+
+    def net_by_address(self, token: IToken) -> Dict[str, int]:
+        """Net amounts of the given token, by the bech32 representation of the addresses."""
+        nets = self._compute_nets_by_address_index(token)
+        return {self.addresses[index].to_bech32(): net for index, net in nets.items()}
+
+    def get_top_holders(self, token: IToken, k: int) -> List[Tuple[str, int]]:
+        """The `k` addresses with the largest net amounts of the given token, in descending order."""
+        nets = self._compute_nets_by_address_index(token)
+        top = heapq.nlargest(k, nets.items(), key=lambda item: item[1])
+        return [(self.addresses[index].to_bech32(), net) for index, net in top]
+
+    def compact(self) -> None:
+        """Merges the rows of the same (token, address) into a single one, dropping the ones that net to zero."""
+        nets: Dict[Tuple[int, int], int] = {}
+
+        for key, amount in zip(zip(self.token_ids, self.address_indexes), self.amounts):
+            nets[key] = nets.get(key, 0) + amount
+
+        self.token_ids = array("I")
+        self.address_indexes = array("I")
+        self.amounts = []
+
+        for (token_id, address_index), net in nets.items():
+            if net:
+                self.token_ids.append(token_id)
+                self.address_indexes.append(address_index)
+                self.amounts.append(net)
+
+    def _compute_nets_by_address_index(self, token: IToken) -> Dict[int, int]:
+        nets: Dict[int, int] = {}
+        token_id = self._token_id_by_key.get((token.identifier, token.nonce))
+        if token_id is None:
+            return nets
+
+        for current_token_id, address_index, amount in zip(self.token_ids, self.address_indexes, self.amounts):
+            if current_token_id == token_id:
+                nets[address_index] = nets.get(address_index, 0) + amount
+
+        return nets
+
+    def _get_token_id(self, identifier: str, nonce: int) -> int:
+        key = (identifier, nonce)
+        token_id = self._token_id_by_key.get(key)
+
+        if token_id is None:
+            token_id = self._token_id_by_key[key] = len(self.tokens)
+            self.tokens.append((sys.intern(identifier), nonce))
+
+        return token_id
+
+    def _get_address_index(self, address: IAddress) -> int:
+        address_hex = address.to_hex()
+        index = self._address_index_by_hex.get(address_hex)
+
+        if index is None:
+            index = self._address_index_by_hex[address_hex] = len(self.addresses)
+            self.addresses.append(address)
+
+        return index
+
+
+def _memoize_outcome(function: Callable[[str], T], cache_size: int) -> "_lru_cache_wrapper[_Outcome[T]]":
+    def get_outcome(identifier: str) -> _Outcome[T]:
+        try:
+            return function(identifier), None
+        except InvalidTokenIdentifierError as error:
+            return None, str(error)
+
+    return lru_cache(maxsize=cache_size)(get_outcome)
@@ -1,8 +1,11 @@
 import pytest
 
-from multiversx_sdk_core.errors import BadUsageError
+from multiversx_sdk_core.address import Address
+from multiversx_sdk_core.errors import (BadUsageError, ErrListsLengthMismatch,
+                                        InvalidTokenIdentifierError)
 from multiversx_sdk_core.tokens import (Token, TokenComputer,
-                                        TokenIdentifierParts)
+                                        TokenIdentifierParts, TokenLedger,
+                                        TokenTransfer)
 
 
 class TestTokenComputer:
@@ -86,3 +89,134 @@ class TestTokenComputer:
 
         assert fungible_identifier == "FNG-123456"
         assert nft_identifier == "NFT-987654-0a"
+
+
+class TestTokenComputerCaching:
+    def test_repeated_identifiers_are_parsed_once(self):
+        token_computer = TokenComputer()
+
+        for _ in range(3):
+            assert token_computer.extract_identifier_from_extended_identifier("TEST-123456-0a") == "TEST-123456"
+            assert token_computer.extract_nonce_from_extended_identifier("TEST-123456-0a") == 10
+
+        stats = token_computer.get_cache_stats()
+        assert stats["extract_identifier_from_extended_identifier"]["misses"] == 1
+        assert stats["extract_identifier_from_extended_identifier"]["hits"] == 2
+        assert stats["extract_nonce_from_extended_identifier"]["hits"] == 2
+
+        token_computer.clear_caches()
+        assert token_computer.get_cache_stats()["extract_nonce_from_extended_identifier"]["currsize"] == 0
+
+    def test_parsed_parts_are_not_shared(self):
+        token_computer = TokenComputer()
+
+        parts = token_computer.parse_extended_identifier_parts("NFT-987654-0a")
+        parts.nonce = 42
+
+        assert token_computer.parse_extended_identifier_parts("NFT-987654-0a").nonce == 10
+
+    def test_errors_are_raised_on_each_call(self):
+        token_computer = TokenComputer()
+
+        for _ in range(2):
+            with pytest.raises(InvalidTokenIdentifierError, match="The token ticker should be upper case"):
+                token_computer.extract_identifier_from_extended_identifier("test-123456")
+
+        # the nonce is extracted without checking the ticker
+        assert token_computer.extract_nonce_from_extended_identifier("test-123456-01") == 1
+
+        with pytest.raises(InvalidTokenIdentifierError, match="Invalid extended token identifier provided"):
+            token_computer.parse_extended_identifier_parts("TEST-123456-01-02")
+
+    def test_caching_disabled(self):
+        token_computer = TokenComputer(cache_size=0)
+
+        assert token_computer.extract_ticker_from_identifier("FNG-123456") == "FNG"
+        assert token_computer.extract_ticker_from_identifier("FNG-123456") == "FNG"
+        assert token_computer.get_cache_stats()["extract_ticker_from_identifier"]["hits"] == 0
+
+
+class TestTokenComputerBatch:
+    token_computer = TokenComputer()
+
+    def test_parse_extended_identifiers_parts(self):
+        batch = self.token_computer.parse_extended_identifiers_parts([
+            "FNG-123456",
+            "NFT-987654-0a",
+            "test-123456",
+            "NFT-987654-zz",
+            "NFT-987654-010000000000000000",
+        ])
+
+        assert len(batch) == 5
+        assert batch.tickers == ["FNG", "NFT", "", "", ""]
+        assert batch.random_sequences == ["123456", "987654", "", "", ""]
+        assert list(batch.nonces) == [0, 10, 0, 0, 0]
+        assert batch.errors[:2] == [None, None]
+        assert batch.errors[2] == "The token ticker should be upper case"
+        assert batch.errors[3] == "The nonce of the extended token identifier is not a valid hex string"
+        assert batch.errors[4] == "The nonce of the extended token identifier does not fit in 64 bits"
+        assert batch.has_errors()
+
+    def test_compute_extended_identifiers_from_identifiers_and_nonces(self):
+        batch = self.token_computer.compute_extended_identifiers_from_identifiers_and_nonces(
+            ["FNG-123456", "NFT-987654", "NFT-987654", "NFT", "NFT-98765"],
+            [0, 10, -1, 1, 1]
+        )
+
+        assert batch.identifiers == ["FNG-123456", "NFT-987654-0a", "", "", ""]
+        assert batch.errors == [
+            None,
+            None,
+            "The token nonce can not be less than 0",
+            "Invalid token identifier provided",
+            "The identifier is not valid. The random sequence does not have the right length"
+        ]
+
+    def test_compute_extended_identifiers_with_lists_length_mismatch(self):
+        with pytest.raises(ErrListsLengthMismatch):
+            self.token_computer.compute_extended_identifiers_from_identifiers_and_nonces(["FNG-123456"], [])
+
+
+class TestTokenLedger:
+    alice = Address.new_from_bech32("erd1qyu5wthldzr8wx5c9ucg8kjagg0jfs53s8nr3zpz3hypefsdd8ssycr6th")
+    bob = Address.new_from_bech32("erd1spyavw0956vq68xj8y4tenjpq2wd5a9p2c6j8gsz7ztyrnpxrruqzu66jx")
+    carol = Address.new_from_bech32("erd1k2s324ww2g0yj38qn2ch2jwctdy8mnfxep94q9arncc6xecg3xaq6mjse8")
+
+    def test_record_and_aggregate(self):
+        usdc = Token("USDC-c76f1f")
+        nft = Token("NFT-987654", 7)
+
+        ledger = TokenLedger()
+        ledger.record(self.alice, usdc, 1000)
+        ledger.record(self.bob, usdc, 500)
+        ingested = ledger.ingest([
+            (self.alice, self.bob, TokenTransfer(usdc, 300)),
+            (self.alice, self.carol, TokenTransfer(usdc, 100)),
+            (self.bob, self.carol, TokenTransfer(Token("NFT-987654", 7), 1)),
+        ])
+        ledger.record(self.bob, nft, 1)
+
+        assert ingested == 3
+        assert len(ledger) == 9
+        assert ledger.tokens == [("USDC-c76f1f", 0), ("NFT-987654", 7)]
+        assert len(ledger.addresses) == 3
+
+        assert ledger.sum_by_token() == {("USDC-c76f1f", 0): 1500, ("NFT-987654", 7): 1}
+        assert ledger.net_by_address(usdc) == {self.alice.to_bech32(): 600, self.bob.to_bech32(): 800, self.carol.to_bech32(): 100}
+        assert ledger.net_by_address(nft) == {self.bob.to_bech32(): 0, self.carol.to_bech32(): 1}
+        assert ledger.net_by_address(Token("UNKNOWN-123456")) == {}
+        assert ledger.get_top_holders(usdc, 2) == [(self.bob.to_bech32(), 800), (self.alice.to_bech32(), 600)]
+
+    def test_compact(self):
+        usdc = Token("USDC-c76f1f")
+
+        ledger = TokenLedger()
+        ledger.record(self.alice, usdc, 100)
+        ledger.record_transfer(self.alice, self.bob, TokenTransfer(usdc, 100))
+        ledger.record(self.carol, usdc, 5)
+        ledger.record(self.carol, usdc, 5)
+        ledger.compact()
+
+        assert len(ledger) == 2
+        assert ledger.net_by_address(usdc) == {self.bob.to_bech32(): 100, self.carol.to_bech32(): 10}
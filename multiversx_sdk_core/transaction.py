@@ -1,18 +1,16 @@
 import json
 from base64 import b64encode
 from collections import OrderedDict
-from hashlib import blake2b
 from typing import Any, Dict, Optional, Protocol
 
-from Cryptodome.Hash import keccak
-
-from multiversx_sdk_core.constants import (DEFAULT_HRP, DIGEST_SIZE,
+from multiversx_sdk_core.constants import (DEFAULT_HRP,
                                            TRANSACTION_MIN_GAS_PRICE,
                                            TRANSACTION_OPTIONS_DEFAULT,
                                            TRANSACTION_VERSION_DEFAULT)
 from multiversx_sdk_core.errors import NotEnoughGasError
+from multiversx_sdk_core.hashing import blake2b256, keccak256
+from multiversx_sdk_core.instrumentation import instrumented
 from multiversx_sdk_core.interfaces import INetworkConfig, ITransaction
-from multiversx_sdk_core.proto.transaction_serializer import ProtoSerializer
 
 
 class IAddressConverter(Protocol):
@@ -69,6 +67,7 @@ class TransactionComputer:
     def __init__(self) -> None:
         pass
 
+    @instrumented("transaction_computer.compute_transaction_fee")
     def compute_transaction_fee(self, transaction: ITransaction, network_config: INetworkConfig) -> int:
         move_balance_gas = network_config.min_gas_limit + len(transaction.data) * network_config.gas_per_data_byte
         if move_balance_gas > transaction.gas_limit:
@@ -84,19 +83,25 @@ class TransactionComputer:
 
         return int(fee_for_move + processing_fee)
 
+    @instrumented("transaction_computer.compute_bytes_for_signing")
     def compute_bytes_for_signing(self, transaction: ITransaction) -> bytes:
         dictionary = self._to_dictionary(transaction)
         serialized = self._dict_to_json(dictionary)
         return serialized
 
+    @instrumented("transaction_computer.compute_hash_for_signing")
     def compute_hash_for_signing(self, transaction: ITransaction) -> bytes:
-        return keccak.new(digest_bits=256).update(self.compute_bytes_for_signing(transaction)).digest()
+        return keccak256(self.compute_bytes_for_signing(transaction))
 
+    @instrumented("transaction_computer.compute_transaction_hash")
     def compute_transaction_hash(self, transaction: ITransaction) -> bytes:
+        # imported here (rather than at module level), since loading protobuf is expensive
+        from multiversx_sdk_core.proto.transaction_serializer import \
+            ProtoSerializer
+
         proto = ProtoSerializer()
         serialized_tx = proto.serialize_transaction(transaction)
-        tx_hash = blake2b(serialized_tx, digest_size=DIGEST_SIZE).hexdigest()
-        return bytes.fromhex(tx_hash)
+        return blake2b256(serialized_tx)
 
     def _to_dictionary(self, transaction: ITransaction) -> Dict[str, Any]:
         dictionary: Dict[str, Any] = OrderedDict()
@@ -131,6 +136,7 @@ class TransactionComputer:
 
         return dictionary
 
+    @instrumented("transaction_computer.dict_to_json")
     def _dict_to_json(self, dictionary: Dict[str, Any]) -> bytes:
         serialized = json.dumps(dictionary, separators=(',', ':')).encode("utf-8")
         return serialized
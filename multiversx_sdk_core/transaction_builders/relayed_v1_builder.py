@@ -1,12 +1,10 @@
-import base64
-import json
-from typing import Any, Dict, Optional
+from typing import Optional
 
-from multiversx_sdk_core.address import Address
 from multiversx_sdk_core.errors import ErrInvalidRelayerV1BuilderArguments
 from multiversx_sdk_core.interfaces import (IAddress, INetworkConfig, INonce,
                                             ITransactionOptions,
                                             ITransactionVersion)
+from multiversx_sdk_core.relayed_v1_serializer import compute_relayed_v1_data
 from multiversx_sdk_core.transaction import Transaction
 
 
@@ -65,8 +63,7 @@ class RelayedTransactionV1Builder:
         ):
             raise ErrInvalidRelayerV1BuilderArguments()
 
-        serialized_transaction = self._prepare_inner_transaction()
-        data = f"relayedTx@{serialized_transaction.encode().hex()}"
+        data = compute_relayed_v1_data(self.inner_transaction)
 
         gas_limit = (
             self.network_config.min_gas_limit
@@ -80,7 +77,7 @@ class RelayedTransactionV1Builder:
             value=0,
             nonce=self.relayer_nonce,
             gas_limit=gas_limit,
-            data=data.encode(),
+            data=data,
             version=self.relayed_transaction_version,
             options=self.relayed_transaction_options,
             guardian=self.relayed_transaction_guardian.to_bech32() if self.relayed_transaction_guardian else "",
@@ -90,43 +87,3 @@ class RelayedTransactionV1Builder:
             self.set_relayer_nonce(self.relayer_nonce)
 
         return relayed_transaction
-
-    def _prepare_inner_transaction(self) -> str:
-        if not self.inner_transaction:
-            return ""
-
-        sender = Address.new_from_bech32(self.inner_transaction.sender).to_hex()
-        receiver = Address.new_from_bech32(self.inner_transaction.receiver).to_hex()
-
-        tx: Dict[str, Any] = {
-            "nonce": self.inner_transaction.nonce,
-            "sender": base64.b64encode(bytes.fromhex(sender)).decode(),
-            "receiver": base64.b64encode(bytes.fromhex(receiver)).decode(),
-            "value": int(self.inner_transaction.value.__str__(), 10),
-            "gasPrice": self.inner_transaction.gas_price,
-            "gasLimit": self.inner_transaction.gas_limit,
-            "data": base64.b64encode(self.inner_transaction.data).decode(),
-            "signature": base64.b64encode(self.inner_transaction.signature).decode(),
-            "chainID": base64.b64encode(
-                self.inner_transaction.chain_id.encode()
-            ).decode(),
-            "version": self.inner_transaction.version,
-        }
-
-        if self.inner_transaction.options:
-            tx["options"] = self.inner_transaction.options
-
-        if self.inner_transaction.guardian:
-            guardian = Address.new_from_bech32(self.inner_transaction.guardian).to_hex()
-            tx["guardian"] = base64.b64encode(bytes.fromhex(guardian)).decode()
-
-        if self.inner_transaction.guardian_signature:
-            tx["guardianSignature"] = base64.b64encode(self.inner_transaction.guardian_signature).decode()
-
-        if self.inner_transaction.sender_username:
-            tx["sndUserName"] = base64.b64encode(self.inner_transaction.sender_username.encode()).decode()
-
-        if self.inner_transaction.receiver_username:
-            tx[f"rcvUserName"] = base64.b64encode(self.inner_transaction.receiver_username.encode()).decode()
-
-        return json.dumps(tx, separators=(",", ":"))
@@ -1,13 +1,45 @@
-from multiversx_sdk_core.transaction_factories.delegation_transactions_factory import \
-    DelegationTransactionsFactory
-from multiversx_sdk_core.transaction_factories.smart_contract_transactions_factory import \
-    SmartContractTransactionsFactory
-from multiversx_sdk_core.transaction_factories.token_management_transactions_factory import (
-    RegisterAndSetAllRolesTokenType, TokenManagementTransactionsFactory)
-from multiversx_sdk_core.transaction_factories.transactions_factory_config import \
-    TransactionsFactoryConfig
-from multiversx_sdk_core.transaction_factories.transfer_transactions_factory import \
-    TransferTransactionsFactory
+from importlib import import_module
+from typing import TYPE_CHECKING, Any, Dict, List
+
+if TYPE_CHECKING:
+    from multiversx_sdk_core.transaction_factories.airdrop_transactions_planner import \
+        AirdropTransactionsPlanner
+    from multiversx_sdk_core.transaction_factories.delegation_transactions_factory import \
+        DelegationTransactionsFactory
+    from multiversx_sdk_core.transaction_factories.smart_contract_transactions_factory import \
+        SmartContractTransactionsFactory
+    from multiversx_sdk_core.transaction_factories.token_management_transactions_factory import (
+        RegisterAndSetAllRolesTokenType, TokenManagementTransactionsFactory)
+    from multiversx_sdk_core.transaction_factories.transactions_factory_config import \
+        TransactionsFactoryConfig
+    from multiversx_sdk_core.transaction_factories.transfer_transactions_factory import \
+        TransferTransactionsFactory
+
+# Each factory is loaded on first access (PEP 562), see "multiversx_sdk_core/__init__.py".
+_LAZY_IMPORTS: Dict[str, str] = {
+    "AirdropTransactionsPlanner": "multiversx_sdk_core.transaction_factories.airdrop_transactions_planner",
+    "DelegationTransactionsFactory": "multiversx_sdk_core.transaction_factories.delegation_transactions_factory",
+    "SmartContractTransactionsFactory": "multiversx_sdk_core.transaction_factories.smart_contract_transactions_factory",
+    "RegisterAndSetAllRolesTokenType": "multiversx_sdk_core.transaction_factories.token_management_transactions_factory",
+    "TokenManagementTransactionsFactory": "multiversx_sdk_core.transaction_factories.token_management_transactions_factory",
+    "TransactionsFactoryConfig": "multiversx_sdk_core.transaction_factories.transactions_factory_config",
+    "TransferTransactionsFactory": "multiversx_sdk_core.transaction_factories.transfer_transactions_factory",
+}
+
+
+def __getattr__(name: str) -> Any:
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    value = getattr(import_module(module_name), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> List[str]:
+    return sorted(set(globals()) | set(__all__))
+
 
 __all__ = [
     "DelegationTransactionsFactory",
@@ -15,5 +47,6 @@ __all__ = [
     "RegisterAndSetAllRolesTokenType",
     "TransactionsFactoryConfig",
     "SmartContractTransactionsFactory",
-    "TransferTransactionsFactory"
+    "TransferTransactionsFactory",
+    "AirdropTransactionsPlanner"
 ]
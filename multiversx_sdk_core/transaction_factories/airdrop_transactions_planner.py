@@ -0,0 +1,147 @@
+from itertools import islice
+from typing import Dict, Iterable, Iterator, List, Protocol, Tuple
+
+from multiversx_sdk_core.constants import ARGS_SEPARATOR
+from multiversx_sdk_core.errors import BadUsageError
+from multiversx_sdk_core.interfaces import IAddress, IToken
+from multiversx_sdk_core.serializer import arg_to_string
+from multiversx_sdk_core.transaction import Transaction
+from multiversx_sdk_core.transaction_factories.transfer_transactions_factory import (
+    ADDITIONAL_GAS_FOR_ESDT_NFT_TRANSFER, ADDITIONAL_GAS_FOR_ESDT_TRANSFER)
+
+DEFAULT_MAX_TRANSFERS_PER_TRANSACTION = 100
+DEFAULT_BATCH_SIZE = 10_000
+
+AirdropRow = Tuple[IAddress, IToken, int]
+# (identifier, nonce) => amount
+_TokenAmounts = Dict[Tuple[str, int], int]
+
+
+class IConfig(Protocol):
+    chain_id: str
+    min_gas_limit: int
+    gas_limit_per_byte: int
+    gas_limit_esdt_transfer: int
+    gas_limit_esdt_nft_transfer: int
+    gas_limit_multi_esdt_nft_transfer: int
+
+
+class ITokenComputer(Protocol):
+    def extract_identifier_from_extended_identifier(self, identifier: str) -> str:
+        ...
+
+
+class AirdropTransactionsPlanner:
+    """
+    Plans the transactions of a token airdrop, given (receiver, token, amount) rows.
+
+    The rows are consumed in windows of `batch_size` (thus, the memory usage is bounded by the batch size). Within a window,
+    the rows are grouped by receiver (the amounts of the same token are summed up), then each group is packed
+    into as few transactions as possible: a single transfer results in an "ESDTTransfer" or "ESDTNFTTransfer",
+    while multiple transfers result in "MultiESDTNFTTransfer" transactions of at most `max_transfers_per_transaction` transfers.
+
+    The data field and the gas limit of each transaction are the same as the ones produced by `TransferTransactionsFactory`.
+    """
+
+    def __init__(self,
+                 config: IConfig,
+                 token_computer: ITokenComputer,
+                 max_transfers_per_transaction: int = DEFAULT_MAX_TRANSFERS_PER_TRANSACTION,
+                 batch_size: int = DEFAULT_BATCH_SIZE) -> None:
+        if max_transfers_per_transaction < 1:
+            raise BadUsageError("The maximum number of transfers per transaction should be at least 1")
+        if batch_size < 1:
+            raise BadUsageError("The batch size should be at least 1")
+
+        self.config = config
+        self.token_computer = token_computer
+        self.max_transfers_per_transaction = max_transfers_per_transaction
+        self.batch_size = batch_size
+
+        self._encoded_identifiers: Dict[str, str] = {}
+        self._encoded_collection_identifiers: Dict[str, str] = {}
+
+    def plan(self, sender: IAddress, rows: Iterable[AirdropRow], first_nonce: int = 0) -> Iterator[Transaction]:
+        """Yields the transactions in nonce order, starting with `first_nonce`."""
+        sender_bech32 = sender.to_bech32()
+        nonce = first_nonce
+        iterator = iter(rows)
+
+        while True:
+            window = list(islice(iterator, self.batch_size))
+            if not window:
+                return
+
+            for receiver, token_amounts in self._group_by_receiver(window):
+                transfers = list(token_amounts.items())
+
+                for start in range(0, len(transfers), self.max_transfers_per_transaction):
+                    chunk = transfers[start:start + self.max_transfers_per_transaction]
+                    yield self._create_transaction(sender_bech32, receiver, chunk, nonce)
+                    nonce += 1
+
+    def _group_by_receiver(self, rows: List[AirdropRow]) -> Iterable[Tuple[IAddress, _TokenAmounts]]:
+        groups: Dict[str, Tuple[IAddress, _TokenAmounts]] = {}
+
+        for receiver, token, amount in rows:
+            receiver_hex = receiver.to_hex()
+            group = groups.get(receiver_hex)
+            if group is None:
+                group = groups[receiver_hex] = (receiver, {})
+
+            key = (token.identifier, token.nonce)
+            token_amounts = group[1]
+            token_amounts[key] = token_amounts.get(key, 0) + amount
+
+        return groups.values()
+
+    def _create_transaction(self, sender_bech32: str, receiver: IAddress, transfers: List[Tuple[Tuple[str, int], int]], nonce: int) -> Transaction:
+        receiver_bech32 = sender_bech32
+        parts: List[str] = []
+
+        if len(transfers) == 1:
+            (identifier, token_nonce), amount = transfers[0]
+
+            if token_nonce == 0:
+                parts.extend(["ESDTTransfer", self._encode_identifier(identifier), arg_to_string(amount)])
+                execution_gas = self.config.gas_limit_esdt_transfer + ADDITIONAL_GAS_FOR_ESDT_TRANSFER
+                receiver_bech32 = receiver.to_bech32()
+            else:
+                parts.extend([
+                    "ESDTNFTTransfer",
+                    self._encode_collection_identifier(identifier),
+                    arg_to_string(token_nonce),
+                    arg_to_string(amount),
+                    receiver.to_hex()
+                ])
+                execution_gas = self.config.gas_limit_esdt_nft_transfer + ADDITIONAL_GAS_FOR_ESDT_NFT_TRANSFER
+        else:
+            parts.extend(["MultiESDTNFTTransfer", receiver.to_hex(), arg_to_string(len(transfers))])
+            for (identifier, token_nonce), amount in transfers:
+                parts.extend([self._encode_collection_identifier(identifier), arg_to_string(token_nonce), arg_to_string(amount)])
+
+            execution_gas = self.config.gas_limit_multi_esdt_nft_transfer * len(transfers) + ADDITIONAL_GAS_FOR_ESDT_NFT_TRANSFER
+
+        data = ARGS_SEPARATOR.join(parts).encode("utf-8")
+
+        return Transaction(
+            sender=sender_bech32,
+            receiver=receiver_bech32,
+            gas_limit=self.config.min_gas_limit + self.config.gas_limit_per_byte * len(data) + execution_gas,
+            chain_id=self.config.chain_id,
+            nonce=nonce,
+            data=data
+        )
+
+    def _encode_identifier(self, identifier: str) -> str:
+        encoded = self._encoded_identifiers.get(identifier)
+        if encoded is None:
+            encoded = self._encoded_identifiers[identifier] = arg_to_string(identifier)
+        return encoded
+
+    def _encode_collection_identifier(self, identifier: str) -> str:
+        encoded = self._encoded_collection_identifiers.get(identifier)
+        if encoded is None:
+            collection = self.token_computer.extract_identifier_from_extended_identifier(identifier)
+            encoded = self._encoded_collection_identifiers[identifier] = arg_to_string(collection)
+        return encoded
@@ -0,0 +1,77 @@
+import pytest
+
+from multiversx_sdk_core.address import Address
+from multiversx_sdk_core.errors import BadUsageError
+from multiversx_sdk_core.tokens import Token, TokenComputer, TokenTransfer
+from multiversx_sdk_core.transaction_factories.airdrop_transactions_planner import \
+    AirdropTransactionsPlanner
+from multiversx_sdk_core.transaction_factories.transactions_factory_config import \
+    TransactionsFactoryConfig
+from multiversx_sdk_core.transaction_factories.transfer_transactions_factory import \
+    TransferTransactionsFactory
+
+alice = Address.new_from_bech32("erd1qyu5wthldzr8wx5c9ucg8kjagg0jfs53s8nr3zpz3hypefsdd8ssycr6th")
+bob = Address.new_from_bech32("erd1spyavw0956vq68xj8y4tenjpq2wd5a9p2c6j8gsz7ztyrnpxrruqzu66jx")
+carol = Address.new_from_bech32("erd1k2s324ww2g0yj38qn2ch2jwctdy8mnfxep94q9arncc6xecg3xaq6mjse8")
+
+
+class TestAirdropTransactionsPlanner:
+    config = TransactionsFactoryConfig("D")
+    factory = TransferTransactionsFactory(config, TokenComputer())
+
+    def test_plan_matches_transfer_factory(self):
+        planner = AirdropTransactionsPlanner(self.config, TokenComputer())
+        foo = Token("FOO-123456")
+        nft = Token("NFT-123456", 10)
+        sft = Token("SFT-987654", 1)
+
+        rows = [
+            (bob, foo, 1000000),
+            (carol, nft, 1),
+            (alice, nft, 1),
+            (alice, sft, 5),
+        ]
+
+        transactions = list(planner.plan(alice, rows, first_nonce=3))
+
+        expected = [
+            self.factory.create_transaction_for_esdt_token_transfer(alice, bob, [TokenTransfer(foo, 1000000)]),
+            self.factory.create_transaction_for_esdt_token_transfer(alice, carol, [TokenTransfer(nft, 1)]),
+            self.factory.create_transaction_for_esdt_token_transfer(alice, alice, [TokenTransfer(nft, 1), TokenTransfer(sft, 5)]),
+        ]
+
+        assert [transaction.nonce for transaction in transactions] == [3, 4, 5]
+
+        for actual, wanted in zip(transactions, expected):
+            assert actual.sender == wanted.sender
+            assert actual.receiver == wanted.receiver
+            assert actual.data == wanted.data
+            assert actual.gas_limit == wanted.gas_limit
+            assert actual.chain_id == wanted.chain_id
+
+    def test_plan_groups_and_packs_transfers(self):
+        planner = AirdropTransactionsPlanner(self.config, TokenComputer(), max_transfers_per_transaction=2, batch_size=100)
+        tokens = [Token("FOO-123456"), Token("BAR-123456"), Token("BAZ-123456")]
+
+        rows = [(bob, token, 10) for token in tokens] + [(carol, tokens[0], 1), (carol, tokens[0], 2)]
+        transactions = list(planner.plan(alice, rows))
+
+        # bob: 2 + 1 transfers; carol: 1 transfer (amounts summed up)
+        assert len(transactions) == 3
+        assert transactions[0].data.decode().startswith(f"MultiESDTNFTTransfer@{bob.to_hex()}@02@")
+        assert transactions[1].data.decode() == "ESDTTransfer@42415a2d313233343536@0a"
+        assert transactions[1].receiver == bob.to_bech32()
+        assert transactions[2].data.decode() == "ESDTTransfer@464f4f2d313233343536@03"
+
+    def test_plan_with_bounded_batch_size(self):
+        planner = AirdropTransactionsPlanner(self.config, TokenComputer(), batch_size=1)
+        foo = Token("FOO-123456")
+
+        # rows for the same receiver are not grouped across windows
+        transactions = list(planner.plan(alice, iter([(bob, foo, 1), (bob, foo, 2)])))
+        assert len(transactions) == 2
+        assert [transaction.nonce for transaction in transactions] == [0, 1]
+
+    def test_bad_arguments(self):
+        with pytest.raises(BadUsageError):
+            AirdropTransactionsPlanner(self.config, TokenComputer(), max_transfers_per_transaction=0)
@@ -0,0 +1,16 @@
+from typing import Iterable, List, Protocol
+
+
+class IConfig(Protocol):
+    min_gas_limit: int
+    gas_limit_per_byte: int
+
+
+def compute_gas_limits(config: IConfig, execution_gas: int, data_lengths: Iterable[int]) -> List[int]:
+    """
+    Computes the gas limits of many transactions of the same operation (thus, of the same execution gas), given the lengths of their data fields.
+    gas limit = min gas limit + gas per byte * length of data + execution gas.
+    """
+    constant_gas = config.min_gas_limit + execution_gas
+    gas_limit_per_byte = config.gas_limit_per_byte
+    return [constant_gas + gas_limit_per_byte * data_length for data_length in data_lengths]
@@ -0,0 +1,23 @@
+from multiversx_sdk_core.transaction_factories.gas_estimator import \
+    compute_gas_limits
+from multiversx_sdk_core.transaction_factories.transactions_factory_config import \
+    TransactionsFactoryConfig
+
+
+def test_compute_gas_limits():
+    config = TransactionsFactoryConfig("D")
+
+    assert compute_gas_limits(config, 0, []) == []
+    assert compute_gas_limits(config, 0, [0]) == [50_000]
+    assert compute_gas_limits(config, 300_000, [0, 10, 20]) == [
+        50_000 + 300_000,
+        50_000 + 10 * 1_500 + 300_000,
+        50_000 + 20 * 1_500 + 300_000,
+    ]
+
+
+def test_compute_gas_limits_takes_configuration_changes_into_account():
+    config = TransactionsFactoryConfig("D")
+    config.min_gas_limit = 100_000
+
+    assert compute_gas_limits(config, 0, [10]) == [100_000 + 10 * 1_500]
@@ -1,12 +1,12 @@
-import base64
-import json
-from typing import Any, Dict, List, Protocol
+from typing import Any, Dict, List, Optional, Protocol, Sequence
 
 from multiversx_sdk_core import Address
-from multiversx_sdk_core.errors import InvalidInnerTransactionError
+from multiversx_sdk_core.errors import (BadUsageError, ErrListsLengthMismatch,
+                                        InvalidInnerTransactionError)
 from multiversx_sdk_core.interfaces import IAddress, ITransaction
+from multiversx_sdk_core.relayed_v1_serializer import compute_relayed_v1_data
 from multiversx_sdk_core.serializer import args_to_string
-from multiversx_sdk_core.transaction import Transaction
+from multiversx_sdk_core.transaction import Transaction, TransactionComputer
 
 
 class IConfig(Protocol):
@@ -15,6 +15,34 @@ class IConfig(Protocol):
     gas_limit_per_byte: int
 
 
+class INonceSource(Protocol):
+    def get_nonce_then_increment(self) -> int:
+        ...
+
+
+class ITransactionComputer(Protocol):
+    def compute_transaction_hash(self, transaction: ITransaction) -> bytes:
+        ...
+
+
+class RelayedV2TransactionsBatch:
+    def __init__(self, inner_transactions: Sequence[ITransaction], transactions: List[Transaction]) -> None:
+        self.inner_transactions = inner_transactions
+        self.transactions = transactions
+
+    def compute_inner_to_outer_hashes(self, transaction_computer: Optional[ITransactionComputer] = None) -> Dict[str, str]:
+        """Maps the hashes of the inner transactions to the hashes of the relayed ones (which should be signed beforehand)."""
+        if any(not transaction.signature for transaction in self.transactions):
+            raise BadUsageError("The relayed transactions should be signed before computing their hashes")
+
+        computer = transaction_computer or TransactionComputer()
+
+        return {
+            computer.compute_transaction_hash(inner_transaction).hex(): computer.compute_transaction_hash(transaction).hex()
+            for inner_transaction, transaction in zip(self.inner_transactions, self.transactions)
+        }
+
+
 class RelayedTransactionsFactory:
     def __init__(self, config: IConfig) -> None:
         self._config = config
@@ -22,37 +50,90 @@ class RelayedTransactionsFactory:
     def create_relayed_v1_transaction(self,
                                       inner_transaction: ITransaction,
                                       relayer_address: IAddress) -> Transaction:
+        return self._create_relayed_v1_transaction(inner_transaction, relayer_address.to_bech32())
+
+    def create_relayed_v1_transactions(self,
+                                       inner_transactions: Sequence[ITransaction],
+                                       relayer_address: IAddress,
+                                       first_nonce: int = 0) -> List[Transaction]:
+        """Wraps each inner transaction in a relayed v1 transaction. The relayer's nonces are assigned consecutively, starting with `first_nonce`."""
+        relayer = relayer_address.to_bech32()
+        transactions: List[Transaction] = []
+
+        for index, inner_transaction in enumerate(inner_transactions):
+            transaction = self._create_relayed_v1_transaction(inner_transaction, relayer)
+            transaction.nonce = first_nonce + index
+            transactions.append(transaction)
+
+        return transactions
+
+    def create_relayed_v2_transaction(self,
+                                      inner_transaction: ITransaction,
+                                      inner_transaction_gas_limit: int,
+                                      relayer_address: IAddress) -> Transaction:
+        return self._create_relayed_v2_transaction(inner_transaction, inner_transaction_gas_limit, relayer_address.to_bech32(), {})
+
+    def create_relayed_v2_transactions(self,
+                                       inner_transactions: Sequence[ITransaction],
+                                       inner_transactions_gas_limits: Sequence[int],
+                                       relayer_address: IAddress,
+                                       relayer_nonce_source: INonceSource) -> RelayedV2TransactionsBatch:
+        """
+        Wraps each inner transaction in a relayed v2 transaction. The relayer's nonces are taken from `relayer_nonce_source`
+        (e.g. an `AccountNonceHolder`), in order, once all the inner transactions are validated. The inner receivers are decoded once per distinct address.
+        """
+        if len(inner_transactions) != len(inner_transactions_gas_limits):
+            raise ErrListsLengthMismatch("The number of inner transactions should match the number of gas limits")
+
+        relayer = relayer_address.to_bech32()
+        receivers_public_keys: Dict[str, bytes] = {}
+        transactions = [
+            self._create_relayed_v2_transaction(inner_transaction, inner_transaction_gas_limit, relayer, receivers_public_keys)
+            for inner_transaction, inner_transaction_gas_limit in zip(inner_transactions, inner_transactions_gas_limits)
+        ]
+
+        # the nonces are taken only once all the transactions are created, thus none is consumed if an inner transaction is invalid
+        for transaction in transactions:
+            transaction.nonce = relayer_nonce_source.get_nonce_then_increment()
+
+        return RelayedV2TransactionsBatch(inner_transactions, transactions)
+
+    def _create_relayed_v1_transaction(self, inner_transaction: ITransaction, relayer: str) -> Transaction:
         if not inner_transaction.gas_limit:
             raise InvalidInnerTransactionError("The gas limit is not set for the inner transaction")
 
         if not inner_transaction.signature:
             raise InvalidInnerTransactionError("The inner transaction is not signed")
 
-        serialized_transaction = self._prepare_inner_transaction_for_relayed_v1(inner_transaction)
-        data = f"relayedTx@{serialized_transaction.encode().hex()}"
-
+        data = compute_relayed_v1_data(inner_transaction)
         gas_limit = self._config.min_gas_limit + self._config.gas_limit_per_byte * len(data) + inner_transaction.gas_limit
 
         return Transaction(
             chain_id=self._config.chain_id,
-            sender=relayer_address.to_bech32(),
+            sender=relayer,
             receiver=inner_transaction.sender,
             gas_limit=gas_limit,
-            data=data.encode()
+            data=data
         )
 
-    def create_relayed_v2_transaction(self,
-                                      inner_transaction: ITransaction,
-                                      inner_transaction_gas_limit: int,
-                                      relayer_address: IAddress) -> Transaction:
+    def _create_relayed_v2_transaction(self,
+                                       inner_transaction: ITransaction,
+                                       inner_transaction_gas_limit: int,
+                                       relayer: str,
+                                       receivers_public_keys: Dict[str, bytes]) -> Transaction:
         if inner_transaction.gas_limit:
             raise InvalidInnerTransactionError("The gas limit should not be set for the inner transaction")
 
         if not inner_transaction.signature:
             raise InvalidInnerTransactionError("The inner transaction is not signed")
 
+        receiver_public_key = receivers_public_keys.get(inner_transaction.receiver)
+        if receiver_public_key is None:
+            receiver_public_key = Address.new_from_bech32(inner_transaction.receiver).get_public_key()
+            receivers_public_keys[inner_transaction.receiver] = receiver_public_key
+
         arguments: List[Any] = [
-            Address.new_from_bech32(inner_transaction.receiver),
+            receiver_public_key,
             inner_transaction.nonce,
             inner_transaction.data,
             inner_transaction.signature
@@ -62,7 +143,7 @@ class RelayedTransactionsFactory:
         gas_limit = inner_transaction_gas_limit + self._config.min_gas_limit + self._config.gas_limit_per_byte * len(data)
 
         return Transaction(
-            sender=relayer_address.to_bech32(),
+            sender=relayer,
             receiver=inner_transaction.sender,
             value=0,
             gas_limit=gas_limit,
@@ -71,38 +152,3 @@ class RelayedTransactionsFactory:
             version=inner_transaction.version,
             options=inner_transaction.options
         )
-
-    def _prepare_inner_transaction_for_relayed_v1(self, inner_transaction: ITransaction) -> str:
-        sender = Address.new_from_bech32(inner_transaction.sender).to_hex()
-        receiver = Address.new_from_bech32(inner_transaction.receiver).to_hex()
-
-        tx: Dict[str, Any] = {
-            "nonce": inner_transaction.nonce,
-            "sender": base64.b64encode(bytes.fromhex(sender)).decode(),
-            "receiver": base64.b64encode(bytes.fromhex(receiver)).decode(),
-            "value": inner_transaction.value,
-            "gasPrice": inner_transaction.gas_price,
-            "gasLimit": inner_transaction.gas_limit,
-            "data": base64.b64encode(inner_transaction.data).decode(),
-            "signature": base64.b64encode(inner_transaction.signature).decode(),
-            "chainID": base64.b64encode(inner_transaction.chain_id.encode()).decode(),
-            "version": inner_transaction.version,
-        }
-
-        if inner_transaction.options:
-            tx["options"] = inner_transaction.options
-
-        if inner_transaction.guardian:
-            guardian = Address.new_from_bech32(inner_transaction.guardian).to_hex()
-            tx["guardian"] = base64.b64encode(bytes.fromhex(guardian)).decode()
-
-        if inner_transaction.guardian_signature:
-            tx["guardianSignature"] = base64.b64encode(inner_transaction.guardian_signature).decode()
-
-        if inner_transaction.sender_username:
-            tx["sndUserName"] = base64.b64encode(inner_transaction.sender_username.encode()).decode()
-
-        if inner_transaction.receiver_username:
-            tx[f"rcvUserName"] = base64.b64encode(inner_transaction.receiver_username.encode()).decode()
-
-        return json.dumps(tx, separators=(",", ":"))
@@ -1,7 +1,12 @@
+from typing import List
+
 import pytest
 
 from multiversx_sdk_core import Address
-from multiversx_sdk_core.errors import InvalidInnerTransactionError
+from multiversx_sdk_core.account import AccountNonceHolder
+from multiversx_sdk_core.errors import (BadUsageError, ErrListsLengthMismatch,
+                                        InvalidInnerTransactionError)
+from multiversx_sdk_core.interfaces import ITransaction
 from multiversx_sdk_core.testutils.wallets import load_wallets
 from multiversx_sdk_core.transaction import Transaction, TransactionComputer
 from multiversx_sdk_core.transaction_factories.relayed_transactions_factory import \
@@ -70,6 +75,37 @@ class TestRelayedTransactionsFactory:
         assert relayed_transaction.data.decode() == "relayedTx@7b226e6f6e6365223a3139382c2273656e646572223a2267456e574f65576d6d413063306a6b71764d354241707a61644b46574e534f69417643575163776d4750673d222c227265636569766572223a22414141414141414141414141415141414141414141414141414141414141414141414141414141432f2f383d222c2276616c7565223a302c226761735072696365223a313030303030303030302c226761734c696d6974223a36303030303030302c2264617461223a225a3256305132397564484a68593352446232356d6157633d222c227369676e6174757265223a2272525455544858677a4273496e4f6e454b6b7869642b354e66524d486e33534948314673746f577352434c434b3258514c41614f4e704449346531476173624c5150616130566f364144516d4f2b52446b6f364a43413d3d222c22636861696e4944223a2256413d3d222c2276657273696f6e223a327d"
         assert relayed_transaction.signature.hex() == "128e7cdc14c2b9beee2f3ff7a7fa5d1f5ef31a654a0c92e223c90ab28265fa277d306f23a06536248cf9573e828017004fb639617fade4d68a37524aafca710d"
 
+    def test_create_relayed_v1_transactions(self):
+        alice = self.wallets["alice"]
+        bob = self.wallets["bob"]
+
+        inner_transactions = [
+            Transaction(
+                sender=bob.label,
+                receiver="erd1qqqqqqqqqqqqqqqpqqqqqqqqqqqqqqqqqqqqqqqqqqqqqqqzllls8a5w6u",
+                gas_limit=60000000,
+                chain_id=self.config.chain_id,
+                data=b"getContractConfig",
+                nonce=198 + i,
+                signature=bytes([i]) * 64
+            ) for i in range(3)
+        ]
+
+        relayed_transactions = self.factory.create_relayed_v1_transactions(
+            inner_transactions=inner_transactions,
+            relayer_address=Address.from_bech32(alice.label),
+            first_nonce=2627
+        )
+
+        assert [transaction.nonce for transaction in relayed_transactions] == [2627, 2628, 2629]
+
+        for inner_transaction, relayed_transaction in zip(inner_transactions, relayed_transactions):
+            expected = self.factory.create_relayed_v1_transaction(inner_transaction, Address.from_bech32(alice.label))
+            assert relayed_transaction.sender == alice.label
+            assert relayed_transaction.receiver == bob.label
+            assert relayed_transaction.data == expected.data
+            assert relayed_transaction.gas_limit == expected.gas_limit
+
     def test_create_relayed_v1_transaction_with_usernames(self):
         alice = self.wallets["alice"]
         carol = self.wallets["carol"]
@@ -229,3 +265,82 @@ class TestRelayedTransactionsFactory:
         assert relayed_transaction.version == 2
         assert relayed_transaction.options == 0
         assert relayed_transaction.data.decode() == "relayedTxV2@000000000000000000010000000000000000000000000000000000000002ffff@0f@676574436f6e7472616374436f6e666967@fc3ed87a51ee659f937c1a1ed11c1ae677e99629fae9cc289461f033e6514d1a8cfad1144ae9c1b70f28554d196bd6ba1604240c1c1dc19c959e96c1c3b62d0c"
+
+    def test_create_relayed_v2_transactions(self):
+        alice = self.wallets["alice"]
+        bob = self.wallets["bob"]
+
+        inner_transactions: List[ITransaction] = []
+        for nonce in [15, 16]:
+            inner_transaction = Transaction(
+                sender=bob.label,
+                receiver="erd1qqqqqqqqqqqqqqqpqqqqqqqqqqqqqqqqqqqqqqqqqqqqqqqzllls8a5w6u",
+                gas_limit=0,
+                chain_id=self.config.chain_id,
+                data=b"getContractConfig",
+                nonce=nonce
+            )
+            inner_transaction.signature = bob.secret_key.sign(self.transaction_computer.compute_bytes_for_signing(inner_transaction))
+            inner_transactions.append(inner_transaction)
+
+        relayer_nonce_holder = AccountNonceHolder(37)
+        batch = self.factory.create_relayed_v2_transactions(
+            inner_transactions=inner_transactions,
+            inner_transactions_gas_limits=[60_000_000, 60_000_000],
+            relayer_address=Address.from_bech32(alice.label),
+            relayer_nonce_source=relayer_nonce_holder
+        )
+
+        assert [transaction.nonce for transaction in batch.transactions] == [37, 38]
+        assert relayer_nonce_holder.nonce == 39
+
+        expected = self.factory.create_relayed_v2_transaction(inner_transactions[0], 60_000_000, Address.from_bech32(alice.label))
+        assert batch.transactions[0].data == expected.data
+        assert batch.transactions[0].gas_limit == expected.gas_limit
+
+        with pytest.raises(BadUsageError, match="The relayed transactions should be signed before computing their hashes"):
+            batch.compute_inner_to_outer_hashes()
+
+        for transaction in batch.transactions:
+            transaction.signature = alice.secret_key.sign(self.transaction_computer.compute_bytes_for_signing(transaction))
+
+        hashes = batch.compute_inner_to_outer_hashes()
+        inner_hash = self.transaction_computer.compute_transaction_hash(inner_transactions[1]).hex()
+        assert hashes[inner_hash] == self.transaction_computer.compute_transaction_hash(batch.transactions[1]).hex()
+        assert len(hashes) == 2
+
+    def test_create_relayed_v2_transactions_with_lists_length_mismatch(self):
+        with pytest.raises(ErrListsLengthMismatch):
+            self.factory.create_relayed_v2_transactions([], [50000], Address.from_bech32(self.wallets["alice"].label), AccountNonceHolder())
+
+    def test_create_relayed_v2_transactions_with_invalid_inner_tx_does_not_consume_nonces(self):
+        alice = self.wallets["alice"]
+        bob = self.wallets["bob"]
+
+        inner_transactions: List[ITransaction] = []
+        for nonce in [15, 16, 17]:
+            inner_transaction = Transaction(
+                sender=bob.label,
+                receiver="erd1qqqqqqqqqqqqqqqpqqqqqqqqqqqqqqqqqqqqqqqqqqqqqqqzllls8a5w6u",
+                gas_limit=0,
+                chain_id=self.config.chain_id,
+                data=b"getContractConfig",
+                nonce=nonce
+            )
+            inner_transaction.signature = bob.secret_key.sign(self.transaction_computer.compute_bytes_for_signing(inner_transaction))
+            inner_transactions.append(inner_transaction)
+
+        # the last inner transaction is invalid
+        inner_transactions[2].gas_limit = 50_000
+
+        relayer_nonce_holder = AccountNonceHolder(10)
+
+        with pytest.raises(InvalidInnerTransactionError, match="The gas limit should not be set for the inner transaction"):
+            self.factory.create_relayed_v2_transactions(
+                inner_transactions=inner_transactions,
+                inner_transactions_gas_limits=[60_000_000, 60_000_000, 60_000_000],
+                relayer_address=Address.from_bech32(alice.label),
+                relayer_nonce_source=relayer_nonce_holder
+            )
+
+        assert relayer_nonce_holder.nonce == 10
@@ -1,6 +1,7 @@
 from typing import List, Optional, Protocol
 
 from multiversx_sdk_core.constants import ARGS_SEPARATOR
+from multiversx_sdk_core.instrumentation import instrumented
 from multiversx_sdk_core.interfaces import IAddress
 from multiversx_sdk_core.transaction import Transaction
 
@@ -41,6 +42,7 @@ class TransactionBuilder:
         data = ARGS_SEPARATOR.join(parts)
         return data.encode("utf-8")
 
+    @instrumented("transaction_builder.build")
     def build(self) -> Transaction:
         data = self.build_transaction_payload(self.data_parts)
         gas_limit = self.compute_gas_limit(data)
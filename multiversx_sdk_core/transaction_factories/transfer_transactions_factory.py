@@ -1,6 +1,6 @@
-from typing import List, Optional, Protocol, Sequence
+from typing import Iterator, List, Optional, Protocol, Sequence
 
-from multiversx_sdk_core.errors import BadUsageError
+from multiversx_sdk_core.errors import BadUsageError, ErrListsLengthMismatch
 from multiversx_sdk_core.interfaces import IAddress, IToken, ITokenTransfer
 from multiversx_sdk_core.transaction import Transaction
 from multiversx_sdk_core.transaction_factories.token_transfers_data_builder import \
@@ -51,6 +51,52 @@ class TransferTransactionsFactory:
             amount=native_amount
         ).build()
 
+    def create_transactions_for_native_token_transfers(self,
+                                                       sender: IAddress,
+                                                       receivers: Sequence[IAddress],
+                                                       native_amounts: Sequence[int],
+                                                       first_nonce: int = 0,
+                                                       data: Optional[str] = None) -> List[Transaction]:
+        """
+        Creates one transaction per (receiver, amount), with sequential nonces starting at `first_nonce`.
+        The sender, the data field and the gas limit are computed once, for the whole batch.
+        """
+        return list(self.iterate_transactions_for_native_token_transfers(sender, receivers, native_amounts, first_nonce, data))
+
+    def iterate_transactions_for_native_token_transfers(self,
+                                                        sender: IAddress,
+                                                        receivers: Sequence[IAddress],
+                                                        native_amounts: Sequence[int],
+                                                        first_nonce: int = 0,
+                                                        data: Optional[str] = None) -> Iterator[Transaction]:
+        """Same as `create_transactions_for_native_token_transfers()`, but the transactions are created on demand."""
+        if len(receivers) != len(native_amounts):
+            raise ErrListsLengthMismatch("The number of receivers should match the number of amounts")
+
+        return self._generate_native_token_transfers(sender, receivers, native_amounts, first_nonce, data or "")
+
+    def _generate_native_token_transfers(self,
+                                         sender: IAddress,
+                                         receivers: Sequence[IAddress],
+                                         native_amounts: Sequence[int],
+                                         first_nonce: int,
+                                         data: str) -> Iterator[Transaction]:
+        sender_bech32 = sender.to_bech32()
+        chain_id = self.config.chain_id
+        payload = data.encode("utf-8")
+        gas_limit = self.config.min_gas_limit + self.config.gas_limit_per_byte * len(payload)
+
+        for nonce, (receiver, amount) in enumerate(zip(receivers, native_amounts), start=first_nonce):
+            yield Transaction(
+                sender=sender_bech32,
+                receiver=receiver.to_bech32(),
+                gas_limit=gas_limit,
+                chain_id=chain_id,
+                nonce=nonce,
+                value=amount,
+                data=payload
+            )
+
     def create_transaction_for_esdt_token_transfer(self,
                                                    sender: IAddress,
                                                    receiver: IAddress,
@@ -1,4 +1,7 @@
+import pytest
+
 from multiversx_sdk_core.address import Address
+from multiversx_sdk_core.errors import ErrListsLengthMismatch
 from multiversx_sdk_core.tokens import Token, TokenComputer, TokenTransfer
 from multiversx_sdk_core.transaction_factories.transactions_factory_config import \
     TransactionsFactoryConfig
@@ -64,6 +67,20 @@ class TestTransferTransactionsFactory:
         assert transaction.data.decode() == "ESDTTransfer@464f4f2d313233343536@0f4240"
         assert transaction.gas_limit == 410_000
 
+    def test_configuration_changes_are_taken_into_account(self):
+        alice = Address.new_from_bech32("erd1qyu5wthldzr8wx5c9ucg8kjagg0jfs53s8nr3zpz3hypefsdd8ssycr6th")
+        bob = Address.new_from_bech32("erd1spyavw0956vq68xj8y4tenjpq2wd5a9p2c6j8gsz7ztyrnpxrruqzu66jx")
+        config = TransactionsFactoryConfig("D")
+        factory = TransferTransactionsFactory(config, TokenComputer())
+        token_transfers = [TokenTransfer(Token("FOO-123456"), 1000000)]
+
+        transaction = factory.create_transaction_for_esdt_token_transfer(alice, bob, token_transfers)
+        assert transaction.gas_limit == 410_000
+
+        config.gas_limit_esdt_transfer = 1
+        transaction = factory.create_transaction_for_esdt_token_transfer(alice, bob, token_transfers)
+        assert transaction.gas_limit == 410_000 - 200_000 + 1
+
     def test_create_transaction_for_nft_transfer(self):
         alice = Address.new_from_bech32("erd1qyu5wthldzr8wx5c9ucg8kjagg0jfs53s8nr3zpz3hypefsdd8ssycr6th")
         bob = Address.new_from_bech32("erd1spyavw0956vq68xj8y4tenjpq2wd5a9p2c6j8gsz7ztyrnpxrruqzu66jx")
@@ -106,3 +123,41 @@ class TestTransferTransactionsFactory:
         assert transaction.chain_id == "D"
         assert transaction.data.decode() == "MultiESDTNFTTransfer@8049d639e5a6980d1cd2392abcce41029cda74a1563523a202f09641cc2618f8@02@4e46542d313233343536@0a@01@544553542d393837363534@01@01"
         assert transaction.gas_limit == 1_466_000
+
+    def test_create_transactions_for_native_token_transfers(self):
+        alice = Address.new_from_bech32("erd1qyu5wthldzr8wx5c9ucg8kjagg0jfs53s8nr3zpz3hypefsdd8ssycr6th")
+        bob = Address.new_from_bech32("erd1spyavw0956vq68xj8y4tenjpq2wd5a9p2c6j8gsz7ztyrnpxrruqzu66jx")
+
+        transactions = self.transfer_factory.create_transactions_for_native_token_transfers(
+            sender=alice,
+            receivers=[bob, alice, bob],
+            native_amounts=[1, 2, 3],
+            first_nonce=7,
+            data="test data"
+        )
+
+        assert len(transactions) == 3
+        assert [transaction.nonce for transaction in transactions] == [7, 8, 9]
+        assert [transaction.value for transaction in transactions] == [1, 2, 3]
+        assert transactions[1].receiver == "erd1qyu5wthldzr8wx5c9ucg8kjagg0jfs53s8nr3zpz3hypefsdd8ssycr6th"
+
+        single = self.transfer_factory.create_transaction_for_native_token_transfer(alice, bob, 3, "test data")
+        assert transactions[2].sender == single.sender
+        assert transactions[2].receiver == single.receiver
+        assert transactions[2].gas_limit == single.gas_limit == 63_500
+        assert transactions[2].data == single.data
+
+    def test_iterate_transactions_for_native_token_transfers(self):
+        alice = Address.new_from_bech32("erd1qyu5wthldzr8wx5c9ucg8kjagg0jfs53s8nr3zpz3hypefsdd8ssycr6th")
+        bob = Address.new_from_bech32("erd1spyavw0956vq68xj8y4tenjpq2wd5a9p2c6j8gsz7ztyrnpxrruqzu66jx")
+
+        transactions = self.transfer_factory.iterate_transactions_for_native_token_transfers(alice, [bob] * 5, [10] * 5)
+        first = next(transactions)
+
+        assert first.nonce == 0
+        assert first.gas_limit == 50_000
+        assert first.data == b""
+        assert len(list(transactions)) == 4
+
+        with pytest.raises(ErrListsLengthMismatch):
+            self.transfer_factory.iterate_transactions_for_native_token_transfers(alice, [bob, bob], [10])
@@ -1,6 +1,17 @@
+from multiversx_sdk_core.transaction_parsers.delegation_outcome_parser import \
+    DelegationOutcomeParser
+from multiversx_sdk_core.transaction_parsers.outcomes_columnar_sink import \
+    OutcomesColumnarSink
+from multiversx_sdk_core.transaction_parsers.relayed_transactions_decoder import \
+    RelayedTransactionsDecoder
 from multiversx_sdk_core.transaction_parsers.token_operations_outcome_parser import \
     TokenOperationsOutcomeParser
+from multiversx_sdk_core.transaction_parsers.transactions_stream_reader import \
+    TransactionsStreamReader
+from multiversx_sdk_core.transaction_parsers.transfers_outcome_parser import \
+    TransfersOutcomeParser
 
 __all__ = [
-    "TokenOperationsOutcomeParser"
+    "TokenOperationsOutcomeParser", "RelayedTransactionsDecoder", "TransactionsStreamReader",
+    "TransfersOutcomeParser", "DelegationOutcomeParser", "OutcomesColumnarSink"
 ]
@@ -0,0 +1,167 @@
+from typing import Any, Callable, Dict, List, Optional, Protocol, Tuple
+
+from multiversx_sdk_core import Address
+from multiversx_sdk_core.codec import decode_unsigned_number
+from multiversx_sdk_core.constants import DELEGATION_MANAGER_SC_ADDRESS
+from multiversx_sdk_core.transaction_parsers.delegation_outcome_parser_types import (
+    ClaimRewardsOutcome, DelegateOutcome, NewDelegationContractOutcome,
+    RedelegateRewardsOutcome, UndelegateOutcome, WithdrawOutcome)
+from multiversx_sdk_core.transaction_parsers.outcome_parser import \
+    OutcomeParser
+from multiversx_sdk_core.transaction_parsers.outcome_parser_types import \
+    OutcomeParsingResult
+from multiversx_sdk_core.transaction_parsers.transaction_on_network_wrapper import (
+    ITransactionEvent, ITransactionOnNetwork, TransactionOnNetworkWrapper)
+
+# The operations are named after the "parse_*" methods.
+OPERATIONS = [
+    "new_delegation_contract",
+    "delegate",
+    "undelegate",
+    "claim_rewards",
+    "redelegate_rewards",
+    "withdraw",
+]
+
+# (event identifier, operation), in the order of detection.
+# The operations on the nodes and on the settings of the delegation contract don't have specific events (thus, outcomes).
+OPERATIONS_BY_EVENT_IDENTIFIER: List[Tuple[str, str]] = [
+    ("SCDeploy", "new_delegation_contract"),
+    ("delegate", "delegate"),
+    ("unDelegate", "undelegate"),
+    ("claimRewards", "claim_rewards"),
+    ("reDelegateRewards", "redelegate_rewards"),
+    ("withdraw", "withdraw"),
+]
+
+_DELEGATION_MANAGER_PUBLIC_KEY = Address.new_from_bech32(DELEGATION_MANAGER_SC_ADDRESS).get_public_key()
+
+
+class IConfig(Protocol):
+    address_hrp: str
+
+
+class DelegationOutcomeParser(OutcomeParser):
+    """
+    Parses the outcomes of the delegation operations (see `DelegationTransactionsFactory`).
+    For the operations of the users (delegate, undelegate etc.), the address of the event is the caller, while the first topic is the amount.
+    A "SCDeploy" event is routed to "new_delegation_contract" only if the transaction involves the delegation manager
+    (as receiver, or as address or topic of the event); other contracts might be deployed, as well.
+    """
+
+    operations = OPERATIONS
+
+    def __init__(self, config: IConfig) -> None:
+        self._config = config
+
+        # operation => outcome factory (of an event)
+        outcome_factories_by_operation: Dict[str, Callable[[ITransactionEvent], Any]] = {
+            "new_delegation_contract": self._create_new_delegation_contract_outcome,
+            "delegate": self._create_delegate_outcome,
+            "undelegate": self._create_undelegate_outcome,
+            "claim_rewards": self._create_claim_rewards_outcome,
+            "redelegate_rewards": self._create_redelegate_rewards_outcome,
+            "withdraw": self._create_withdraw_outcome,
+        }
+
+        # event identifier => (operation, outcome factory), in the order of detection
+        self._handlers_by_identifier: Dict[str, Tuple[str, Callable[[ITransactionEvent], Any]]] = {
+            identifier: (operation, outcome_factories_by_operation[operation])
+            for identifier, operation in OPERATIONS_BY_EVENT_IDENTIFIER
+        }
+
+    def parse_new_delegation_contract(self, transaction: ITransactionOnNetwork) -> NewDelegationContractOutcome:
+        return self._parse_single_event(transaction, "SCDeploy")
+
+    def parse_delegate(self, transaction: ITransactionOnNetwork) -> DelegateOutcome:
+        return self._parse_single_event(transaction, "delegate")
+
+    def parse_undelegate(self, transaction: ITransactionOnNetwork) -> UndelegateOutcome:
+        return self._parse_single_event(transaction, "unDelegate")
+
+    def parse_claim_rewards(self, transaction: ITransactionOnNetwork) -> ClaimRewardsOutcome:
+        return self._parse_single_event(transaction, "claimRewards")
+
+    def parse_redelegate_rewards(self, transaction: ITransactionOnNetwork) -> RedelegateRewardsOutcome:
+        return self._parse_single_event(transaction, "reDelegateRewards")
+
+    def parse_withdraw(self, transaction: ITransactionOnNetwork) -> WithdrawOutcome:
+        return self._parse_single_event(transaction, "withdraw")
+
+    def detect_operation(self, transaction: ITransactionOnNetwork) -> Optional[str]:
+        wrapper = TransactionOnNetworkWrapper.from_transaction(transaction)
+
+        for identifier, (operation, _) in self._handlers_by_identifier.items():
+            events = wrapper.find_events_by_identifier(identifier)
+            if any(self._is_routed(wrapper, event) for event in events):
+                return operation
+
+        return None
+
+    def parse_all(self, transaction: ITransactionOnNetwork) -> List[OutcomeParsingResult]:
+        """
+        Returns all the recognized outcomes, in a single pass over the events (in their order), routed by their identifiers.
+        If an outcome cannot be extracted from its event, its error is reported in the results.
+        If the transaction encountered a "signalError", the only result (without an operation) holds it.
+        """
+        wrapper = TransactionOnNetworkWrapper.from_transaction(transaction)
+
+        signal_error = wrapper.find_error()
+        if signal_error is not None:
+            return [OutcomeParsingResult(None, signal_error=signal_error)]
+
+        handlers_by_identifier = self._handlers_by_identifier
+        results: List[OutcomeParsingResult] = []
+
+        for event in wrapper.gather_all_events():
+            handler = handlers_by_identifier.get(event.identifier)
+            if handler is None or not self._is_routed(wrapper, event):
+                continue
+
+            operation, create_outcome = handler
+
+            try:
+                results.append(OutcomeParsingResult(operation, outcome=create_outcome(event)))
+            except Exception as error:
+                results.append(OutcomeParsingResult(operation, error=error))
+
+        return results
+
+    def _is_routed(self, wrapper: TransactionOnNetworkWrapper, event: ITransactionEvent) -> bool:
+        if event.identifier != "SCDeploy":
+            return True
+
+        if wrapper.receiver == DELEGATION_MANAGER_SC_ADDRESS or event.address.to_bech32() == DELEGATION_MANAGER_SC_ADDRESS:
+            return True
+
+        return any(topic.raw == _DELEGATION_MANAGER_PUBLIC_KEY for topic in event.topics)
+
+    def _parse_single_event(self, transaction: ITransactionOnNetwork, identifier: str) -> Any:
+        wrapper = TransactionOnNetworkWrapper.from_transaction(transaction)
+        wrapper.ensure_no_error()
+
+        event = wrapper.find_single_event_by_identifier(identifier)
+        _, create_outcome = self._handlers_by_identifier[identifier]
+        return create_outcome(event)
+
+    def _create_new_delegation_contract_outcome(self, event: ITransactionEvent) -> NewDelegationContractOutcome:
+        contract_address = Address(event.topics[0].raw, self._config.address_hrp).to_bech32()
+        return NewDelegationContractOutcome(contract_address)
+
+    def _create_delegate_outcome(self, event: ITransactionEvent) -> DelegateOutcome:
+        return DelegateOutcome(event.address.to_bech32(), self._extract_amount(event))
+
+    def _create_undelegate_outcome(self, event: ITransactionEvent) -> UndelegateOutcome:
+        return UndelegateOutcome(event.address.to_bech32(), self._extract_amount(event))
+
+    def _create_claim_rewards_outcome(self, event: ITransactionEvent) -> ClaimRewardsOutcome:
+        return ClaimRewardsOutcome(event.address.to_bech32(), self._extract_amount(event))
+
+    def _create_redelegate_rewards_outcome(self, event: ITransactionEvent) -> RedelegateRewardsOutcome:
+        return RedelegateRewardsOutcome(event.address.to_bech32(), self._extract_amount(event))
+
+    def _create_withdraw_outcome(self, event: ITransactionEvent) -> WithdrawOutcome:
+        return WithdrawOutcome(event.address.to_bech32(), self._extract_amount(event))
+
+    def _extract_amount(self, event: ITransactionEvent) -> int:
+        return decode_unsigned_number(event.topics[0].raw)
@@ -0,0 +1,122 @@
+from concurrent.futures import ThreadPoolExecutor
+from types import SimpleNamespace
+
+import pytest
+
+from multiversx_sdk_core import Address
+from multiversx_sdk_core.codec import encode_unsigned_number
+from multiversx_sdk_core.constants import DELEGATION_MANAGER_SC_ADDRESS
+from multiversx_sdk_core.transaction_factories.transactions_factory_config import \
+    TransactionsFactoryConfig
+from multiversx_sdk_core.transaction_parsers.delegation_outcome_parser import \
+    DelegationOutcomeParser
+from multiversx_sdk_core.transaction_parsers.delegation_outcome_parser_types import (
+    ClaimRewardsOutcome, DelegateOutcome, NewDelegationContractOutcome,
+    UndelegateOutcome)
+from multiversx_sdk_core.transaction_parsers.transaction_on_network_wrapper import (
+    ContractResultItemWrapper, ContractResultsWrapper, SignalErrorInfo,
+    TransactionEventTopicWrapper, TransactionEventWrapper,
+    TransactionLogsWrapper, TransactionOnNetworkWrapper)
+
+alice = Address.new_from_bech32("erd1qyu5wthldzr8wx5c9ucg8kjagg0jfs53s8nr3zpz3hypefsdd8ssycr6th")
+contract = Address.new_from_bech32("erd1qqqqqqqqqqqqqpgq54tsxmej537z9leghvp69hfu4f8gg5eu396q83gnnz")
+delegation_manager = Address.new_from_bech32(DELEGATION_MANAGER_SC_ADDRESS)
+parser = DelegationOutcomeParser(TransactionsFactoryConfig("D"))
+
+
+def create_event(address: Address, identifier: str, *topics: bytes) -> TransactionEventWrapper:
+    return TransactionEventWrapper(
+        address=address,
+        identifier=identifier,
+        topics=[TransactionEventTopicWrapper(topic) for topic in topics],
+        data=""
+    )
+
+
+def create_transaction(*events: TransactionEventWrapper) -> TransactionOnNetworkWrapper:
+    return TransactionOnNetworkWrapper(ContractResultsWrapper([]), TransactionLogsWrapper(list(events)))
+
+
+def test_parse_new_delegation_contract():
+    transaction = TransactionOnNetworkWrapper(
+        ContractResultsWrapper([
+            ContractResultItemWrapper(TransactionLogsWrapper([create_event(contract, "SCDeploy", contract.get_public_key(), alice.get_public_key())]))
+        ]),
+        TransactionLogsWrapper([create_event(alice, "delegate", encode_unsigned_number(1250 * 10**18))])
+    )
+
+    assert parser.parse_new_delegation_contract(transaction) == NewDelegationContractOutcome(contract.to_bech32())
+
+
+def test_detect_new_delegation_contract_requires_the_delegation_manager():
+    deploy_event = create_event(contract, "SCDeploy", contract.get_public_key(), alice.get_public_key())
+    delegate_event = create_event(alice, "delegate", encode_unsigned_number(1250 * 10**18))
+
+    # any contract deployment (e.g. by a contract called by the user) isn't a new delegation contract
+    transaction = create_transaction(deploy_event, delegate_event)
+    assert parser.detect_operation(transaction) == "delegate"
+    assert [result.operation for result in parser.parse_all(transaction)] == ["delegate"]
+
+    transaction = TransactionOnNetworkWrapper(ContractResultsWrapper([]), TransactionLogsWrapper([deploy_event, delegate_event]), DELEGATION_MANAGER_SC_ADDRESS)
+    assert parser.detect_operation(transaction) == "new_delegation_contract"
+    assert parser.parse_all(transaction)[0].outcome == NewDelegationContractOutcome(contract.to_bech32())
+
+    # the receiver is taken from the (unwrapped) transaction on network, if available
+    transaction_on_network = SimpleNamespace(contract_results=ContractResultsWrapper([]), logs=TransactionLogsWrapper([deploy_event]), receiver=delegation_manager)
+    assert parser.detect_operation(transaction_on_network) == "new_delegation_contract"  # type: ignore
+
+    transaction = create_transaction(create_event(contract, "SCDeploy", contract.get_public_key(), delegation_manager.get_public_key()))
+    assert parser.detect_operation(transaction) == "new_delegation_contract"
+
+
+def test_parse_delegation_operations():
+    amount = 10**18
+
+    assert parser.parse_delegate(create_transaction(create_event(alice, "delegate", encode_unsigned_number(amount)))) == DelegateOutcome(alice.to_bech32(), amount)
+    assert parser.parse_undelegate(create_transaction(create_event(alice, "unDelegate", encode_unsigned_number(amount), b"\x01"))) == UndelegateOutcome(alice.to_bech32(), amount)
+    assert parser.parse_claim_rewards(create_transaction(create_event(alice, "claimRewards", encode_unsigned_number(amount), b""))).amount == amount
+    assert parser.parse_redelegate_rewards(create_transaction(create_event(alice, "reDelegateRewards", encode_unsigned_number(amount)))).amount == amount
+    assert parser.parse_withdraw(create_transaction(create_event(alice, "withdraw", encode_unsigned_number(amount)))).user_address == alice.to_bech32()
+
+    with pytest.raises(Exception, match="cannot find event of type: 'withdraw'"):
+        parser.parse_withdraw(create_transaction(create_event(alice, "delegate", encode_unsigned_number(amount))))
+
+
+def test_parse_all():
+    transaction = create_transaction(
+        create_event(alice, "claimRewards", encode_unsigned_number(5), b""),
+        create_event(alice, "writeLog"),
+        create_event(alice, "delegate", encode_unsigned_number(5)),
+        create_event(alice, "withdraw"),
+    )
+
+    results = parser.parse_all(transaction)
+
+    assert [result.operation for result in results] == ["claim_rewards", "delegate", "withdraw"]
+    assert results[0].outcome == ClaimRewardsOutcome(alice.to_bech32(), 5)
+    assert results[1].outcome == DelegateOutcome(alice.to_bech32(), 5)
+    assert isinstance(results[2].error, IndexError)
+
+
+def test_parse_many():
+    transactions = [
+        create_transaction(create_event(alice, "delegate", encode_unsigned_number(7))),
+        create_transaction(create_event(alice, "unDelegate", encode_unsigned_number(3))),
+        create_transaction(create_event(alice, "signalError", alice.get_public_key(), b"not enough stake")),
+        create_transaction(create_event(alice, "writeLog")),
+    ]
+
+    results = parser.parse_many(transactions)
+
+    assert [result.operation for result in results] == ["delegate", "undelegate", None, None]
+    assert results[0].outcome == DelegateOutcome(alice.to_bech32(), 7)
+    assert results[1].outcome == UndelegateOutcome(alice.to_bech32(), 3)
+    assert results[2].signal_error == SignalErrorInfo("not enough stake", "", None, 0)
+    assert str(results[3].error) == "Cannot detect the operation"
+
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        results = parser.parse_many(transactions, operation="delegate", executor=executor)
+
+    assert results[0].is_success()
+    assert str(results[1].error) == "cannot find event of type: 'delegate'"
+    assert not results[2].is_success() and not results[3].is_success()
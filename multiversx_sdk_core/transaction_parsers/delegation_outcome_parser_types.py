@@ -0,0 +1,56 @@
+from dataclasses import dataclass
+
+from multiversx_sdk_core.transaction_parsers.outcome_parser_types import (
+    SlottedOutcome, amount_fields)
+
+
+@dataclass(frozen=True)
+class NewDelegationContractOutcome(SlottedOutcome):
+    __slots__ = ("contract_address",)
+
+    contract_address: str
+
+
+@amount_fields("amount")
+@dataclass(frozen=True)
+class DelegateOutcome(SlottedOutcome):
+    __slots__ = ("user_address", "amount")
+
+    user_address: str
+    amount: int
+
+
+@amount_fields("amount")
+@dataclass(frozen=True)
+class UndelegateOutcome(SlottedOutcome):
+    __slots__ = ("user_address", "amount")
+
+    user_address: str
+    amount: int
+
+
+@amount_fields("amount")
+@dataclass(frozen=True)
+class ClaimRewardsOutcome(SlottedOutcome):
+    __slots__ = ("user_address", "amount")
+
+    user_address: str
+    amount: int
+
+
+@amount_fields("amount")
+@dataclass(frozen=True)
+class RedelegateRewardsOutcome(SlottedOutcome):
+    __slots__ = ("user_address", "amount")
+
+    user_address: str
+    amount: int
+
+
+@amount_fields("amount")
+@dataclass(frozen=True)
+class WithdrawOutcome(SlottedOutcome):
+    __slots__ = ("user_address", "amount")
+
+    user_address: str
+    amount: int
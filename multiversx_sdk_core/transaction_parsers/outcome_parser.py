@@ -0,0 +1,64 @@
+from concurrent.futures import Executor
+from itertools import repeat
+from typing import Any, List, Optional, Sequence
+
+from multiversx_sdk_core.errors import BadUsageError
+from multiversx_sdk_core.transaction_parsers.outcome_parser_types import \
+    OutcomeParsingResult
+from multiversx_sdk_core.transaction_parsers.transaction_on_network_wrapper import (
+    ITransactionOnNetwork, TransactionOnNetworkWrapper)
+
+
+class OutcomeParser:
+    """
+    Not intended to be used directly; should be derived and specialized.
+    The derived parsers list their `operations`, named after their "parse_*" methods.
+    """
+
+    operations: List[str] = []
+
+    def parse(self, transaction: ITransactionOnNetwork, operation: str) -> Any:
+        """Parses the outcome of the given operation (e.g. "nft_create" for `parse_nft_create()`)."""
+        if operation not in self.operations:
+            raise BadUsageError(f"Unknown operation: {operation}")
+        return getattr(self, f"parse_{operation}")(transaction)
+
+    def detect_operation(self, transaction: ITransactionOnNetwork) -> Optional[str]:
+        """By default, the operation cannot be detected (thus, it should be given to `parse_many()`)."""
+        return None
+
+    def parse_many(self,
+                   transactions: Sequence[ITransactionOnNetwork],
+                   operation: Optional[str] = None,
+                   executor: Optional[Executor] = None) -> List[OutcomeParsingResult]:
+        """
+        Parses the outcomes of many transactions, either of a given operation or (if `operation` is not provided) of the detected one.
+        The errors (including the "signalError" events) are reported per item (in the results), instead of being raised.
+
+        Optionally, the work is distributed on a thread or process pool (in the latter case, the transactions should be picklable).
+        """
+        if operation is not None and operation not in self.operations:
+            raise BadUsageError(f"Unknown operation: {operation}")
+
+        if executor is None:
+            return [self._parse_one(transaction, operation) for transaction in transactions]
+
+        return list(executor.map(self._parse_one, transactions, repeat(operation)))
+
+    def _parse_one(self, transaction: ITransactionOnNetwork, operation: Optional[str]) -> OutcomeParsingResult:
+        try:
+            # the wrapper (and its event index) is shared by the detection and the parsing
+            wrapper = TransactionOnNetworkWrapper.from_transaction(transaction)
+
+            signal_error = wrapper.find_error()
+            if signal_error is not None:
+                return OutcomeParsingResult(operation, signal_error=signal_error)
+
+            if operation is None:
+                operation = self.detect_operation(wrapper)
+                if operation is None:
+                    return OutcomeParsingResult(None, error=BadUsageError("Cannot detect the operation"))
+
+            return OutcomeParsingResult(operation, outcome=self.parse(wrapper, operation))
+        except Exception as error:
+            return OutcomeParsingResult(operation, error=error)
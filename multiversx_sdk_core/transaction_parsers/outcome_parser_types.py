@@ -0,0 +1,90 @@
+import dataclasses
+from dataclasses import dataclass
+from operator import attrgetter
+from types import MappingProxyType
+from typing import (Any, Callable, ClassVar, Optional, Sequence, Tuple, Type,
+                    TypeVar, cast)
+
+from multiversx_sdk_core.errors import BadUsageError
+from multiversx_sdk_core.transaction_parsers.transaction_on_network_wrapper import \
+    SignalErrorInfo
+
+TOutcome = TypeVar("TOutcome", bound="SlottedOutcome")
+AMOUNT_METADATA_KEY = "amount"
+
+
+def create_values_getter(field_names: Sequence[str]) -> Callable[[Any], Tuple[Any, ...]]:
+    if not field_names:
+        return lambda outcome: ()
+    if len(field_names) == 1:
+        getter = attrgetter(field_names[0])
+        return lambda outcome: (getter(outcome),)
+    return attrgetter(*field_names)
+
+
+class SlottedOutcome:
+    """
+    Base of the outcomes: frozen (thus, hashable) dataclasses with `__slots__` (declared explicitly, for Python 3.8).
+    `to_tuple()` returns the values of the fields, in order; `from_tuple()` is its inverse.
+    """
+
+    __slots__ = ()
+    _get_values: ClassVar[Callable[[Any], Tuple[Any, ...]]]
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        super().__init_subclass__(**kwargs)
+        cls._get_values = staticmethod(create_values_getter(cls.__slots__))
+
+    def to_tuple(self) -> Tuple[Any, ...]:
+        return type(self)._get_values(self)
+
+    @classmethod
+    def from_tuple(cls: Type[TOutcome], values: Sequence[Any]) -> TOutcome:
+        # the fields (thus, the parameters of the constructor) are declared by the derived dataclasses
+        return cast(Callable[..., TOutcome], cls)(*values)
+
+    # Needed for pickling (e.g. for process pools), since the frozen dataclasses don't allow "setattr()" on the slots.
+    def __getstate__(self) -> Tuple[Any, ...]:
+        return self.to_tuple()
+
+    def __setstate__(self, state: Tuple[Any, ...]) -> None:
+        for name, value in zip(self.__slots__, state):
+            object.__setattr__(self, name, value)
+
+
+def amount_fields(*field_names: str) -> Callable[[Type[TOutcome]], Type[TOutcome]]:
+    """
+    Marks the given fields of an outcome as token amounts (which might not fit in 64 bits), in their metadata.
+    Should be applied on top of `@dataclass`: `field(metadata=...)` cannot be used, since it conflicts with the explicit `__slots__`.
+    """
+    def mark(cls: Type[TOutcome]) -> Type[TOutcome]:
+        fields_by_name = {field.name: field for field in dataclasses.fields(cast(Any, cls))}
+
+        for name in field_names:
+            field = fields_by_name.get(name)
+            if field is None:
+                raise BadUsageError(f"Unknown field of {cls.__name__}: {name}")
+            field.metadata = MappingProxyType({**field.metadata, AMOUNT_METADATA_KEY: True})
+
+        return cls
+
+    return mark
+
+
+def is_amount_field(field: 'dataclasses.Field[Any]') -> bool:
+    return bool(field.metadata.get(AMOUNT_METADATA_KEY))
+
+
+@dataclass
+class OutcomeParsingResult:
+    """
+    The outcome of a batch parsing item: either `outcome`, `error` or `signal_error` is set.
+    If the transaction encountered a "signalError", it's reported in `signal_error` (and not as an exception).
+    """
+    operation: Optional[str]
+    outcome: Any = None
+    error: Optional[Exception] = None
+    signal_error: Optional[SignalErrorInfo] = None
+
+    def is_success(self) -> bool:
+        return self.error is None and self.signal_error is None
@@ -0,0 +1,181 @@
+"""
+Collects the outcomes of the parsers into column buffers (one table per outcome type), flushed in chunks.
+
+The columns of a table are the fields of the outcome dataclass, preceded by "transaction_hash". Their types are fixed by the fields,
+thus the same across chunks: the token amounts (the fields marked by `@amount_fields`), which might not fit in 64 bits,
+are held as decimal strings, the other integer fields (e.g. "nonce") in `array("Q")` buffers (unsigned), and the other fields in lists.
+A flushed chunk is a dict (column name => buffer), which can be converted by `to_arrow_table()` (if pyarrow is installed):
+
+    arrow_tables = []
+    sink = OutcomesColumnarSink(on_flush=lambda name, columns: arrow_tables.append((name, to_arrow_table(columns))))
+    sink.extend(reader.read_outcomes(file))
+    sink.flush()
+"""
+
+import dataclasses
+from array import array
+from typing import (Any, Callable, Dict, Iterable, List, MutableSequence,
+                    Sequence, Tuple, Type)
+
+from multiversx_sdk_core.errors import BadUsageError
+from multiversx_sdk_core.transaction_parsers.outcome_parser_types import (
+    OutcomeParsingResult, create_values_getter, is_amount_field)
+
+DEFAULT_CHUNK_SIZE = 65_536
+ERRORS_TABLE = "errors"
+TRANSACTION_HASH_COLUMN = "transaction_hash"
+ERRORS_COLUMNS = [TRANSACTION_HASH_COLUMN, "operation", "error", "signal_error_message", "signal_error_data"]
+
+Columns = Dict[str, MutableSequence[Any]]
+
+
+class OutcomesColumnarSink:
+    """
+    The tables are named after the outcome types (e.g. "MintOutcome"). The unsuccessful results go into the "errors" table.
+    When a table reaches `chunk_size` rows, it's passed to `on_flush` (table name, columns), then its buffers are renewed.
+    The successful results without an outcome (e.g. of "set_burn_role_globally") are only counted, per operation.
+    """
+
+    def __init__(self,
+                 on_flush: Callable[[str, Columns], None],
+                 chunk_size: int = DEFAULT_CHUNK_SIZE) -> None:
+        if chunk_size < 1:
+            raise BadUsageError("The chunk size should be at least 1")
+
+        self.chunk_size = chunk_size
+        self._on_flush = on_flush
+        self._tables_by_type: Dict[type, _ColumnarTable] = {}
+        self._errors_table = _ColumnarTable(ERRORS_TABLE, ERRORS_COLUMNS[1:])
+        self.num_empty_outcomes_by_operation: Dict[str, int] = {}
+
+    def append(self, outcome: Any, transaction_hash: str = "") -> None:
+        """Appends an outcome (dataclass), or a list of outcomes (e.g. the transfers of a transaction). `None` is skipped."""
+        if outcome is None:
+            return
+
+        if isinstance(outcome, list):
+            for item in outcome:
+                self.append(item, transaction_hash)
+            return
+
+        table = self._tables_by_type.get(type(outcome))
+        if table is None:
+            table = self._tables_by_type[type(outcome)] = _ColumnarTable.for_type(type(outcome))
+
+        table.append(transaction_hash, outcome)
+        if len(table) >= self.chunk_size:
+            self._flush_table(table)
+
+    def append_result(self, result: OutcomeParsingResult, transaction_hash: str = "") -> None:
+        if result.is_success():
+            if result.outcome is None:
+                operation = result.operation or ""
+                self.num_empty_outcomes_by_operation[operation] = self.num_empty_outcomes_by_operation.get(operation, 0) + 1
+                return
+
+            self.append(result.outcome, transaction_hash)
+            return
+
+        signal_error = result.signal_error
+        self._errors_table.append_row(transaction_hash, (
+            result.operation or "",
+            str(result.error) if result.error is not None else "",
+            signal_error.message if signal_error is not None else "",
+            signal_error.data if signal_error is not None else ""
+        ))
+
+        if len(self._errors_table) >= self.chunk_size:
+            self._flush_table(self._errors_table)
+
+    def extend(self, results: Iterable[Tuple[str, OutcomeParsingResult]]) -> int:
+        """Appends (transaction hash, result) pairs, as yielded by `TransactionsStreamReader.read_outcomes()`. Returns their number."""
+        count = 0
+
+        for transaction_hash, result in results:
+            self.append_result(result, transaction_hash)
+            count += 1
+
+        return count
+
+    def flush(self) -> None:
+        """Flushes the (non-empty) remainders of all tables."""
+        for table in list(self._tables_by_type.values()) + [self._errors_table]:
+            if len(table):
+                self._flush_table(table)
+
+    def _flush_table(self, table: '_ColumnarTable') -> None:
+        self._on_flush(table.name, table.take_columns())
+
+
+class _ColumnarTable:
+    def __init__(self, name: str, field_names: List[str], integer_field_names: Sequence[str] = (), amount_field_names: Sequence[str] = ()) -> None:
+        self.name = name
+        self.field_names = field_names
+        self._integer_field_names = set(integer_field_names)
+        self._amount_field_names = set(amount_field_names)
+        self._get_values = create_values_getter(field_names)
+        self._num_rows = 0
+        self._columns = self._create_columns()
+
+    @classmethod
+    def for_type(cls, outcome_type: Type[Any]) -> '_ColumnarTable':
+        if not dataclasses.is_dataclass(outcome_type):
+            raise BadUsageError(f"Not an outcome (dataclass): {outcome_type.__name__}")
+
+        fields = dataclasses.fields(outcome_type)
+        field_names = [field.name for field in fields]
+        amount_fields = [field.name for field in fields if is_amount_field(field)]
+        integer_fields = [field.name for field in fields if field.type in (int, "int") and not is_amount_field(field)]
+
+        return cls(outcome_type.__name__, field_names, integer_fields, amount_fields)
+
+    def __len__(self) -> int:
+        return self._num_rows
+
+    def append(self, transaction_hash: str, outcome: Any) -> None:
+        self.append_row(transaction_hash, self._get_values(outcome))
+
+    def append_row(self, transaction_hash: str, values: Sequence[Any]) -> None:
+        columns = self._columns
+        columns[TRANSACTION_HASH_COLUMN].append(transaction_hash)
+        amount_field_names = self._amount_field_names
+
+        for name, value in zip(self.field_names, values):
+            columns[name].append(str(value) if name in amount_field_names else value)
+
+        self._num_rows += 1
+
+    def take_columns(self) -> Columns:
+        columns = self._columns
+        self._columns = self._create_columns()
+        self._num_rows = 0
+        return columns
+
+    def _create_columns(self) -> Columns:
+        columns: Columns = {TRANSACTION_HASH_COLUMN: []}
+
+        for name in self.field_names:
+            columns[name] = array("Q") if name in self._integer_field_names else []
+
+        return columns
+
+
+def to_arrow_table(columns: Columns) -> Any:
+    """
+    Converts a chunk to a `pyarrow.Table` (requires pyarrow). The `array("Q")` columns become uint64 columns,
+    while the token amounts (decimal strings) become string columns.
+    """
+    try:
+        import pyarrow  # type: ignore
+    except ImportError:
+        raise BadUsageError("pyarrow is required for the conversion to Arrow tables (pip install pyarrow)")
+
+    arrays: Dict[str, Any] = {}
+
+    for name, column in columns.items():
+        if isinstance(column, array):
+            arrays[name] = pyarrow.array(column, type=pyarrow.uint64())
+        else:
+            arrays[name] = pyarrow.array(column)
+
+    return pyarrow.table(arrays)
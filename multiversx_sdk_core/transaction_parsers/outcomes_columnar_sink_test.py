@@ -0,0 +1,176 @@
+import sys
+from array import array
+from dataclasses import dataclass, fields
+from typing import List, Tuple
+
+import pytest
+
+from multiversx_sdk_core.errors import BadUsageError
+from multiversx_sdk_core.transaction_factories.transactions_factory_config import \
+    TransactionsFactoryConfig
+from multiversx_sdk_core.transaction_parsers.outcome_parser_types import (
+    OutcomeParsingResult, SlottedOutcome, amount_fields, is_amount_field)
+from multiversx_sdk_core.transaction_parsers.outcomes_columnar_sink import (
+    Columns, OutcomesColumnarSink, to_arrow_table)
+from multiversx_sdk_core.transaction_parsers.token_operations_outcome_parser import \
+    TokenOperationsOutcomeParser
+from multiversx_sdk_core.transaction_parsers.token_operations_outcome_parser_types import (
+    MintOutcome, PausingOutcome, RegisterAndSetAllRolesOutcome)
+from multiversx_sdk_core.transaction_parsers.transaction_on_network_wrapper import (
+    ContractResultsWrapper, SignalErrorInfo, TransactionLogsWrapper,
+    TransactionOnNetworkWrapper)
+
+ALICE = "erd1qyu5wthldzr8wx5c9ucg8kjagg0jfs53s8nr3zpz3hypefsdd8ssycr6th"
+
+
+def create_sink(chunk_size: int = 65_536) -> Tuple[OutcomesColumnarSink, List[Tuple[str, Columns]]]:
+    chunks: List[Tuple[str, Columns]] = []
+    sink = OutcomesColumnarSink(on_flush=lambda table, columns: chunks.append((table, columns)), chunk_size=chunk_size)
+    return sink, chunks
+
+
+def test_append_and_flush():
+    sink, chunks = create_sink()
+
+    sink.append(MintOutcome(ALICE, "FOO-abcdef", 0, 100), "aa")
+    sink.append(MintOutcome(ALICE, "FOO-abcdef", 0, 200), "bb")
+    sink.append([RegisterAndSetAllRolesOutcome("BAR-abcdef", ("ESDTRoleLocalMint",))], "cc")
+    sink.append(PausingOutcome(), "dd")
+    assert chunks == []
+
+    sink.flush()
+
+    assert chunks == [
+        ("MintOutcome", {
+            "transaction_hash": ["aa", "bb"],
+            "user_address": [ALICE, ALICE],
+            "token_identifier": ["FOO-abcdef", "FOO-abcdef"],
+            "nonce": array("Q", [0, 0]),
+            "minted_supply": ["100", "200"],
+        }),
+        ("RegisterAndSetAllRolesOutcome", {
+            "transaction_hash": ["cc"],
+            "token_identifier": ["BAR-abcdef"],
+            "roles": [("ESDTRoleLocalMint",)],
+        }),
+        ("PausingOutcome", {"transaction_hash": ["dd"]}),
+    ]
+
+    # nothing left to flush
+    sink.flush()
+    assert len(chunks) == 3
+
+
+def test_chunks_have_the_same_column_types():
+    sink, chunks = create_sink(chunk_size=2)
+
+    sink.append(MintOutcome(ALICE, "FOO-abcdef", 0, 1))
+    assert chunks == []
+
+    sink.append(MintOutcome(ALICE, "FOO-abcdef", 0, 10**18 * 10**6))
+    assert len(chunks) == 1
+    assert chunks[0][1]["nonce"] == array("Q", [0, 0])
+    assert chunks[0][1]["minted_supply"] == ["1", str(10**24)]
+
+    sink.append(MintOutcome(ALICE, "FOO-abcdef", 7, 3))
+    sink.flush()
+    assert chunks[1][1]["nonce"] == array("Q", [7])
+    assert chunks[1][1]["minted_supply"] == ["3"]
+
+
+def test_extend_with_errors():
+    sink, chunks = create_sink()
+
+    count = sink.extend([
+        ("aa", OutcomeParsingResult("local_mint", outcome=MintOutcome(ALICE, "FOO-abcdef", 0, 1))),
+        ("bb", OutcomeParsingResult("local_mint", error=Exception("cannot find event of type: 'ESDTLocalMint'"))),
+        ("cc", OutcomeParsingResult(None, signal_error=SignalErrorInfo("out of funds", "", None, 0))),
+    ])
+    sink.flush()
+
+    assert count == 3
+    assert [table for table, _ in chunks] == ["MintOutcome", "errors"]
+    assert chunks[1][1] == {
+        "transaction_hash": ["bb", "cc"],
+        "operation": ["local_mint", ""],
+        "error": ["cannot find event of type: 'ESDTLocalMint'", ""],
+        "signal_error_message": ["", "out of funds"],
+        "signal_error_data": ["", ""],
+    }
+
+    with pytest.raises(BadUsageError, match="Not an outcome"):
+        sink.append(42)
+
+
+def test_extend_with_empty_outcomes():
+    sink, chunks = create_sink()
+    parser = TokenOperationsOutcomeParser(TransactionsFactoryConfig("D"))
+    transaction = TransactionOnNetworkWrapper(ContractResultsWrapper([]), TransactionLogsWrapper([]))
+
+    # "parse_set_burn_role_globally()" returns None
+    results = parser.parse_many([transaction, transaction], operation="set_burn_role_globally")
+    assert [result.is_success() for result in results] == [True, True]
+
+    count = sink.extend([("aa", results[0]), ("bb", results[1])])
+    sink.append(None, "cc")
+    sink.flush()
+
+    assert count == 2
+    assert chunks == []
+    assert sink.num_empty_outcomes_by_operation == {"set_burn_role_globally": 2}
+
+
+def test_nonces_beyond_signed_64_bits():
+    sink, chunks = create_sink()
+
+    sink.append(MintOutcome(ALICE, "FOO-abcdef", 2**64 - 1, 1))
+    sink.flush()
+
+    assert chunks[0][1]["nonce"] == array("Q", [2**64 - 1])
+
+
+@amount_fields("supply")
+@dataclass(frozen=True)
+class DummyOutcome(SlottedOutcome):
+    __slots__ = ("amount", "supply")
+
+    amount: int
+    supply: int
+
+
+def test_amount_fields_are_given_by_metadata():
+    assert [is_amount_field(field) for field in fields(DummyOutcome)] == [False, True]
+    assert [is_amount_field(field) for field in fields(MintOutcome)] == [False, False, False, True]
+
+    sink, chunks = create_sink()
+    sink.append(DummyOutcome(1, 2))
+    sink.flush()
+
+    assert chunks[0][1]["amount"] == array("Q", [1])
+    assert chunks[0][1]["supply"] == ["2"]
+
+    with pytest.raises(BadUsageError, match="Unknown field of DummyOutcome: foobar"):
+        amount_fields("foobar")(DummyOutcome)
+
+
+def test_to_arrow_table():
+    pyarrow = pytest.importorskip("pyarrow")
+
+    sink, chunks = create_sink(chunk_size=1)
+    sink.append(MintOutcome(ALICE, "FOO-abcdef", 0, 10**24))
+    sink.append(MintOutcome(ALICE, "FOO-abcdef", 1, 5))
+
+    tables = [to_arrow_table(columns) for _, columns in chunks]
+
+    assert tables[0].num_rows == 1
+    assert tables[0].schema.field("nonce").type == pyarrow.uint64()
+    assert tables[0].schema.field("minted_supply").type == pyarrow.string()
+    assert tables[0].column("minted_supply").to_pylist() == [str(10**24)]
+    assert tables[0].schema == tables[1].schema
+
+
+def test_to_arrow_table_without_pyarrow(monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.setitem(sys.modules, "pyarrow", None)
+
+    with pytest.raises(BadUsageError, match="pyarrow is required"):
+        to_arrow_table({"transaction_hash": []})
@@ -0,0 +1,153 @@
+import binascii
+import json
+from base64 import b64decode
+from functools import lru_cache
+from typing import Any, Dict, Iterable, List, Optional, Protocol
+
+from multiversx_sdk_core.address import Address
+from multiversx_sdk_core.codec import decode_unsigned_number
+from multiversx_sdk_core.errors import (ErrBadPubkeyLength,
+                                        InvalidRelayedTransactionError)
+from multiversx_sdk_core.interfaces import ITransaction
+from multiversx_sdk_core.transaction import Transaction
+
+RELAYED_V1_PREFIX = b"relayedTx@"
+RELAYED_V2_PREFIX = b"relayedTxV2@"
+RELAYED_V2_NUM_ARGUMENTS = 4
+
+
+class IConfig(Protocol):
+    address_hrp: str
+
+
+class RelayedTransactionsDecoder:
+    """
+    Reconstructs the inner transactions of relayed v1 ("relayedTx@...") and v2 ("relayedTxV2@...") transactions.
+
+    The data field is read through a memoryview (the hex-encoded arguments are decoded in place, without intermediate copies).
+    For relayed v2, the inner transaction isn't fully contained in the outer one: its sender is the outer receiver,
+    its gas limit is 0 (as when it was signed) and its chain ID, version, options and gas price are the ones of the outer transaction.
+    """
+
+    def __init__(self, config: IConfig) -> None:
+        self._config = config
+
+    def is_relayed(self, transaction: ITransaction) -> bool:
+        view = memoryview(transaction.data)
+        return _has_prefix(view, RELAYED_V1_PREFIX) or _has_prefix(view, RELAYED_V2_PREFIX)
+
+    def decode(self, transaction: ITransaction) -> Transaction:
+        view = memoryview(transaction.data)
+
+        if _has_prefix(view, RELAYED_V1_PREFIX):
+            return self.decode_relayed_v1(transaction)
+        if _has_prefix(view, RELAYED_V2_PREFIX):
+            return self.decode_relayed_v2(transaction)
+
+        raise InvalidRelayedTransactionError("The transaction is not a relayed transaction")
+
+    def decode_many(self, transactions: Iterable[ITransaction]) -> List[Optional[Transaction]]:
+        """Batch variant of `decode()`. For the transactions that aren't relayed (or cannot be decoded), the result is `None`."""
+        results: List[Optional[Transaction]] = []
+
+        for transaction in transactions:
+            try:
+                results.append(self.decode(transaction))
+            except InvalidRelayedTransactionError:
+                results.append(None)
+
+        return results
+
+    def decode_relayed_v1(self, transaction: ITransaction) -> Transaction:
+        view = memoryview(transaction.data)
+        if not _has_prefix(view, RELAYED_V1_PREFIX):
+            raise InvalidRelayedTransactionError("The transaction is not a relayed v1 transaction")
+
+        try:
+            fields: Dict[str, Any] = json.loads(binascii.unhexlify(view[len(RELAYED_V1_PREFIX):]))
+            return self._create_inner_transaction_for_relayed_v1(fields)
+        except (ValueError, TypeError, KeyError, AttributeError, ErrBadPubkeyLength) as error:
+            raise InvalidRelayedTransactionError(f"Cannot decode the inner transaction of the relayed v1 transaction: {error}")
+
+    def decode_relayed_v2(self, transaction: ITransaction) -> Transaction:
+        data = transaction.data
+        if not isinstance(data, (bytes, bytearray)):
+            data = bytes(data)
+
+        view = memoryview(data)
+        if not _has_prefix(view, RELAYED_V2_PREFIX):
+            raise InvalidRelayedTransactionError("The transaction is not a relayed v2 transaction")
+
+        arguments: List[bytes] = []
+        start = len(RELAYED_V2_PREFIX)
+
+        try:
+            while True:
+                end = data.find(b"@", start)
+                if end < 0:
+                    arguments.append(binascii.unhexlify(view[start:]))
+                    break
+
+                arguments.append(binascii.unhexlify(view[start:end]))
+                start = end + 1
+        except ValueError as error:
+            raise InvalidRelayedTransactionError(f"Cannot decode the arguments of the relayed v2 transaction: {error}")
+
+        if len(arguments) != RELAYED_V2_NUM_ARGUMENTS:
+            raise InvalidRelayedTransactionError(f"The relayed v2 transaction should have {RELAYED_V2_NUM_ARGUMENTS} arguments, not {len(arguments)}")
+
+        receiver, nonce, inner_data, signature = arguments
+
+        try:
+            receiver_bech32 = self._public_key_to_bech32(receiver)
+        except ErrBadPubkeyLength as error:
+            raise InvalidRelayedTransactionError(f"Cannot decode the inner receiver of the relayed v2 transaction: {error}")
+
+        return Transaction(
+            sender=transaction.receiver,
+            receiver=receiver_bech32,
+            gas_limit=0,
+            chain_id=transaction.chain_id,
+            nonce=decode_unsigned_number(nonce),
+            value=0,
+            gas_price=transaction.gas_price,
+            data=inner_data,
+            version=transaction.version,
+            options=transaction.options,
+            signature=signature
+        )
+
+    def _create_inner_transaction_for_relayed_v1(self, fields: Dict[str, Any]) -> Transaction:
+        guardian = fields.get("guardian")
+        sender_username = fields.get("sndUserName")
+        receiver_username = fields.get("rcvUserName")
+
+        return Transaction(
+            sender=self._public_key_to_bech32(b64decode(fields["sender"], validate=True)),
+            receiver=self._public_key_to_bech32(b64decode(fields["receiver"], validate=True)),
+            gas_limit=fields["gasLimit"],
+            chain_id=b64decode(fields["chainID"], validate=True).decode(),
+            nonce=fields["nonce"],
+            value=int(fields["value"]),
+            sender_username=b64decode(sender_username, validate=True).decode() if sender_username else "",
+            receiver_username=b64decode(receiver_username, validate=True).decode() if receiver_username else "",
+            gas_price=fields["gasPrice"],
+            data=b64decode(fields.get("data") or b"", validate=True),
+            version=fields["version"],
+            options=fields.get("options", 0),
+            guardian=self._public_key_to_bech32(b64decode(guardian, validate=True)) if guardian else "",
+            signature=b64decode(fields["signature"], validate=True),
+            guardian_signature=b64decode(fields.get("guardianSignature") or b"", validate=True)
+        )
+
+    def _public_key_to_bech32(self, public_key: bytes) -> str:
+        return _public_key_to_bech32(public_key, self._config.address_hrp)
+
+
+def _has_prefix(view: memoryview, prefix: bytes) -> bool:
+    return view[:len(prefix)] == prefix
+
+
+@lru_cache(maxsize=4096)
+def _public_key_to_bech32(public_key: bytes, hrp: str) -> str:
+    return Address(public_key, hrp).to_bech32()
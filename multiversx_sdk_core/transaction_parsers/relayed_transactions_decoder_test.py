@@ -0,0 +1,85 @@
+import pytest
+
+from multiversx_sdk_core.address import Address
+from multiversx_sdk_core.errors import InvalidRelayedTransactionError
+from multiversx_sdk_core.transaction import Transaction
+from multiversx_sdk_core.transaction_factories.relayed_transactions_factory import \
+    RelayedTransactionsFactory
+from multiversx_sdk_core.transaction_factories.transactions_factory_config import \
+    TransactionsFactoryConfig
+from multiversx_sdk_core.transaction_parsers.relayed_transactions_decoder import \
+    RelayedTransactionsDecoder
+
+
+class TestRelayedTransactionsDecoder:
+    config = TransactionsFactoryConfig("T")
+    factory = RelayedTransactionsFactory(config)
+    decoder = RelayedTransactionsDecoder(config)
+    alice = "erd1qyu5wthldzr8wx5c9ucg8kjagg0jfs53s8nr3zpz3hypefsdd8ssycr6th"
+    bob = "erd1spyavw0956vq68xj8y4tenjpq2wd5a9p2c6j8gsz7ztyrnpxrruqzu66jx"
+    carol = "erd1k2s324ww2g0yj38qn2ch2jwctdy8mnfxep94q9arncc6xecg3xaq6mjse8"
+
+    def test_decode_relayed_v1(self):
+        inner_transaction = Transaction(
+            sender=self.bob,
+            receiver=self.carol,
+            gas_limit=50000,
+            chain_id="T",
+            nonce=42,
+            value=10**18,
+            sender_username="bob",
+            receiver_username="carol",
+            data=b"hello",
+            options=2,
+            guardian=self.alice,
+            signature=b"\x01" * 64,
+            guardian_signature=b"\x02" * 64
+        )
+
+        relayed_transaction = self.factory.create_relayed_v1_transaction(inner_transaction, Address.new_from_bech32(self.alice))
+        decoded = self.decoder.decode(relayed_transaction)
+
+        assert decoded.__dict__ == inner_transaction.__dict__
+
+    def test_decode_relayed_v2(self):
+        inner_transaction = Transaction(
+            sender=self.bob,
+            receiver=self.carol,
+            gas_limit=0,
+            chain_id="T",
+            nonce=15,
+            data=b"getContractConfig",
+            signature=b"\x01" * 64
+        )
+
+        relayed_transaction = self.factory.create_relayed_v2_transaction(inner_transaction, 60_000_000, Address.new_from_bech32(self.alice))
+        decoded = self.decoder.decode(relayed_transaction)
+
+        assert decoded.__dict__ == inner_transaction.__dict__
+
+    def test_decode_many(self):
+        inner_transaction = Transaction(sender=self.bob, receiver=self.carol, gas_limit=50000, chain_id="T", signature=b"\x01" * 64)
+        relayed_transaction = self.factory.create_relayed_v1_transaction(inner_transaction, Address.new_from_bech32(self.alice))
+        regular_transaction = Transaction(sender=self.bob, receiver=self.carol, gas_limit=50000, chain_id="T", data=b"hello")
+        malformed_transaction = Transaction(sender=self.bob, receiver=self.carol, gas_limit=50000, chain_id="T", data=b"relayedTxV2@00@01")
+
+        decoded = self.decoder.decode_many([relayed_transaction, regular_transaction, malformed_transaction])
+
+        assert decoded[0] is not None and decoded[0].sender == self.bob
+        assert decoded[1:] == [None, None]
+        assert self.decoder.is_relayed(relayed_transaction)
+        assert not self.decoder.is_relayed(regular_transaction)
+
+    def test_decode_invalid(self):
+        transaction = Transaction(sender=self.bob, receiver=self.carol, gas_limit=50000, chain_id="T", data=b"relayedTx@7b7d")
+
+        with pytest.raises(InvalidRelayedTransactionError, match="Cannot decode the inner transaction of the relayed v1 transaction"):
+            self.decoder.decode(transaction)
+
+        transaction.data = b"relayedTxV2@zz@01@02@03"
+        with pytest.raises(InvalidRelayedTransactionError, match="Cannot decode the arguments of the relayed v2 transaction"):
+            self.decoder.decode(transaction)
+
+        transaction.data = b"hello"
+        with pytest.raises(InvalidRelayedTransactionError, match="The transaction is not a relayed transaction"):
+            self.decoder.decode(transaction)
@@ -1,8 +1,12 @@
 
-from typing import Protocol
+from typing import Any, Callable, Dict, List, Optional, Protocol, Tuple
 
 from multiversx_sdk_core import Address
 from multiversx_sdk_core.codec import decode_unsigned_number
+from multiversx_sdk_core.transaction_parsers.outcome_parser import \
+    OutcomeParser
+from multiversx_sdk_core.transaction_parsers.outcome_parser_types import \
+    OutcomeParsingResult
 from multiversx_sdk_core.transaction_parsers.token_operations_outcome_parser_types import (
     AddQuantityOutcome, BurnOutcome, BurnQuantityOutcome, ESDTIssueOutcome,
     FreezingOutcome, MintOutcome, NFTCreateOutcome, PausingOutcome,
@@ -11,58 +15,124 @@ from multiversx_sdk_core.transaction_parsers.token_operations_outcome_parser_typ
 from multiversx_sdk_core.transaction_parsers.transaction_on_network_wrapper import (
     ITransactionEvent, ITransactionOnNetwork, TransactionOnNetworkWrapper)
 
+# The operations are named after the "parse_*" methods.
+OPERATIONS = [
+    "issue_fungible",
+    "issue_non_fungible",
+    "issue_semi_fungible",
+    "register_meta_esdt",
+    "register_and_set_all_roles",
+    "set_burn_role_globally",
+    "unset_burn_role_globally",
+    "set_special_role",
+    "nft_create",
+    "local_mint",
+    "local_burn",
+    "pause",
+    "unpause",
+    "freeze",
+    "unfreeze",
+    "wipe",
+    "update_attributes",
+    "add_quantity",
+    "burn_quantity",
+]
+
+# (event identifier, operation), in the order of detection ("registerAndSetAllRoles" also emits "ESDTSetRole").
+# The operations without a specific event (e.g. "set_burn_role_globally") cannot be detected.
+OPERATIONS_BY_EVENT_IDENTIFIER: List[Tuple[str, str]] = [
+    ("issue", "issue_fungible"),
+    ("issueNonFungible", "issue_non_fungible"),
+    ("issueSemiFungible", "issue_semi_fungible"),
+    ("registerMetaESDT", "register_meta_esdt"),
+    ("registerAndSetAllRoles", "register_and_set_all_roles"),
+    ("ESDTSetRole", "set_special_role"),
+    ("ESDTNFTCreate", "nft_create"),
+    ("ESDTLocalMint", "local_mint"),
+    ("ESDTLocalBurn", "local_burn"),
+    ("ESDTPause", "pause"),
+    ("ESDTUnPause", "unpause"),
+    ("ESDTFreeze", "freeze"),
+    ("ESDTUnFreeze", "unfreeze"),
+    ("ESDTWipe", "wipe"),
+    ("ESDTNFTUpdateAttributes", "update_attributes"),
+    ("ESDTNFTAddQuantity", "add_quantity"),
+    ("ESDTNFTBurn", "burn_quantity"),
+]
+
 
 class IConfig(Protocol):
     address_hrp: str
 
 
-class TokenOperationsOutcomeParser:
+class TokenOperationsOutcomeParser(OutcomeParser):
+    operations = OPERATIONS
+
     def __init__(self, config: IConfig) -> None:
         self._config = config
 
+        # operation => outcome factory (of an event); "register_and_set_all_roles" also needs the "ESDTSetRole" event
+        outcome_factories_by_operation: Dict[str, Callable[..., Any]] = {
+            "issue_fungible": self._create_issue_outcome,
+            "issue_non_fungible": self._create_issue_outcome,
+            "issue_semi_fungible": self._create_issue_outcome,
+            "register_meta_esdt": self._create_issue_outcome,
+            "register_and_set_all_roles": self._create_register_and_set_all_roles_outcome_from_wrapper,
+            "set_special_role": self._create_set_special_role_outcome,
+            "nft_create": self._create_nft_create_outcome,
+            "local_mint": self._create_local_mint_outcome,
+            "local_burn": self._create_local_burn_outcome,
+            "pause": self._create_pausing_outcome,
+            "unpause": self._create_pausing_outcome,
+            "freeze": self._create_freeze_outcome,
+            "unfreeze": self._create_freeze_outcome,
+            "wipe": self._create_wipe_outcome,
+            "update_attributes": self._create_update_attributes_outcome,
+            "add_quantity": self._create_add_quantity_outcome,
+            "burn_quantity": self._create_burn_quantity_outcome,
+        }
+
+        # event identifier => (operation, outcome factory), in the order of detection
+        self._handlers_by_identifier: Dict[str, Tuple[str, Callable[..., Any]]] = {
+            identifier: (operation, outcome_factories_by_operation[operation])
+            for identifier, operation in OPERATIONS_BY_EVENT_IDENTIFIER
+        }
+
     def parse_issue_fungible(self, transaction: ITransactionOnNetwork) -> ESDTIssueOutcome:
         wrapper = TransactionOnNetworkWrapper.from_transaction(transaction)
         wrapper.ensure_no_error()
 
         event = wrapper.find_single_event_by_identifier("issue")
-        token_identifier = self._extract_token_identifier(event)
-        return ESDTIssueOutcome(token_identifier)
+        return self._create_issue_outcome(event)
 
     def parse_issue_non_fungible(self, transaction: ITransactionOnNetwork) -> ESDTIssueOutcome:
         wrapper = TransactionOnNetworkWrapper.from_transaction(transaction)
         wrapper.ensure_no_error()
 
         event = wrapper.find_single_event_by_identifier("issueNonFungible")
-        token_identifier = self._extract_token_identifier(event)
-        return ESDTIssueOutcome(token_identifier)
+        return self._create_issue_outcome(event)
 
     def parse_issue_semi_fungible(self, transaction: ITransactionOnNetwork) -> ESDTIssueOutcome:
         wrapper = TransactionOnNetworkWrapper.from_transaction(transaction)
         wrapper.ensure_no_error()
 
         event = wrapper.find_single_event_by_identifier("issueSemiFungible")
-        token_identifier = self._extract_token_identifier(event)
-        return ESDTIssueOutcome(token_identifier)
+        return self._create_issue_outcome(event)
 
     def parse_register_meta_esdt(self, transaction: ITransactionOnNetwork) -> ESDTIssueOutcome:
         wrapper = TransactionOnNetworkWrapper.from_transaction(transaction)
         wrapper.ensure_no_error()
 
         event = wrapper.find_single_event_by_identifier("registerMetaESDT")
-        token_identifier = self._extract_token_identifier(event)
-        return ESDTIssueOutcome(token_identifier)
+        return self._create_issue_outcome(event)
 
     def parse_register_and_set_all_roles(self, transaction: ITransactionOnNetwork) -> RegisterAndSetAllRolesOutcome:
         wrapper = TransactionOnNetworkWrapper.from_transaction(transaction)
         wrapper.ensure_no_error()
 
         event_register = wrapper.find_single_event_by_identifier("registerAndSetAllRoles")
-        token_identifier = self._extract_token_identifier(event_register)
-
         event_set_role = wrapper.find_single_event_by_identifier("ESDTSetRole")
-        roles = [str(topic) for topic in event_set_role.topics[3:]]
-
-        return RegisterAndSetAllRolesOutcome(token_identifier, roles)
+        return self._create_register_and_set_all_roles_outcome(event_register, event_set_role)
 
     def parse_set_burn_role_globally(self, transaction: ITransactionOnNetwork) -> None:
         wrapper = TransactionOnNetworkWrapper.from_transaction(transaction)
@@ -77,78 +147,190 @@ class TokenOperationsOutcomeParser:
         wrapper.ensure_no_error()
 
         event = wrapper.find_single_event_by_identifier("ESDTSetRole")
-        user_address = event.address.to_bech32()
-        token_identifier = self._extract_token_identifier(event)
-        roles = [str(topic) for topic in event.topics[3:]]
-
-        return SetSpecialRoleOutcome(user_address, token_identifier, roles)
+        return self._create_set_special_role_outcome(event)
 
     def parse_nft_create(self, transaction: ITransactionOnNetwork) -> NFTCreateOutcome:
         wrapper = TransactionOnNetworkWrapper.from_transaction(transaction)
         wrapper.ensure_no_error()
 
         event = wrapper.find_single_event_by_identifier("ESDTNFTCreate")
-        token_identifier = self._extract_token_identifier(event)
-        nonce = self._extract_nonce(event)
-        initial_quantity = self._extract_amount(event)
-
-        return NFTCreateOutcome(token_identifier, nonce, initial_quantity)
+        return self._create_nft_create_outcome(event)
 
     def parse_local_mint(self, transaction: ITransactionOnNetwork) -> MintOutcome:
         wrapper = TransactionOnNetworkWrapper.from_transaction(transaction)
         wrapper.ensure_no_error()
 
         event = wrapper.find_single_event_by_identifier("ESDTLocalMint")
-        user_address = event.address.to_bech32()
-        token_identifier = self._extract_token_identifier(event)
-        nonce = self._extract_nonce(event)
-        minted_supply = self._extract_amount(event)
-
-        return MintOutcome(user_address, token_identifier, nonce, minted_supply)
+        return self._create_local_mint_outcome(event)
 
     def parse_local_burn(self, transaction: ITransactionOnNetwork) -> BurnOutcome:
         wrapper = TransactionOnNetworkWrapper.from_transaction(transaction)
         wrapper.ensure_no_error()
 
         event = wrapper.find_single_event_by_identifier("ESDTLocalBurn")
-        user_address = event.address.to_bech32()
-        token_identifier = self._extract_token_identifier(event)
-        nonce = self._extract_nonce(event)
-        burnt_supply = self._extract_amount(event)
-
-        return BurnOutcome(user_address, token_identifier, nonce, burnt_supply)
+        return self._create_local_burn_outcome(event)
 
     def parse_pause(self, transaction: ITransactionOnNetwork) -> PausingOutcome:
         wrapper = TransactionOnNetworkWrapper.from_transaction(transaction)
         wrapper.ensure_no_error()
 
-        _ = wrapper.find_single_event_by_identifier("ESDTPause")
-        return PausingOutcome()
+        event = wrapper.find_single_event_by_identifier("ESDTPause")
+        return self._create_pausing_outcome(event)
 
     def parse_unpause(self, transaction: ITransactionOnNetwork) -> PausingOutcome:
         wrapper = TransactionOnNetworkWrapper.from_transaction(transaction)
         wrapper.ensure_no_error()
 
-        _ = wrapper.find_single_event_by_identifier("ESDTUnPause")
-        return PausingOutcome()
+        event = wrapper.find_single_event_by_identifier("ESDTUnPause")
+        return self._create_pausing_outcome(event)
 
     def parse_freeze(self, transaction: ITransactionOnNetwork) -> FreezingOutcome:
         wrapper = TransactionOnNetworkWrapper.from_transaction(transaction)
         wrapper.ensure_no_error()
 
         event = wrapper.find_single_event_by_identifier("ESDTFreeze")
-        token_identifier = self._extract_token_identifier(event)
-        nonce = self._extract_nonce(event)
-        balance = self._extract_amount(event)
-        user_address = self._extract_address(event)
-
-        return FreezingOutcome(user_address, token_identifier, nonce, balance)
+        return self._create_freeze_outcome(event)
 
     def parse_unfreeze(self, transaction: ITransactionOnNetwork) -> FreezingOutcome:
         wrapper = TransactionOnNetworkWrapper.from_transaction(transaction)
         wrapper.ensure_no_error()
 
         event = wrapper.find_single_event_by_identifier("ESDTUnFreeze")
+        return self._create_freeze_outcome(event)
+
+    def parse_wipe(self, transaction: ITransactionOnNetwork) -> WipingOutcome:
+        wrapper = TransactionOnNetworkWrapper.from_transaction(transaction)
+        wrapper.ensure_no_error()
+
+        event = wrapper.find_single_event_by_identifier("ESDTWipe")
+        return self._create_wipe_outcome(event)
+
+    def parse_update_attributes(self, transaction: ITransactionOnNetwork) -> UpdateAttributesOutcome:
+        wrapper = TransactionOnNetworkWrapper.from_transaction(transaction)
+        wrapper.ensure_no_error()
+
+        event = wrapper.find_single_event_by_identifier("ESDTNFTUpdateAttributes")
+        return self._create_update_attributes_outcome(event)
+
+    def parse_add_quantity(self, transaction: ITransactionOnNetwork) -> AddQuantityOutcome:
+        wrapper = TransactionOnNetworkWrapper.from_transaction(transaction)
+        wrapper.ensure_no_error()
+
+        event = wrapper.find_single_event_by_identifier("ESDTNFTAddQuantity")
+        return self._create_add_quantity_outcome(event)
+
+    def parse_burn_quantity(self, transaction: ITransactionOnNetwork) -> BurnQuantityOutcome:
+        wrapper = TransactionOnNetworkWrapper.from_transaction(transaction)
+        wrapper.ensure_no_error()
+
+        event = wrapper.find_single_event_by_identifier("ESDTNFTBurn")
+        return self._create_burn_quantity_outcome(event)
+
+    def detect_operation(self, transaction: ITransactionOnNetwork) -> Optional[str]:
+        wrapper = TransactionOnNetworkWrapper.from_transaction(transaction)
+
+        for identifier, (operation, _) in self._handlers_by_identifier.items():
+            if wrapper.has_event(identifier):
+                return operation
+
+        return None
+
+    def parse_all(self, transaction: ITransactionOnNetwork) -> List[OutcomeParsingResult]:
+        """
+        Returns all the recognized outcomes, in a single pass over the events (in their order), routed by their identifiers.
+        The "ESDTSetRole" events of a token registered by a "registerAndSetAllRoles" one are part of its outcome (not separate outcomes).
+        If an outcome cannot be extracted from its event, its error is reported in the results.
+        If the transaction encountered a "signalError", the only result (without an operation) holds it.
+        """
+        wrapper = TransactionOnNetworkWrapper.from_transaction(transaction)
+
+        signal_error = wrapper.find_error()
+        if signal_error is not None:
+            return [OutcomeParsingResult(None, signal_error=signal_error)]
+
+        registered_tokens = {
+            self._find_token_identifier(event) for event in wrapper.find_events_by_identifier("registerAndSetAllRoles")
+        }
+        registered_tokens.discard(None)
+        handlers_by_identifier = self._handlers_by_identifier
+        results: List[OutcomeParsingResult] = []
+
+        for event in wrapper.gather_all_events():
+            handler = handlers_by_identifier.get(event.identifier)
+            if handler is None:
+                continue
+
+            operation, create_outcome = handler
+            if operation == "set_special_role" and self._find_token_identifier(event) in registered_tokens:
+                continue
+
+            try:
+                if operation == "register_and_set_all_roles":
+                    outcome = create_outcome(wrapper, event)
+                else:
+                    outcome = create_outcome(event)
+                results.append(OutcomeParsingResult(operation, outcome=outcome))
+            except Exception as error:
+                results.append(OutcomeParsingResult(operation, error=error))
+
+        return results
+
+    def _create_issue_outcome(self, event: ITransactionEvent) -> ESDTIssueOutcome:
+        token_identifier = self._extract_token_identifier(event)
+        return ESDTIssueOutcome(token_identifier)
+
+    def _create_register_and_set_all_roles_outcome(self, event_register: ITransactionEvent, event_set_role: ITransactionEvent) -> RegisterAndSetAllRolesOutcome:
+        token_identifier = self._extract_token_identifier(event_register)
+        roles = tuple(str(topic) for topic in event_set_role.topics[3:])
+
+        return RegisterAndSetAllRolesOutcome(token_identifier, roles)
+
+    def _create_register_and_set_all_roles_outcome_from_wrapper(self, wrapper: TransactionOnNetworkWrapper, event_register: ITransactionEvent) -> RegisterAndSetAllRolesOutcome:
+        token_identifier = self._extract_token_identifier(event_register)
+        events_set_role = [
+            event for event in wrapper.find_events_by_identifier("ESDTSetRole")
+            if self._find_token_identifier(event) == token_identifier
+        ]
+
+        if len(events_set_role) != 1:
+            raise Exception(f"expected a single event of type 'ESDTSetRole' for token: '{token_identifier}', found: {len(events_set_role)}")
+
+        return self._create_register_and_set_all_roles_outcome(event_register, events_set_role[0])
+
+    def _create_set_special_role_outcome(self, event: ITransactionEvent) -> SetSpecialRoleOutcome:
+        user_address = event.address.to_bech32()
+        token_identifier = self._extract_token_identifier(event)
+        roles = tuple(str(topic) for topic in event.topics[3:])
+
+        return SetSpecialRoleOutcome(user_address, token_identifier, roles)
+
+    def _create_nft_create_outcome(self, event: ITransactionEvent) -> NFTCreateOutcome:
+        token_identifier = self._extract_token_identifier(event)
+        nonce = self._extract_nonce(event)
+        initial_quantity = self._extract_amount(event)
+
+        return NFTCreateOutcome(token_identifier, nonce, initial_quantity)
+
+    def _create_local_mint_outcome(self, event: ITransactionEvent) -> MintOutcome:
+        user_address = event.address.to_bech32()
+        token_identifier = self._extract_token_identifier(event)
+        nonce = self._extract_nonce(event)
+        minted_supply = self._extract_amount(event)
+
+        return MintOutcome(user_address, token_identifier, nonce, minted_supply)
+
+    def _create_local_burn_outcome(self, event: ITransactionEvent) -> BurnOutcome:
+        user_address = event.address.to_bech32()
+        token_identifier = self._extract_token_identifier(event)
+        nonce = self._extract_nonce(event)
+        burnt_supply = self._extract_amount(event)
+
+        return BurnOutcome(user_address, token_identifier, nonce, burnt_supply)
+
+    def _create_pausing_outcome(self, event: ITransactionEvent) -> PausingOutcome:
+        return PausingOutcome()
+
+    def _create_freeze_outcome(self, event: ITransactionEvent) -> FreezingOutcome:
         token_identifier = self._extract_token_identifier(event)
         nonce = self._extract_nonce(event)
         balance = self._extract_amount(event)
@@ -156,11 +338,7 @@ class TokenOperationsOutcomeParser:
 
         return FreezingOutcome(user_address, token_identifier, nonce, balance)
 
-    def parse_wipe(self, transaction: ITransactionOnNetwork) -> WipingOutcome:
-        wrapper = TransactionOnNetworkWrapper.from_transaction(transaction)
-        wrapper.ensure_no_error()
-
-        event = wrapper.find_single_event_by_identifier("ESDTWipe")
+    def _create_wipe_outcome(self, event: ITransactionEvent) -> WipingOutcome:
         token_identifier = self._extract_token_identifier(event)
         nonce = self._extract_nonce(event)
         balance = self._extract_amount(event)
@@ -168,33 +346,21 @@ class TokenOperationsOutcomeParser:
 
         return WipingOutcome(user_address, token_identifier, nonce, balance)
 
-    def parse_update_attributes(self, transaction: ITransactionOnNetwork) -> UpdateAttributesOutcome:
-        wrapper = TransactionOnNetworkWrapper.from_transaction(transaction)
-        wrapper.ensure_no_error()
-
-        event = wrapper.find_single_event_by_identifier("ESDTNFTUpdateAttributes")
+    def _create_update_attributes_outcome(self, event: ITransactionEvent) -> UpdateAttributesOutcome:
         token_identifier = self._extract_token_identifier(event)
         nonce = self._extract_nonce(event)
         attributes = event.topics[3].raw
 
         return UpdateAttributesOutcome(token_identifier, nonce, attributes)
 
-    def parse_add_quantity(self, transaction: ITransactionOnNetwork) -> AddQuantityOutcome:
-        wrapper = TransactionOnNetworkWrapper.from_transaction(transaction)
-        wrapper.ensure_no_error()
-
-        event = wrapper.find_single_event_by_identifier("ESDTNFTAddQuantity")
+    def _create_add_quantity_outcome(self, event: ITransactionEvent) -> AddQuantityOutcome:
         token_identifier = self._extract_token_identifier(event)
         nonce = self._extract_nonce(event)
         added_quantity = self._extract_amount(event)
 
         return AddQuantityOutcome(token_identifier, nonce, added_quantity)
 
-    def parse_burn_quantity(self, transaction: ITransactionOnNetwork) -> BurnQuantityOutcome:
-        wrapper = TransactionOnNetworkWrapper.from_transaction(transaction)
-        wrapper.ensure_no_error()
-
-        event = wrapper.find_single_event_by_identifier("ESDTNFTBurn")
+    def _create_burn_quantity_outcome(self, event: ITransactionEvent) -> BurnQuantityOutcome:
         token_identifier = self._extract_token_identifier(event)
         nonce = self._extract_nonce(event)
         burnt_quantity = self._extract_amount(event)
@@ -204,6 +370,9 @@ class TokenOperationsOutcomeParser:
     def _extract_token_identifier(self, event: ITransactionEvent) -> str:
         return str(event.topics[0])
 
+    def _find_token_identifier(self, event: ITransactionEvent) -> Optional[str]:
+        return str(event.topics[0]) if event.topics else None
+
     def _extract_nonce(self, event: ITransactionEvent) -> int:
         return decode_unsigned_number(event.topics[1].raw)
 
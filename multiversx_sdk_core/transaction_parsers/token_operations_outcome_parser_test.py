@@ -1,11 +1,23 @@
+import pickle
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import FrozenInstanceError
+
+import pytest
+
 from multiversx_sdk_core import Address
 from multiversx_sdk_core.codec import encode_unsigned_number
+from multiversx_sdk_core.errors import BadUsageError
 from multiversx_sdk_core.transaction_factories.transactions_factory_config import \
     TransactionsFactoryConfig
-from multiversx_sdk_core.transaction_parsers.token_operations_outcome_parser import \
-    TokenOperationsOutcomeParser
+from multiversx_sdk_core.transaction_parsers.outcome_parser_types import \
+    OutcomeParsingResult
+from multiversx_sdk_core.transaction_parsers.token_operations_outcome_parser import (
+    OPERATIONS, OPERATIONS_BY_EVENT_IDENTIFIER, TokenOperationsOutcomeParser)
+from multiversx_sdk_core.transaction_parsers.token_operations_outcome_parser_types import (
+    ESDTIssueOutcome, MintOutcome, NFTCreateOutcome, PausingOutcome,
+    RegisterAndSetAllRolesOutcome, SetSpecialRoleOutcome)
 from multiversx_sdk_core.transaction_parsers.transaction_on_network_wrapper import (
-    ContractResultsWrapper, TransactionEventTopicWrapper,
+    ContractResultsWrapper, SignalErrorInfo, TransactionEventTopicWrapper,
     TransactionEventWrapper, TransactionLogsWrapper,
     TransactionOnNetworkWrapper)
 
@@ -52,7 +64,7 @@ def test_parse_set_special_role():
 
     outcome = parser.parse_set_special_role(transaction)
     assert outcome.token_identifier == "FOOBAR"
-    assert outcome.roles == ["ESDTRoleLocalMint", "ESDTRoleLocalBurn"]
+    assert outcome.roles == ("ESDTRoleLocalMint", "ESDTRoleLocalBurn")
     assert outcome.user_address == grace.to_bech32()
 
 
@@ -101,3 +113,156 @@ def test_parse_nft_create():
     assert outcome.token_identifier == "FOOBAR"
     assert outcome.nonce == 42
     assert outcome.initial_quantity == 1
+
+
+def create_transaction(identifier: str, *topics: bytes) -> TransactionOnNetworkWrapper:
+    return TransactionOnNetworkWrapper(
+        ContractResultsWrapper([]),
+        TransactionLogsWrapper([
+            TransactionEventWrapper(
+                address=grace,
+                identifier=identifier,
+                topics=[TransactionEventTopicWrapper(topic) for topic in topics],
+                data=""
+            )
+        ])
+    )
+
+
+def test_parse_many():
+    transactions = [
+        create_transaction("ESDTNFTCreate", b"FOOBAR", encode_unsigned_number(42), encode_unsigned_number(1)),
+        create_transaction("ESDTLocalMint", b"FOOBAR", b"", encode_unsigned_number(200)),
+        create_transaction("signalError", b"", b"something went wrong"),
+        create_transaction("writeLog"),
+    ]
+
+    results = parser.parse_many(transactions)
+
+    assert [result.operation for result in results] == ["nft_create", "local_mint", None, None]
+    assert results[0].is_success() and results[0].outcome == NFTCreateOutcome("FOOBAR", 42, 1)
+    assert results[1].is_success() and results[1].outcome.minted_supply == 200
+    assert not results[2].is_success() and results[2].error is None
+    assert results[2].signal_error == SignalErrorInfo("something went wrong", "", None, 0)
+    assert str(results[3].error) == "Cannot detect the operation"
+
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        results = parser.parse_many(transactions, operation="nft_create", executor=executor)
+
+    assert results[0].outcome == NFTCreateOutcome("FOOBAR", 42, 1)
+    assert str(results[1].error) == "cannot find event of type: 'ESDTNFTCreate'"
+    assert results[2].operation == "nft_create"
+    assert results[2].signal_error is not None and results[2].signal_error.message == "something went wrong"
+    assert not results[3].is_success()
+
+    with pytest.raises(BadUsageError, match="Unknown operation: foobar"):
+        parser.parse_many(transactions, operation="foobar")
+
+
+def test_detect_operation():
+    for identifier, operation in OPERATIONS_BY_EVENT_IDENTIFIER:
+        assert operation in OPERATIONS
+        assert parser.detect_operation(create_transaction(identifier)) == operation
+
+    assert parser.detect_operation(create_transaction("writeLog")) is None
+
+
+def test_parse_all():
+    transaction = TransactionOnNetworkWrapper(
+        ContractResultsWrapper([]),
+        TransactionLogsWrapper([
+            TransactionEventWrapper(grace, "ESDTNFTCreate", [TransactionEventTopicWrapper(b"FOOBAR"), TransactionEventTopicWrapper(encode_unsigned_number(42)), TransactionEventTopicWrapper(encode_unsigned_number(1))], ""),
+            TransactionEventWrapper(grace, "writeLog", [], ""),
+            TransactionEventWrapper(grace, "ESDTLocalMint", [TransactionEventTopicWrapper(b"FOOBAR"), TransactionEventTopicWrapper(b""), TransactionEventTopicWrapper(encode_unsigned_number(200))], ""),
+            TransactionEventWrapper(grace, "ESDTNFTBurn", [], ""),
+        ])
+    )
+
+    results = parser.parse_all(transaction)
+
+    assert [result.operation for result in results] == ["nft_create", "local_mint", "burn_quantity"]
+    assert results[0].outcome == NFTCreateOutcome("FOOBAR", 42, 1)
+    assert results[1].outcome.minted_supply == 200
+    assert not results[2].is_success()
+
+    assert parser.parse_all(create_transaction("writeLog")) == []
+
+    results = parser.parse_all(create_transaction("signalError", b"", b"something went wrong"))
+    assert results == [OutcomeParsingResult(None, signal_error=SignalErrorInfo("something went wrong", "", None, 0))]
+
+
+def test_parse_all_with_register_and_set_all_roles():
+    transaction = TransactionOnNetworkWrapper(
+        ContractResultsWrapper([]),
+        TransactionLogsWrapper([
+            TransactionEventWrapper(grace, "registerAndSetAllRoles", [TransactionEventTopicWrapper(b"FOOBAR")], ""),
+            TransactionEventWrapper(grace, "ESDTSetRole", [
+                TransactionEventTopicWrapper(b"FOOBAR"),
+                TransactionEventTopicWrapper(b""),
+                TransactionEventTopicWrapper(b""),
+                TransactionEventTopicWrapper(b"ESDTRoleLocalMint"),
+            ], ""),
+        ])
+    )
+
+    results = parser.parse_all(transaction)
+
+    assert len(results) == 1
+    assert results[0].operation == "register_and_set_all_roles"
+    assert results[0].outcome.token_identifier == "FOOBAR"
+    assert results[0].outcome.roles == ("ESDTRoleLocalMint",)
+
+    # the detection follows the same routing: the "ESDTSetRole" event is part of the registration
+    assert parser.detect_operation(transaction) == "register_and_set_all_roles"
+
+
+def test_parse_all_with_register_and_set_all_roles_and_other_set_role():
+    transaction = TransactionOnNetworkWrapper(
+        ContractResultsWrapper([]),
+        TransactionLogsWrapper([
+            TransactionEventWrapper(frank, "ESDTSetRole", [
+                TransactionEventTopicWrapper(b"OTHER"),
+                TransactionEventTopicWrapper(b""),
+                TransactionEventTopicWrapper(b""),
+                TransactionEventTopicWrapper(b"ESDTRoleLocalBurn"),
+            ], ""),
+            TransactionEventWrapper(grace, "registerAndSetAllRoles", [TransactionEventTopicWrapper(b"FOOBAR")], ""),
+            TransactionEventWrapper(grace, "ESDTSetRole", [
+                TransactionEventTopicWrapper(b"FOOBAR"),
+                TransactionEventTopicWrapper(b""),
+                TransactionEventTopicWrapper(b""),
+                TransactionEventTopicWrapper(b"ESDTRoleLocalMint"),
+            ], ""),
+        ])
+    )
+
+    results = parser.parse_all(transaction)
+
+    assert [result.operation for result in results] == ["set_special_role", "register_and_set_all_roles"]
+    assert results[0].outcome == SetSpecialRoleOutcome(frank.to_bech32(), "OTHER", ("ESDTRoleLocalBurn",))
+    assert results[1].outcome == RegisterAndSetAllRolesOutcome("FOOBAR", ("ESDTRoleLocalMint",))
+
+
+def test_outcomes_are_slotted_frozen_and_hashable():
+    outcome = RegisterAndSetAllRolesOutcome("FOOBAR", ("ESDTRoleLocalMint", "ESDTRoleLocalBurn"))
+
+    assert not hasattr(outcome, "__dict__")
+    assert outcome.roles == ("ESDTRoleLocalMint", "ESDTRoleLocalBurn")
+
+    with pytest.raises(FrozenInstanceError):
+        outcome.token_identifier = "BAZ"  # type: ignore
+
+    duplicate = RegisterAndSetAllRolesOutcome("FOOBAR", ("ESDTRoleLocalMint", "ESDTRoleLocalBurn"))
+    assert len({outcome, duplicate, NFTCreateOutcome("FOOBAR", 42, 1), NFTCreateOutcome("FOOBAR", 42, 1)}) == 2
+
+    assert pickle.loads(pickle.dumps(outcome)) == outcome
+    assert pickle.loads(pickle.dumps(PausingOutcome())) == PausingOutcome()
+
+
+def test_outcomes_to_tuple():
+    outcome = MintOutcome(frank.to_bech32(), "FOOBAR", 0, 200)
+
+    assert outcome.to_tuple() == (frank.to_bech32(), "FOOBAR", 0, 200)
+    assert MintOutcome.from_tuple(outcome.to_tuple()) == outcome
+    assert ESDTIssueOutcome("FOOBAR").to_tuple() == ("FOOBAR",)
+    assert PausingOutcome().to_tuple() == ()
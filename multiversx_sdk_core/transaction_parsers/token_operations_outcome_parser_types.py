@@ -1,86 +1,119 @@
-
 from dataclasses import dataclass
-from typing import List
+from typing import Tuple
+
+# the shared types are re-exported, for backwards compatibility
+from multiversx_sdk_core.transaction_parsers.outcome_parser_types import (  # noqa: F401
+    OutcomeParsingResult, SlottedOutcome, TOutcome, amount_fields,
+    create_values_getter)
 
 
-@dataclass
-class ESDTIssueOutcome:
+@dataclass(frozen=True)
+class ESDTIssueOutcome(SlottedOutcome):
+    __slots__ = ("token_identifier",)
+
     token_identifier: str
 
 
-@dataclass
-class RegisterAndSetAllRolesOutcome:
+@dataclass(frozen=True)
+class RegisterAndSetAllRolesOutcome(SlottedOutcome):
+    __slots__ = ("token_identifier", "roles")
+
     token_identifier: str
-    roles: List[str]
+    roles: Tuple[str, ...]
 
 
-@dataclass
-class SetSpecialRoleOutcome:
+@dataclass(frozen=True)
+class SetSpecialRoleOutcome(SlottedOutcome):
+    __slots__ = ("user_address", "token_identifier", "roles")
+
     user_address: str
     token_identifier: str
-    roles: List[str]
+    roles: Tuple[str, ...]
+
 
+@amount_fields("initial_quantity")
+@dataclass(frozen=True)
+class NFTCreateOutcome(SlottedOutcome):
+    __slots__ = ("token_identifier", "nonce", "initial_quantity")
 
-@dataclass
-class NFTCreateOutcome:
     token_identifier: str
     nonce: int
     initial_quantity: int
 
 
-@dataclass
-class MintOutcome:
+@amount_fields("minted_supply")
+@dataclass(frozen=True)
+class MintOutcome(SlottedOutcome):
+    __slots__ = ("user_address", "token_identifier", "nonce", "minted_supply")
+
     user_address: str
     token_identifier: str
     nonce: int
     minted_supply: int
 
 
-@dataclass
-class BurnOutcome:
+@amount_fields("burnt_supply")
+@dataclass(frozen=True)
+class BurnOutcome(SlottedOutcome):
+    __slots__ = ("user_address", "token_identifier", "nonce", "burnt_supply")
+
     user_address: str
     token_identifier: str
     nonce: int
     burnt_supply: int
 
 
-@dataclass
-class PausingOutcome:
-    pass
+@dataclass(frozen=True)
+class PausingOutcome(SlottedOutcome):
+    __slots__ = ()
+
 
+@amount_fields("balance")
+@dataclass(frozen=True)
+class FreezingOutcome(SlottedOutcome):
+    __slots__ = ("user_address", "token_identifier", "nonce", "balance")
 
-@dataclass
-class FreezingOutcome:
     user_address: str
     token_identifier: str
     nonce: int
     balance: int
 
 
-@dataclass
-class WipingOutcome:
+@amount_fields("balance")
+@dataclass(frozen=True)
+class WipingOutcome(SlottedOutcome):
+    __slots__ = ("user_address", "token_identifier", "nonce", "balance")
+
     user_address: str
     token_identifier: str
     nonce: int
     balance: int
 
 
-@dataclass
-class UpdateAttributesOutcome:
+@dataclass(frozen=True)
+class UpdateAttributesOutcome(SlottedOutcome):
+    __slots__ = ("token_identifier", "nonce", "attributes")
+
     token_identifier: str
     nonce: int
     attributes: bytes
 
 
-@dataclass
-class AddQuantityOutcome:
+@amount_fields("added_quantity")
+@dataclass(frozen=True)
+class AddQuantityOutcome(SlottedOutcome):
+    __slots__ = ("token_identifier", "nonce", "added_quantity")
+
     token_identifier: str
     nonce: int
     added_quantity: int
 
 
-@dataclass
-class BurnQuantityOutcome:
+@amount_fields("burnt_quantity")
+@dataclass(frozen=True)
+class BurnQuantityOutcome(SlottedOutcome):
+    __slots__ = ("token_identifier", "nonce", "burnt_quantity")
+
     token_identifier: str
     nonce: int
     burnt_quantity: int
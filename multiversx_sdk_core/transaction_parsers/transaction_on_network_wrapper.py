@@ -1,4 +1,5 @@
-from typing import List, Sequence
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Sequence
 
 from multiversx_sdk_core.interfaces import IAddress
 from multiversx_sdk_core.transaction_parsers.interfaces import (
@@ -6,28 +7,69 @@ from multiversx_sdk_core.transaction_parsers.interfaces import (
     ITransactionEventTopic, ITransactionLogs, ITransactionOnNetwork)
 
 
+@dataclass
+class SignalErrorInfo:
+    """
+    A "signalError" event, located in the results tree: `contract_result_index` is None for the logs of the transaction itself,
+    while `event_index` is the position of the event within its logs.
+    """
+    message: str
+    data: str
+    contract_result_index: Optional[int]
+    event_index: int
+
+
 class TransactionOnNetworkWrapper:
-    def __init__(self, contract_results: IContractResults, logs: ITransactionLogs):
-        self.contract_results: ContractResultsWrapper = ContractResultsWrapper(contract_results.items)
-        self.logs: TransactionLogsWrapper = TransactionLogsWrapper(logs.events)
+    """
+    A lazy view over a transaction on network: the contract results, the events and their topics are wrapped only when accessed.
+    The flat list of events (of the logs, then of the contract results) and its index by identifier are built once, on first use.
+    The receiver (bech32) is optional, thus not part of `ITransactionOnNetwork`; it's empty if not known.
+    """
+
+    __slots__ = ("contract_results", "logs", "receiver", "_all_events", "_events_by_identifier")
+
+    def __init__(self, contract_results: IContractResults, logs: ITransactionLogs, receiver: str = ""):
+        self.contract_results: ContractResultsWrapper = contract_results if isinstance(contract_results, ContractResultsWrapper) else ContractResultsWrapper(contract_results.items)
+        self.logs: TransactionLogsWrapper = TransactionLogsWrapper.wrap(logs)
+        self.receiver: str = receiver or ""
+        self._all_events: Optional[List[TransactionEventWrapper]] = None
+        self._events_by_identifier: Optional[Dict[str, List[TransactionEventWrapper]]] = None
 
     @classmethod
     def from_transaction(cls, transaction_on_network: ITransactionOnNetwork) -> 'TransactionOnNetworkWrapper':
-        return cls(transaction_on_network.contract_results, transaction_on_network.logs)
+        """If the transaction is already wrapped, the wrapper (thus, its event index) is reused."""
+        if isinstance(transaction_on_network, TransactionOnNetworkWrapper):
+            return transaction_on_network
+
+        receiver = getattr(transaction_on_network, "receiver", None)
+        receiver_bech32 = receiver.to_bech32() if receiver is not None and hasattr(receiver, "to_bech32") else str(receiver or "")
+        return cls(transaction_on_network.contract_results, transaction_on_network.logs, receiver_bech32)
 
     def ensure_no_error(self):
-        all_events = self.gather_all_events()
+        error = self.find_error()
+        if error is not None:
+            raise Exception(f"encountered signalError: {error.message} ({error.data})")
 
-        for event in all_events:
-            if event.identifier == "signalError":
-                data = event.data[1:]
-                message = str(event.topics[1])
+    def find_error(self) -> Optional[SignalErrorInfo]:
+        """Non-raising variant of `ensure_no_error()`: returns the first "signalError", if any."""
+        if not self.has_event("signalError"):
+            return None
+        return self.find_errors()[0]
 
-                raise Exception(f"encountered signalError: {message} ({data})")
+    def find_errors(self) -> List[SignalErrorInfo]:
+        if not self.has_event("signalError"):
+            return []
+
+        errors: List[SignalErrorInfo] = []
+        _collect_errors(self.logs, None, errors)
+
+        for index, item in enumerate(self.contract_results.items):
+            _collect_errors(item.logs, index, errors)
+
+        return errors
 
     def find_single_event_by_identifier(self, identifier: str) -> 'TransactionEventWrapper':
-        all_events = self.gather_all_events()
-        filtered_events = [event for event in all_events if event.identifier == identifier]
+        filtered_events = self._get_events_by_identifier().get(identifier, [])
 
         if len(filtered_events) == 0:
             raise Exception(f"cannot find event of type: '{identifier}'")
@@ -36,42 +78,176 @@ class TransactionOnNetworkWrapper:
 
         return filtered_events[0]
 
+    def find_events_by_identifier(self, identifier: str) -> List['TransactionEventWrapper']:
+        return list(self._get_events_by_identifier().get(identifier, []))
+
+    def has_event(self, identifier: str) -> bool:
+        return identifier in self._get_events_by_identifier()
+
+    def count_events_by_identifier(self, identifier: str) -> int:
+        return len(self._get_events_by_identifier().get(identifier, []))
+
+    def count_events(self) -> int:
+        return len(self._get_all_events())
+
     def gather_all_events(self) -> List['TransactionEventWrapper']:
-        all_events: List[TransactionEventWrapper] = []
-        all_events.extend(self.logs.events)
+        return list(self._get_all_events())
+
+    def _get_all_events(self) -> List['TransactionEventWrapper']:
+        if self._all_events is None:
+            all_events: List[TransactionEventWrapper] = []
+            all_events.extend(self.logs.events)
+
+            for item in self.contract_results.items:
+                all_events.extend(item.logs.events)
+
+            self._all_events = all_events
+
+        return self._all_events
+
+    def _get_events_by_identifier(self) -> Dict[str, List['TransactionEventWrapper']]:
+        if self._events_by_identifier is None:
+            events_by_identifier: Dict[str, List[TransactionEventWrapper]] = {}
+
+            for event in self._get_all_events():
+                events_by_identifier.setdefault(event.identifier, []).append(event)
+
+            self._events_by_identifier = events_by_identifier
+
+        return self._events_by_identifier
 
-        for item in self.contract_results.items:
-            all_events.extend(item.logs.events)
 
-        return all_events
+def _collect_errors(logs: 'TransactionLogsWrapper', contract_result_index: Optional[int], errors: List[SignalErrorInfo]) -> None:
+    for event_index, event in enumerate(logs.events):
+        if event.identifier != "signalError":
+            continue
+
+        topics = event.topics
+        message = topics[1].raw.decode("utf-8", errors="replace") if len(topics) > 1 else ""
+        errors.append(SignalErrorInfo(message, event.data[1:], contract_result_index, event_index))
 
 
 class ContractResultsWrapper:
+    __slots__ = ("_source_items", "_items")
+
     def __init__(self, items: Sequence[IContractResultItem]):
-        self.items: List[ContractResultItemWrapper] = [ContractResultItemWrapper(item.logs) for item in items]
+        self._source_items = items
+        self._items: Optional[List[ContractResultItemWrapper]] = None
+
+    @property
+    def items(self) -> List['ContractResultItemWrapper']:
+        if self._items is None:
+            self._items = [item if isinstance(item, ContractResultItemWrapper) else self._wrap_item(item) for item in self._source_items]
+        return self._items
+
+    def _wrap_item(self, item: IContractResultItem) -> 'ContractResultItemWrapper':
+        return ContractResultItemWrapper(
+            item.logs,
+            getattr(item, "data", ""),
+            getattr(item, "previous_hash", ""),
+            getattr(item, "original_hash", "")
+        )
 
 
 class ContractResultItemWrapper:
-    def __init__(self, logs: 'ITransactionLogs'):
-        self.logs: TransactionLogsWrapper = TransactionLogsWrapper(logs.events)
+    """
+    The data field of the contract result (e.g. "@6f6b@...") and the hashes of the previous and of the original transaction
+    are optional, thus not part of `IContractResultItem`.
+    """
+
+    __slots__ = ("data", "previous_hash", "original_hash", "_source_logs", "_logs")
+
+    def __init__(self, logs: 'ITransactionLogs', data: str = "", previous_hash: str = "", original_hash: str = ""):
+        self.data: str = data or ""
+        self.previous_hash: str = previous_hash or ""
+        self.original_hash: str = original_hash or ""
+        self._source_logs = logs
+        self._logs: Optional[TransactionLogsWrapper] = None
+
+    @property
+    def logs(self) -> 'TransactionLogsWrapper':
+        if self._logs is None:
+            self._logs = TransactionLogsWrapper.wrap(self._source_logs)
+        return self._logs
 
 
 class TransactionLogsWrapper:
+    __slots__ = ("_source_events", "_events")
+
     def __init__(self, events: Sequence[ITransactionEvent]):
-        self.events: List[TransactionEventWrapper] = [TransactionEventWrapper(event.address, event.identifier, event.topics, event.data) for event in events]
+        self._source_events = events
+        self._events: Optional[List[TransactionEventWrapper]] = None
+
+    @classmethod
+    def wrap(cls, logs: ITransactionLogs) -> 'TransactionLogsWrapper':
+        return logs if isinstance(logs, TransactionLogsWrapper) else cls(logs.events)
+
+    @property
+    def events(self) -> List['TransactionEventWrapper']:
+        if self._events is None:
+            self._events = [TransactionEventWrapper.wrap(event) for event in self._source_events]
+        return self._events
 
 
 class TransactionEventWrapper:
+    """The topics are wrapped on first access; each of them is then read from the underlying event only when used."""
+
+    __slots__ = ("address", "identifier", "data", "_source_topics", "_topics")
+
     def __init__(self, address: IAddress, identifier: str, topics: Sequence[ITransactionEventTopic], data: str):
         self.address: IAddress = address
         self.identifier: str = identifier
-        self.topics: List[TransactionEventTopicWrapper] = [TransactionEventTopicWrapper(topic.raw) for topic in topics]
         self.data: str = data
+        self._source_topics = topics
+        self._topics: Optional[List[TransactionEventTopicWrapper]] = None
+
+    @classmethod
+    def wrap(cls, event: ITransactionEvent) -> 'TransactionEventWrapper':
+        if isinstance(event, TransactionEventWrapper):
+            return event
+        return cls(event.address, event.identifier, event.topics, event.data)
+
+    @property
+    def topics(self) -> List['TransactionEventTopicWrapper']:
+        if self._topics is None:
+            self._topics = [TransactionEventTopicWrapper.wrap(topic) for topic in self._source_topics]
+        return self._topics
 
 
 class TransactionEventTopicWrapper:
+    __slots__ = ("_source", "_raw")
+
     def __init__(self, raw: bytes):
-        self.raw = raw
+        self._source: Optional[ITransactionEventTopic] = None
+        self._raw: Optional[bytes] = raw
+
+    @classmethod
+    def wrap(cls, topic: ITransactionEventTopic) -> 'TransactionEventTopicWrapper':
+        """Holds a reference to the topic, whose raw value is read on first access."""
+        if isinstance(topic, TransactionEventTopicWrapper):
+            return topic
+
+        wrapper = cls.__new__(cls)
+        wrapper._source = topic
+        wrapper._raw = None
+        return wrapper
+
+    @property
+    def raw(self) -> bytes:
+        if self._raw is None:
+            assert self._source is not None
+            self._raw = self._source.raw
+        return self._raw
+
+    @raw.setter
+    def raw(self, value: bytes) -> None:
+        self._source = None
+        self._raw = value
+
+    @property
+    def view(self) -> memoryview:
+        """A zero-copy view over the raw value."""
+        return memoryview(self.raw)
 
     def __str__(self) -> str:
         return self.raw.decode("utf-8")
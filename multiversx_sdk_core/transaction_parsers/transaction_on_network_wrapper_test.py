@@ -0,0 +1,135 @@
+from types import SimpleNamespace
+from typing import List
+
+import pytest
+
+from multiversx_sdk_core import Address
+from multiversx_sdk_core.transaction_parsers.transaction_on_network_wrapper import (
+    ContractResultItemWrapper, ContractResultsWrapper, SignalErrorInfo,
+    TransactionEventTopicWrapper, TransactionEventWrapper,
+    TransactionLogsWrapper, TransactionOnNetworkWrapper)
+
+frank = Address.new_from_bech32("erd1kdl46yctawygtwg2k462307dmz2v55c605737dp3zkxh04sct7asqylhyv")
+
+
+def create_event(identifier: str, *topics: bytes) -> TransactionEventWrapper:
+    return TransactionEventWrapper(
+        address=frank,
+        identifier=identifier,
+        topics=[TransactionEventTopicWrapper(topic) for topic in topics],
+        data=""
+    )
+
+
+def test_find_events_by_identifier():
+    transaction = TransactionOnNetworkWrapper(
+        ContractResultsWrapper([
+            ContractResultItemWrapper(TransactionLogsWrapper([create_event("ESDTTransfer", b"first"), create_event("completedTxEvent")])),
+            ContractResultItemWrapper(TransactionLogsWrapper([create_event("ESDTTransfer", b"second")])),
+        ]),
+        TransactionLogsWrapper([create_event("ESDTTransfer", b"zeroth"), create_event("writeLog")])
+    )
+
+    assert transaction.count_events() == 5
+    assert transaction.count_events_by_identifier("ESDTTransfer") == 3
+    assert transaction.count_events_by_identifier("signalError") == 0
+    assert transaction.has_event("writeLog")
+    assert not transaction.has_event("signalError")
+    assert [str(event.topics[0]) for event in transaction.find_events_by_identifier("ESDTTransfer")] == ["zeroth", "first", "second"]
+    assert transaction.find_events_by_identifier("signalError") == []
+    assert transaction.find_single_event_by_identifier("writeLog").identifier == "writeLog"
+
+    with pytest.raises(Exception, match="more than one event of type 'ESDTTransfer'"):
+        transaction.find_single_event_by_identifier("ESDTTransfer")
+
+    # the index is built once; the returned lists are copies
+    transaction.find_events_by_identifier("ESDTTransfer").clear()
+    transaction.gather_all_events().clear()
+    assert transaction.count_events_by_identifier("ESDTTransfer") == 3
+    assert transaction.count_events() == 5
+
+
+def test_ensure_no_error():
+    transaction = TransactionOnNetworkWrapper(
+        ContractResultsWrapper([
+            ContractResultItemWrapper(TransactionLogsWrapper([create_event("signalError", b"", b"something went wrong")]))
+        ]),
+        TransactionLogsWrapper([create_event("writeLog")])
+    )
+
+    with pytest.raises(Exception, match="encountered signalError: something went wrong"):
+        transaction.ensure_no_error()
+
+
+def test_find_errors():
+    transaction = TransactionOnNetworkWrapper(
+        ContractResultsWrapper([
+            ContractResultItemWrapper(TransactionLogsWrapper([create_event("writeLog")])),
+            ContractResultItemWrapper(TransactionLogsWrapper([create_event("writeLog"), create_event("signalError", b"", b"out of funds")]))
+        ]),
+        TransactionLogsWrapper([create_event("signalError", b"")])
+    )
+
+    assert transaction.find_error() == SignalErrorInfo("", "", None, 0)
+    assert transaction.find_errors() == [
+        SignalErrorInfo("", "", None, 0),
+        SignalErrorInfo("out of funds", "", 1, 1)
+    ]
+
+    transaction = TransactionOnNetworkWrapper(ContractResultsWrapper([]), TransactionLogsWrapper([create_event("writeLog")]))
+    assert transaction.find_error() is None
+    assert transaction.find_errors() == []
+    transaction.ensure_no_error()
+
+
+class CountingTopic:
+    def __init__(self, raw: bytes) -> None:
+        self._raw = raw
+        self.num_reads = 0
+
+    @property
+    def raw(self) -> bytes:
+        self.num_reads += 1
+        return self._raw
+
+
+class Event:
+    def __init__(self, identifier: str, topics: List[CountingTopic]) -> None:
+        self.address = frank
+        self.identifier = identifier
+        self.topics = topics
+        self.data = ""
+
+
+def test_topics_are_read_lazily():
+    first_topic = CountingTopic(b"FOOBAR")
+    second_topic = CountingTopic(b"\x0a")
+    other_topic = CountingTopic(b"other")
+
+    logs = SimpleNamespace(events=[Event("issue", [first_topic, second_topic]), Event("writeLog", [other_topic])])
+    contract_results = SimpleNamespace(items=[])
+
+    transaction = TransactionOnNetworkWrapper(contract_results, logs)  # type: ignore
+    event = transaction.find_single_event_by_identifier("issue")
+    assert first_topic.num_reads == second_topic.num_reads == other_topic.num_reads == 0
+
+    assert str(event.topics[0]) == "FOOBAR"
+    assert bytes(event.topics[0].view) == b"FOOBAR"
+    assert first_topic.num_reads == 1
+    assert second_topic.num_reads == other_topic.num_reads == 0
+
+    # already wrapped objects are not wrapped again
+    assert TransactionOnNetworkWrapper(transaction.contract_results, transaction.logs).logs is transaction.logs
+
+
+def test_topic_raw_is_assignable():
+    source = CountingTopic(b"FOOBAR")
+    topic = TransactionEventTopicWrapper.wrap(source)  # type: ignore
+
+    topic.raw = b"BARFOO"
+    assert str(topic) == "BARFOO"
+    assert source.num_reads == 0
+
+    topic = TransactionEventTopicWrapper(b"FOO")
+    topic.raw = b"BAR"
+    assert topic.raw == b"BAR"
@@ -0,0 +1,322 @@
+"""
+Reads transactions on network (as returned by the API or the proxy) from NDJSON or JSON-array files, incrementally.
+
+The file is decoded in chunks, one JSON document at a time (thus, the memory usage doesn't depend on the size of the file).
+Of each transaction, only the events of interest are materialized (into the lazy wrappers of `transaction_on_network_wrapper`):
+the addresses are decoded on first use and the topics (base64) on first access.
+"""
+
+import codecs
+import json
+import re
+from base64 import b64decode
+from functools import lru_cache
+from time import perf_counter
+from typing import (Any, Dict, Iterable, Iterator, List, Optional, Set, Tuple,
+                    Union)
+
+from multiversx_sdk_core.address import Address
+from multiversx_sdk_core.errors import BadUsageError
+from multiversx_sdk_core.transaction_parsers.outcome_parser_types import \
+    OutcomeParsingResult
+from multiversx_sdk_core.transaction_parsers.token_operations_outcome_parser import (
+    OPERATIONS_BY_EVENT_IDENTIFIER, TokenOperationsOutcomeParser)
+from multiversx_sdk_core.transaction_parsers.transaction_on_network_wrapper import (
+    ContractResultItemWrapper, ContractResultsWrapper, TransactionEventWrapper,
+    TransactionLogsWrapper, TransactionOnNetworkWrapper)
+
+DEFAULT_CHUNK_SIZE = 1 << 16
+
+# The key of the contract results => whether their data is base64-encoded. The API names them "results" (with base64-encoded data),
+# the proxy names them "smartContractResults" (with plain data), while the serialized transactions on network
+# (of the network providers) hold them in "contractResults" (with plain data).
+CONTRACT_RESULTS_DATA_IS_BASE64_BY_KEY = {"contractResults": False, "results": True, "smartContractResults": False}
+
+_JSON_WHITESPACE = " \t\n\r"
+_JSON_DELIMITERS = re.compile(r'[\s,:\[\]{}"]')
+
+
+class StreamStats:
+    def __init__(self) -> None:
+        self.num_transactions = 0
+        self.num_events = 0
+        self.num_materialized_events = 0
+        self.num_outcomes = 0
+        self.elapsed_seconds = 0.0
+
+    @property
+    def events_per_second(self) -> float:
+        return self.num_events / self.elapsed_seconds if self.elapsed_seconds else 0.0
+
+    def reset(self) -> None:
+        self.num_transactions = 0
+        self.num_events = 0
+        self.num_materialized_events = 0
+        self.num_outcomes = 0
+        self.elapsed_seconds = 0.0
+
+
+class TransactionsStreamReader:
+    """
+    Yields the outcomes of the token operations found in a (possibly very large) dump of transactions on network.
+    By default, only the events handled by the parser (and "signalError") are materialized; all the events are counted, though.
+    The statistics of the ongoing (or last) read are available in `stats`.
+    """
+
+    def __init__(self,
+                 parser: TokenOperationsOutcomeParser,
+                 chunk_size: int = DEFAULT_CHUNK_SIZE,
+                 identifiers: Optional[Iterable[str]] = None) -> None:
+        if chunk_size < 1:
+            raise BadUsageError("The chunk size should be at least 1")
+
+        self.parser = parser
+        self.chunk_size = chunk_size
+        self.identifiers: Set[str] = set(identifiers) if identifiers is not None else _get_default_identifiers()
+        self.stats = StreamStats()
+
+    def read_outcomes(self, file: Any) -> Iterator[Tuple[str, OutcomeParsingResult]]:
+        """
+        Yields (transaction hash, result) pairs, in the order of the transactions, then of their events (see `parse_all()`).
+        For a transaction that encountered a "signalError", a single result (without an operation) holds it.
+        """
+        stats = self.stats
+
+        for transaction_hash, transaction in self.read_transactions(file):
+            for result in self.parser.parse_all(transaction):
+                stats.num_outcomes += 1
+                yield transaction_hash, result
+
+    def read_transactions(self, file: Any) -> Iterator[Tuple[str, TransactionOnNetworkWrapper]]:
+        """Yields (transaction hash, transaction) pairs. The file can be opened in text or binary mode (UTF-8)."""
+        stats = self.stats
+        stats.reset()
+        start = perf_counter()
+
+        for document in iter_json_documents(file, self.chunk_size):
+            transaction = self._create_transaction(document)
+            transaction_hash = document.get("hash") or document.get("txHash") or ""
+            del document
+
+            stats.num_transactions += 1
+            stats.elapsed_seconds = perf_counter() - start
+            yield transaction_hash, transaction
+
+        stats.elapsed_seconds = perf_counter() - start
+
+    def _create_transaction(self, document: Dict[str, Any]) -> TransactionOnNetworkWrapper:
+        logs = self._create_logs(document.get("logs"))
+
+        contract_results: Any = []
+        data_is_base64 = False
+        for key, is_base64 in CONTRACT_RESULTS_DATA_IS_BASE64_BY_KEY.items():
+            if document.get(key):
+                contract_results = document[key]
+                data_is_base64 = is_base64
+                break
+
+        if isinstance(contract_results, dict):
+            contract_results = contract_results.get("items") or []
+
+        items = [self._create_contract_result_item(item, data_is_base64) for item in contract_results]
+        return TransactionOnNetworkWrapper(ContractResultsWrapper(items), logs, document.get("receiver") or "")
+
+    def _create_contract_result_item(self, item: Dict[str, Any], data_is_base64: bool) -> ContractResultItemWrapper:
+        data = item.get("data") or ""
+
+        return ContractResultItemWrapper(
+            logs=self._create_logs(item.get("logs")),
+            data=_decode_data(data) if data_is_base64 else data,
+            previous_hash=item.get("prevTxHash") or item.get("previousHash") or "",
+            original_hash=item.get("originalTxHash") or item.get("originalHash") or ""
+        )
+
+    def _create_logs(self, logs: Optional[Dict[str, Any]]) -> TransactionLogsWrapper:
+        events: List[TransactionEventWrapper] = []
+
+        for event in (logs or {}).get("events") or []:
+            self.stats.num_events += 1
+
+            identifier = event.get("identifier", "")
+            if identifier not in self.identifiers:
+                continue
+
+            self.stats.num_materialized_events += 1
+            events.append(TransactionEventWrapper(
+                address=StreamedAddress(event.get("address", "")),
+                identifier=identifier,
+                topics=[StreamedTopic(topic) for topic in event.get("topics") or []],
+                data=_decode_data(event.get("data"))
+            ))
+
+        return TransactionLogsWrapper(events)
+
+
+class StreamedAddress:
+    """An address (bech32) decoded on first use."""
+
+    __slots__ = ("_bech32",)
+
+    def __init__(self, bech32: str) -> None:
+        self._bech32 = bech32
+
+    def to_bech32(self) -> str:
+        return self._bech32
+
+    def to_hex(self) -> str:
+        return _parse_address(self._bech32).to_hex()
+
+    def get_public_key(self) -> bytes:
+        return _parse_address(self._bech32).get_public_key()
+
+    def get_hrp(self) -> str:
+        return _parse_address(self._bech32).get_hrp()
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, StreamedAddress):
+            return self._bech32 == other._bech32
+        return NotImplemented
+
+    def __hash__(self) -> int:
+        return hash(self._bech32)
+
+    def __repr__(self) -> str:
+        return f"StreamedAddress({self._bech32!r})"
+
+
+class StreamedTopic:
+    """A topic (base64) decoded on first access of `raw`."""
+
+    __slots__ = ("_encoded",)
+
+    def __init__(self, encoded: Optional[str]) -> None:
+        self._encoded = encoded or ""
+
+    @property
+    def raw(self) -> bytes:
+        return b64decode(self._encoded)
+
+
+def iter_json_documents(file: Any, chunk_size: int = DEFAULT_CHUNK_SIZE) -> Iterator[Any]:
+    """
+    Yields the documents of a NDJSON file (or, generally, of a sequence of whitespace-separated JSON documents),
+    or the elements of a top-level JSON array, decoding the file in chunks of (at least) `chunk_size` characters.
+    """
+    decoder = json.JSONDecoder()
+    chunks = _iter_text_chunks(_read_chunks(file, chunk_size))
+    buffer = ""
+    position = 0
+    exhausted = False
+    in_array: Optional[bool] = None
+    expects_separator = False
+
+    def read_more(minimum_size: int) -> bool:
+        nonlocal buffer, position, exhausted
+        if exhausted:
+            return False
+
+        # Grow geometrically, so that large documents are not decoded (unsuccessfully) too many times.
+        parts = [buffer[position:]]
+        size = 0
+        while size < minimum_size:
+            chunk = next(chunks, None)
+            if chunk is None:
+                exhausted = True
+                break
+            parts.append(chunk)
+            size += len(chunk)
+
+        buffer = "".join(parts)
+        position = 0
+        return size > 0
+
+    def skip_whitespace() -> bool:
+        """Returns False at the end of the input."""
+        nonlocal position
+        while True:
+            length = len(buffer)
+            while position < length and buffer[position] in _JSON_WHITESPACE:
+                position += 1
+            if position < length:
+                return True
+            if not read_more(chunk_size):
+                return False
+
+    while skip_whitespace():
+        if in_array is None:
+            in_array = buffer[position] == "["
+            if in_array:
+                position += 1
+                continue
+
+        if in_array:
+            if buffer[position] == "]":
+                position += 1
+                in_array = False
+                expects_separator = False
+                continue
+            if expects_separator:
+                if buffer[position] != ",":
+                    raise ValueError(f"Expected ',' or ']' in the JSON array, found: {buffer[position]!r}")
+                position += 1
+                expects_separator = False
+                continue
+
+        while True:
+            try:
+                document, end = decoder.raw_decode(buffer, position)
+                break
+            except json.JSONDecodeError as error:
+                if not _may_be_truncated(error) or not read_more(max(chunk_size, len(buffer) - position)):
+                    raise
+
+        position = end
+        expects_separator = bool(in_array)
+        yield document
+
+
+def _may_be_truncated(error: json.JSONDecodeError) -> bool:
+    """
+    Whether the error might be caused by the end of the buffer, instead of invalid JSON: the error is within an unterminated string,
+    or within the last token (i.e. it isn't followed by any delimiter or whitespace). Otherwise, reading more wouldn't help.
+    """
+    if error.msg.startswith("Unterminated string"):
+        return True
+    return _JSON_DELIMITERS.search(error.doc, error.pos) is None
+
+
+def _read_chunks(file: Any, chunk_size: int) -> Iterator[Union[str, bytes]]:
+    while True:
+        chunk = file.read(chunk_size)
+        if not chunk:
+            return
+        yield chunk
+
+
+def _iter_text_chunks(chunks: Iterable[Union[str, bytes]]) -> Iterator[str]:
+    decoder = codecs.getincrementaldecoder("utf-8")()
+
+    for chunk in chunks:
+        if isinstance(chunk, bytes):
+            chunk = decoder.decode(chunk)
+        if chunk:
+            yield chunk
+
+    tail = decoder.decode(b"", final=True)
+    if tail:
+        yield tail
+
+
+def _decode_data(data: Optional[str]) -> str:
+    if not data:
+        return ""
+    return b64decode(data).decode("utf-8", errors="replace")
+
+
+def _get_default_identifiers() -> Set[str]:
+    return {identifier for identifier, _ in OPERATIONS_BY_EVENT_IDENTIFIER} | {"signalError"}
+
+
+@lru_cache(maxsize=4096)
+def _parse_address(bech32: str) -> Address:
+    return Address.new_from_bech32(bech32)
@@ -0,0 +1,138 @@
+import io
+import json
+from base64 import b64encode
+from typing import Any, Dict, List
+
+import pytest
+
+from multiversx_sdk_core.codec import encode_unsigned_number
+from multiversx_sdk_core.transaction_factories.transactions_factory_config import \
+    TransactionsFactoryConfig
+from multiversx_sdk_core.transaction_parsers.token_operations_outcome_parser import \
+    TokenOperationsOutcomeParser
+from multiversx_sdk_core.transaction_parsers.transaction_on_network_wrapper import \
+    SignalErrorInfo
+from multiversx_sdk_core.transaction_parsers.transactions_stream_reader import (
+    TransactionsStreamReader, iter_json_documents)
+
+GRACE = "erd1r69gk66fmedhhcg24g2c5kn2f2a5k4kvpr6jfw67dn2lyydd8cfswy6ede"
+
+parser = TokenOperationsOutcomeParser(TransactionsFactoryConfig("D"))
+
+
+def create_event(identifier: str, *topics: bytes, data: str = "") -> Dict[str, Any]:
+    return {
+        "address": GRACE,
+        "identifier": identifier,
+        "topics": [b64encode(topic).decode() for topic in topics],
+        "data": b64encode(data.encode()).decode() if data else None
+    }
+
+
+def create_transactions() -> List[Dict[str, Any]]:
+    return [
+        {
+            "hash": "aa",
+            "logs": {"events": [
+                create_event("ESDTNFTCreate", b"FOOBAR", encode_unsigned_number(42), encode_unsigned_number(1)),
+                create_event("writeLog"),
+            ]}
+        },
+        {
+            "hash": "bb",
+            "logs": None,
+            "results": [{"data": b64encode(b"@6f6b@2a").decode(), "prevTxHash": "bb", "originalTxHash": "bb", "logs": {"events": [create_event("ESDTLocalMint", b"FOOBAR", b"", encode_unsigned_number(200))]}}]
+        },
+        {
+            "txHash": "cc",
+            "smartContractResults": [{"logs": {"events": [create_event("signalError", b"", b"something went wrong", data="@75736572206572726f72")]}}]
+        },
+        {
+            "hash": "dd",
+            "contractResults": {"items": [{"data": "@6f6b", "logs": {"events": [create_event("ESDTLocalBurn", b"FOOBAR", b"", encode_unsigned_number(7))]}}]}
+        },
+    ]
+
+
+@pytest.mark.parametrize("chunk_size", [1, 7, 1 << 16])
+@pytest.mark.parametrize("as_array", [False, True])
+@pytest.mark.parametrize("binary", [False, True])
+def test_iter_json_documents(chunk_size: int, as_array: bool, binary: bool):
+    documents = create_transactions() + [{"text": "ñ"}]
+    content = json.dumps(documents, indent=2) if as_array else "\n".join(json.dumps(document) for document in documents) + "\n"
+    file = io.BytesIO(content.encode()) if binary else io.StringIO(content)
+
+    assert list(iter_json_documents(file, chunk_size)) == documents
+
+
+def test_iter_json_documents_with_empty_or_invalid_input():
+    assert list(iter_json_documents(io.StringIO(""))) == []
+    assert list(iter_json_documents(io.StringIO(" [ ] "))) == []
+
+    with pytest.raises(ValueError):
+        list(iter_json_documents(io.StringIO('{"a": 1}\n{"b": ')))
+
+    # a syntax error is raised as soon as it's found, without reading the rest of the file
+    file = io.StringIO('{"a": 1}\n{"b": x}\n' + " " * 1000)
+    with pytest.raises(ValueError, match="Expecting value"):
+        list(iter_json_documents(file, chunk_size=16))
+    assert file.tell() < 100
+
+    with pytest.raises(ValueError, match="Expected ',' or ']'"):
+        list(iter_json_documents(io.StringIO('[{"a": 1} {"b": 2}]')))
+
+
+def test_read_outcomes():
+    content = "\n".join(json.dumps(transaction) for transaction in create_transactions())
+    reader = TransactionsStreamReader(parser, chunk_size=16)
+
+    results = list(reader.read_outcomes(io.StringIO(content)))
+
+    assert [(transaction_hash, result.operation) for transaction_hash, result in results] == [
+        ("aa", "nft_create"),
+        ("bb", "local_mint"),
+        ("cc", None),
+        ("dd", "local_burn"),
+    ]
+    assert results[0][1].outcome.nonce == 42
+    assert results[1][1].outcome.minted_supply == 200
+    assert results[2][1].signal_error == SignalErrorInfo("something went wrong", "75736572206572726f72", 0, 0)
+    assert results[3][1].outcome.burnt_supply == 7
+
+    assert reader.stats.num_transactions == 4
+    assert reader.stats.num_events == 5
+    assert reader.stats.num_materialized_events == 4
+    assert reader.stats.num_outcomes == 4
+    assert reader.stats.events_per_second > 0
+
+
+def test_read_transactions_materializes_only_the_events_of_interest():
+    content = json.dumps(create_transactions())
+    reader = TransactionsStreamReader(parser, identifiers=["writeLog"])
+
+    transactions = list(reader.read_transactions(io.StringIO(content)))
+
+    assert [transaction.count_events() for _, transaction in transactions] == [1, 0, 0, 0]
+    event = transactions[0][1].find_single_event_by_identifier("writeLog")
+    assert event.address.to_bech32() == GRACE
+    assert event.address.to_hex() == "1e8a8b6b49de5b7be10aaa158a5a6a4abb4b56cc08f524bb5e6cd5f211ad3e13"
+
+    # the data of the contract results is either plain (proxy) or base64-encoded (API)
+    assert transactions[1][1].contract_results.items[0].data == "@6f6b@2a"
+    assert transactions[1][1].contract_results.items[0].previous_hash == "bb"
+    assert transactions[1][1].contract_results.items[0].original_hash == "bb"
+    assert transactions[3][1].contract_results.items[0].data == "@6f6b"
+
+
+def test_read_transactions_decodes_the_data_of_the_contract_results_by_source():
+    # plain data that happens to be valid base64 (e.g. "ESDTTransfer" arguments without "@") is not decoded
+    content = json.dumps([
+        {"hash": "aa", "smartContractResults": [{"data": "dGVzdA=="}]},
+        {"hash": "bb", "results": [{"data": b64encode(b"dGVzdA==").decode()}]},
+    ])
+    reader = TransactionsStreamReader(parser)
+
+    transactions = list(reader.read_transactions(io.StringIO(content)))
+
+    assert transactions[0][1].contract_results.items[0].data == "dGVzdA=="
+    assert transactions[1][1].contract_results.items[0].data == "dGVzdA=="
@@ -0,0 +1,129 @@
+import binascii
+from typing import List, Protocol, Tuple
+
+from multiversx_sdk_core import Address
+from multiversx_sdk_core.codec import decode_unsigned_number
+from multiversx_sdk_core.transaction_parsers.outcome_parser import \
+    OutcomeParser
+from multiversx_sdk_core.transaction_parsers.transaction_on_network_wrapper import (
+    ContractResultItemWrapper, ITransactionEvent, ITransactionOnNetwork,
+    TransactionOnNetworkWrapper)
+from multiversx_sdk_core.transaction_parsers.transfers_outcome_parser_types import (
+    SmartContractCallOutcome, TransferOutcome)
+
+# The operations are named after the "parse_*" methods.
+OPERATIONS = [
+    "transfers",
+    "smart_contract_call_result",
+]
+
+TRANSFER_EVENT_IDENTIFIERS = ["ESDTTransfer", "ESDTNFTTransfer", "MultiESDTNFTTransfer"]
+
+
+class IConfig(Protocol):
+    address_hrp: str
+
+
+class TransfersOutcomeParser(OutcomeParser):
+    """
+    Parses the token transfers (from the "ESDTTransfer", "ESDTNFTTransfer" and "MultiESDTNFTTransfer" events)
+    and the results of smart contract calls (from the "@<return code>@<return data>..." data of the contract results).
+    The operations cannot be detected, thus they should be given to `parse_many()`.
+    """
+
+    operations = OPERATIONS
+
+    def __init__(self, config: IConfig) -> None:
+        self._config = config
+
+    def parse_transfers(self, transaction: ITransactionOnNetwork) -> List[TransferOutcome]:
+        """Returns the transferred tokens, in the order of the events."""
+        wrapper = TransactionOnNetworkWrapper.from_transaction(transaction)
+        wrapper.ensure_no_error()
+
+        # most transactions don't transfer tokens: answered by the event index, without a pass over the events
+        if not any(wrapper.has_event(identifier) for identifier in TRANSFER_EVENT_IDENTIFIERS):
+            return []
+
+        outcomes: List[TransferOutcome] = []
+
+        for event in wrapper.gather_all_events():
+            if event.identifier == "MultiESDTNFTTransfer":
+                outcomes.extend(self._create_multi_transfer_outcomes(event))
+            elif event.identifier in ("ESDTTransfer", "ESDTNFTTransfer"):
+                outcomes.append(self._create_transfer_outcome(event))
+
+        return outcomes
+
+    def parse_smart_contract_call_result(self, transaction: ITransactionOnNetwork) -> SmartContractCallOutcome:
+        """
+        The result is read from the contract result (with data such as "@6f6b@2a") that answers the original call,
+        i.e. whose previous transaction is the original one. Otherwise (or if the hashes aren't known), the first contract result
+        that carries return data is preferred over the others (e.g. over the refunds of gas, with the data "@6f6b").
+        For intra-shard calls, there might be no such contract result; then, the result is read from the "writeLog" event.
+        """
+        wrapper = TransactionOnNetworkWrapper.from_transaction(transaction)
+        wrapper.ensure_no_error()
+
+        items = [item for item in wrapper.contract_results.items if item.data.startswith("@")]
+        if items:
+            # max() keeps the first of the equally ranked items
+            item = max(items, key=_rank_smart_contract_call_result)
+            return self._create_smart_contract_call_outcome(item.data)
+
+        for event in wrapper.find_events_by_identifier("writeLog"):
+            if event.data.startswith("@"):
+                return self._create_smart_contract_call_outcome(event.data)
+
+        raise Exception("cannot find the result of the smart contract call")
+
+    def _create_transfer_outcome(self, event: ITransactionEvent) -> TransferOutcome:
+        topics = event.topics
+        if len(topics) != 4:
+            raise Exception(f"unexpected number of topics for '{event.identifier}': {len(topics)}")
+
+        return TransferOutcome(
+            sender=event.address.to_bech32(),
+            receiver=self._public_key_to_bech32(topics[3].raw),
+            token_identifier=str(topics[0]),
+            nonce=decode_unsigned_number(topics[1].raw),
+            amount=decode_unsigned_number(topics[2].raw)
+        )
+
+    def _create_multi_transfer_outcomes(self, event: ITransactionEvent) -> List[TransferOutcome]:
+        # (identifier, nonce, amount) for each transferred token, then the receiver
+        topics = event.topics
+        if len(topics) < 4 or len(topics) % 3 != 1:
+            raise Exception(f"unexpected number of topics for '{event.identifier}': {len(topics)}")
+
+        sender = event.address.to_bech32()
+        receiver = self._public_key_to_bech32(topics[-1].raw)
+
+        return [
+            TransferOutcome(
+                sender=sender,
+                receiver=receiver,
+                token_identifier=str(topics[index]),
+                nonce=decode_unsigned_number(topics[index + 1].raw),
+                amount=decode_unsigned_number(topics[index + 2].raw)
+            )
+            for index in range(0, len(topics) - 1, 3)
+        ]
+
+    def _create_smart_contract_call_outcome(self, data: str) -> SmartContractCallOutcome:
+        try:
+            parts = [binascii.unhexlify(part) for part in data[1:].split("@")]
+        except ValueError as error:
+            raise Exception(f"cannot decode the result of the smart contract call: {error}")
+
+        return_code = parts[0].decode("utf-8", errors="replace")
+        return SmartContractCallOutcome(return_code, tuple(parts[1:]))
+
+    def _public_key_to_bech32(self, public_key: bytes) -> str:
+        return Address(public_key, self._config.address_hrp).to_bech32()
+
+
+def _rank_smart_contract_call_result(item: ContractResultItemWrapper) -> Tuple[bool, bool]:
+    answers_original_call = bool(item.original_hash) and item.previous_hash == item.original_hash
+    has_return_data = item.data.count("@") > 1
+    return answers_original_call, has_return_data
@@ -0,0 +1,129 @@
+from types import SimpleNamespace
+
+import pytest
+
+from multiversx_sdk_core import Address
+from multiversx_sdk_core.codec import encode_unsigned_number
+from multiversx_sdk_core.errors import BadUsageError
+from multiversx_sdk_core.transaction_factories.transactions_factory_config import \
+    TransactionsFactoryConfig
+from multiversx_sdk_core.transaction_parsers.transaction_on_network_wrapper import (
+    ContractResultItemWrapper, ContractResultsWrapper, SignalErrorInfo,
+    TransactionEventTopicWrapper, TransactionEventWrapper,
+    TransactionLogsWrapper, TransactionOnNetworkWrapper)
+from multiversx_sdk_core.transaction_parsers.transfers_outcome_parser import \
+    TransfersOutcomeParser
+from multiversx_sdk_core.transaction_parsers.transfers_outcome_parser_types import (
+    SmartContractCallOutcome, TransferOutcome)
+
+frank = Address.new_from_bech32("erd1kdl46yctawygtwg2k462307dmz2v55c605737dp3zkxh04sct7asqylhyv")
+grace = Address.new_from_bech32("erd1r69gk66fmedhhcg24g2c5kn2f2a5k4kvpr6jfw67dn2lyydd8cfswy6ede")
+parser = TransfersOutcomeParser(TransactionsFactoryConfig("D"))
+
+
+def create_event(identifier: str, *topics: bytes) -> TransactionEventWrapper:
+    return TransactionEventWrapper(
+        address=grace,
+        identifier=identifier,
+        topics=[TransactionEventTopicWrapper(topic) for topic in topics],
+        data=""
+    )
+
+
+def create_transaction(*events: TransactionEventWrapper) -> TransactionOnNetworkWrapper:
+    return TransactionOnNetworkWrapper(ContractResultsWrapper([]), TransactionLogsWrapper(list(events)))
+
+
+def test_parse_transfers():
+    transaction = create_transaction(
+        create_event("ESDTTransfer", b"USDC-c76f1f", b"", encode_unsigned_number(1000000), frank.get_public_key()),
+        create_event("writeLog"),
+        create_event("ESDTNFTTransfer", b"NFT-123456", encode_unsigned_number(42), encode_unsigned_number(1), frank.get_public_key()),
+        create_event(
+            "MultiESDTNFTTransfer",
+            b"USDC-c76f1f", b"", encode_unsigned_number(7),
+            b"SFT-123456", encode_unsigned_number(3), encode_unsigned_number(5),
+            frank.get_public_key()
+        ),
+    )
+
+    assert parser.parse_transfers(transaction) == [
+        TransferOutcome(grace.to_bech32(), frank.to_bech32(), "USDC-c76f1f", 0, 1000000),
+        TransferOutcome(grace.to_bech32(), frank.to_bech32(), "NFT-123456", 42, 1),
+        TransferOutcome(grace.to_bech32(), frank.to_bech32(), "USDC-c76f1f", 0, 7),
+        TransferOutcome(grace.to_bech32(), frank.to_bech32(), "SFT-123456", 3, 5),
+    ]
+
+    assert parser.parse_transfers(create_transaction(create_event("writeLog"))) == []
+
+    with pytest.raises(Exception, match="unexpected number of topics for 'MultiESDTNFTTransfer': 3"):
+        parser.parse_transfers(create_transaction(create_event("MultiESDTNFTTransfer", b"USDC-c76f1f", b"", b"")))
+
+
+def test_parse_smart_contract_call_result():
+    transaction = TransactionOnNetworkWrapper(
+        ContractResultsWrapper([
+            SimpleNamespace(logs=TransactionLogsWrapper([]), data="ESDTTransfer@55534443@0a"),
+            SimpleNamespace(logs=TransactionLogsWrapper([]), data="@6f6b@2a@"),
+        ]),  # type: ignore
+        TransactionLogsWrapper([])
+    )
+
+    assert parser.parse_smart_contract_call_result(transaction) == SmartContractCallOutcome("ok", (b"\x2a", b""))
+
+    # intra-shard calls: the result is in the "writeLog" event
+    event = create_event("writeLog")
+    event.data = "@6f6b"
+    assert parser.parse_smart_contract_call_result(create_transaction(event)) == SmartContractCallOutcome("ok", ())
+
+    with pytest.raises(Exception, match="cannot find the result of the smart contract call"):
+        parser.parse_smart_contract_call_result(create_transaction())
+
+    transaction = TransactionOnNetworkWrapper(ContractResultsWrapper([ContractResultItemWrapper(TransactionLogsWrapper([]), "@6f6b@zz")]), TransactionLogsWrapper([]))
+    with pytest.raises(Exception, match="cannot decode the result of the smart contract call"):
+        parser.parse_smart_contract_call_result(transaction)
+
+
+def test_parse_smart_contract_call_result_prefers_the_answer_to_the_original_call():
+    logs = TransactionLogsWrapper([])
+
+    # without hashes, the contract result with return data is preferred over the refund of gas
+    transaction = TransactionOnNetworkWrapper(
+        ContractResultsWrapper([ContractResultItemWrapper(logs, "@6f6b"), ContractResultItemWrapper(logs, "@6f6b@2a")]),
+        logs
+    )
+    assert parser.parse_smart_contract_call_result(transaction) == SmartContractCallOutcome("ok", (b"\x2a",))
+
+    # the answer to the original call is preferred over the results of the inner calls
+    transaction = TransactionOnNetworkWrapper(
+        ContractResultsWrapper([
+            SimpleNamespace(logs=logs, data="@6f6b@07", previous_hash="bb", original_hash="aa"),
+            SimpleNamespace(logs=logs, data="@6f6b@2a", previous_hash="aa", original_hash="aa"),
+        ]),  # type: ignore
+        logs
+    )
+    assert parser.parse_smart_contract_call_result(transaction) == SmartContractCallOutcome("ok", (b"\x2a",))
+
+
+def test_parse_many():
+    transactions = [
+        create_transaction(create_event("ESDTTransfer", b"USDC-c76f1f", b"", encode_unsigned_number(10), frank.get_public_key())),
+        create_transaction(create_event("signalError", b"", b"insufficient funds")),
+        create_transaction(create_event("ESDTTransfer", b"USDC-c76f1f")),
+    ]
+
+    results = parser.parse_many(transactions, "transfers")
+
+    assert results[0].outcome == [TransferOutcome(grace.to_bech32(), frank.to_bech32(), "USDC-c76f1f", 0, 10)]
+    assert results[1].signal_error == SignalErrorInfo("insufficient funds", "", None, 0)
+    assert str(results[2].error) == "unexpected number of topics for 'ESDTTransfer': 1"
+
+    results = parser.parse_many(transactions[:1], "smart_contract_call_result")
+    assert str(results[0].error) == "cannot find the result of the smart contract call"
+
+    with pytest.raises(BadUsageError, match="Unknown operation: foobar"):
+        parser.parse_many(transactions, "foobar")
+
+    # the operations cannot be detected
+    results = parser.parse_many(transactions[:1])
+    assert results[0].operation is None and str(results[0].error) == "Cannot detect the operation"
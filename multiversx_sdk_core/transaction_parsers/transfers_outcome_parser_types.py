@@ -0,0 +1,27 @@
+from dataclasses import dataclass
+from typing import Tuple
+
+from multiversx_sdk_core.transaction_parsers.outcome_parser_types import (
+    SlottedOutcome, amount_fields)
+
+
+@amount_fields("amount")
+@dataclass(frozen=True)
+class TransferOutcome(SlottedOutcome):
+    """A single transferred token: a "MultiESDTNFTTransfer" event results in an outcome per token."""
+
+    __slots__ = ("sender", "receiver", "token_identifier", "nonce", "amount")
+
+    sender: str
+    receiver: str
+    token_identifier: str
+    nonce: int
+    amount: int
+
+
+@dataclass(frozen=True)
+class SmartContractCallOutcome(SlottedOutcome):
+    __slots__ = ("return_code", "return_data")
+
+    return_code: str
+    return_data: Tuple[bytes, ...]
@@ -0,0 +1,409 @@
+"""
+Encoders for typed smart contract arguments (top-level and nested encoding).
+
+Also see: https://docs.multiversx.com/developers/data/serialization-overview
+"""
+
+import re
+from typing import (Any, Callable, Dict, List, Mapping, Optional, Sequence,
+                    Tuple)
+
+from multiversx_sdk_core.codec import encode_signed_number
+from multiversx_sdk_core.errors import (ErrCannotSerializeArgument,
+                                        ErrListsLengthMismatch,
+                                        InvalidTypeSignatureError)
+
+LENGTH_PREFIX_NUM_BYTES = 4
+PUBKEY_LENGTH = 32
+
+NestedEncoderFunction = Callable[[Any, bytearray], None]
+TopLevelEncoderFunction = Callable[[Any], bytes]
+
+_UNSIGNED_INTEGER_SIZES = {"u8": 1, "u16": 2, "u32": 4, "usize": 4, "u64": 8}
+_SIGNED_INTEGER_SIZES = {"i8": 1, "i16": 2, "i32": 4, "isize": 4, "i64": 8}
+_BYTES_TYPES = {"bytes", "BoxedBytes", "ManagedBuffer", "TokenIdentifier", "EgldOrEsdtTokenIdentifier"}
+_ADDRESS_TYPES = {"Address", "H256"}
+_ARRAY_TYPE_PATTERN = re.compile(r"^array(\d+)$")
+_TOKEN_PATTERN = re.compile(r"\s*([<>,]|[^<>,\s]+)")
+
+
+class TypeExpression:
+    def __init__(self, name: str, type_parameters: Sequence['TypeExpression'] = ()) -> None:
+        self.name = name
+        self.type_parameters = list(type_parameters)
+
+    def __str__(self) -> str:
+        if not self.type_parameters:
+            return self.name
+        return f"{self.name}<{','.join(str(parameter) for parameter in self.type_parameters)}>"
+
+
+class TypeEncoder:
+    __slots__ = ("type_signature", "encode_nested", "encode_top_level")
+
+    def __init__(self, type_signature: str, encode_nested: NestedEncoderFunction, encode_top_level: TopLevelEncoderFunction) -> None:
+        self.type_signature = type_signature
+        self.encode_nested = encode_nested
+        self.encode_top_level = encode_top_level
+
+
+class TypedValue:
+    """A value paired with its type signature; it can be passed as an argument wherever `IArgument` is accepted."""
+
+    def __init__(self, type_signature: str, value: Any, codec: Optional['TypedCodec'] = None) -> None:
+        self.type_signature = type_signature
+        self.value = value
+        self.codec = codec or default_codec
+
+    def serialize(self) -> bytes:
+        return self.codec.encode_top_level(self.type_signature, self.value)
+
+
+class TypedCodec:
+    """
+    Compiles each type signature (e.g. "List<tuple<TokenIdentifier,u64,BigUint>>") into a pair of encoding functions, once.
+    The compiled encoders are cached, thus subsequent calls with the same type signature skip the parsing and the type dispatch.
+    """
+
+    def __init__(self) -> None:
+        self._structs: Dict[str, List[Tuple[str, str]]] = {}
+        self._encoders: Dict[str, TypeEncoder] = {}
+
+    def register_struct(self, name: str, fields: Sequence[Tuple[str, str]]) -> None:
+        """`fields` is a sequence of (field name, type signature). Struct values can be mappings or objects with attributes."""
+        self._structs[name] = list(fields)
+        self._encoders.clear()
+
+    def get_encoder(self, type_signature: str) -> TypeEncoder:
+        encoder = self._encoders.get(type_signature)
+        if encoder is None:
+            encoder = self._compile(parse_type_signature(type_signature))
+            self._encoders[type_signature] = encoder
+
+        return encoder
+
+    def encode_top_level(self, type_signature: str, value: Any) -> bytes:
+        encoder = self.get_encoder(type_signature)
+
+        try:
+            return encoder.encode_top_level(value)
+        except (TypeError, ValueError, OverflowError, AttributeError, KeyError) as error:
+            raise ErrCannotSerializeArgument(value) from error
+
+    def encode_nested(self, type_signature: str, value: Any) -> bytes:
+        encoder = self.get_encoder(type_signature)
+        buffer = bytearray()
+
+        try:
+            encoder.encode_nested(value, buffer)
+        except (TypeError, ValueError, OverflowError, AttributeError, KeyError) as error:
+            raise ErrCannotSerializeArgument(value) from error
+
+        return bytes(buffer)
+
+    def encode_args(self, type_signatures: Sequence[str], values: Sequence[Any]) -> List[bytes]:
+        if len(type_signatures) != len(values):
+            raise ErrListsLengthMismatch("The number of type signatures should match the number of arguments")
+
+        return [self.encode_top_level(type_signature, value) for type_signature, value in zip(type_signatures, values)]
+
+    def _compile(self, expression: TypeExpression) -> TypeEncoder:
+        type_signature = str(expression)
+        name = expression.name
+        parameters = expression.type_parameters
+
+        if name in _UNSIGNED_INTEGER_SIZES:
+            self._ensure_number_of_type_parameters(expression, 0)
+            return _create_unsigned_integer_encoder(type_signature, _UNSIGNED_INTEGER_SIZES[name])
+        if name in _SIGNED_INTEGER_SIZES:
+            self._ensure_number_of_type_parameters(expression, 0)
+            return _create_signed_integer_encoder(type_signature, _SIGNED_INTEGER_SIZES[name])
+        if name == "BigUint":
+            self._ensure_number_of_type_parameters(expression, 0)
+            return _create_big_integer_encoder(type_signature, signed=False)
+        if name == "BigInt":
+            self._ensure_number_of_type_parameters(expression, 0)
+            return _create_big_integer_encoder(type_signature, signed=True)
+        if name == "bool":
+            self._ensure_number_of_type_parameters(expression, 0)
+            return _create_bool_encoder(type_signature)
+        if name in _BYTES_TYPES:
+            self._ensure_number_of_type_parameters(expression, 0)
+            return _create_bytes_encoder(type_signature)
+        if name in _ADDRESS_TYPES:
+            self._ensure_number_of_type_parameters(expression, 0)
+            return _create_address_encoder(type_signature)
+        if name == "Option":
+            self._ensure_number_of_type_parameters(expression, 1)
+            return _create_option_encoder(type_signature, self._get_inner_encoder(parameters[0]))
+        if name == "List":
+            self._ensure_number_of_type_parameters(expression, 1)
+            return _create_list_encoder(type_signature, self._get_inner_encoder(parameters[0]))
+        if name == "tuple":
+            if not parameters:
+                raise InvalidTypeSignatureError(f"Tuple without type parameters: {type_signature}")
+            return _create_tuple_encoder(type_signature, [self._get_inner_encoder(parameter) for parameter in parameters])
+        if name in self._structs:
+            self._ensure_number_of_type_parameters(expression, 0)
+            fields = self._structs[name]
+            field_names = [field_name for field_name, _ in fields]
+            field_types = [field_type for _, field_type in fields]
+
+            # the fields are compiled on first use, thus a struct can refer to itself (e.g. a "Node" with a "List<Node>" field)
+            return _create_struct_encoder(type_signature, field_names, lambda: [self.get_encoder(field_type) for field_type in field_types])
+
+        array_match = _ARRAY_TYPE_PATTERN.match(name)
+        if array_match:
+            self._ensure_number_of_type_parameters(expression, 1)
+            length = int(array_match.group(1))
+            return _create_array_encoder(type_signature, length, self._get_inner_encoder(parameters[0]))
+
+        raise InvalidTypeSignatureError(f"Unknown type: {name}")
+
+    def _get_inner_encoder(self, expression: TypeExpression) -> TypeEncoder:
+        return self.get_encoder(str(expression))
+
+    def _ensure_number_of_type_parameters(self, expression: TypeExpression, expected: int) -> None:
+        if len(expression.type_parameters) != expected:
+            raise InvalidTypeSignatureError(f"Type {expression.name} expects {expected} type parameter(s), got: {expression}")
+
+
+def parse_type_signature(type_signature: str) -> TypeExpression:
+    tokens = _tokenize(type_signature)
+    if not tokens:
+        raise InvalidTypeSignatureError("Empty type signature")
+
+    expression, position = _parse_expression(type_signature, tokens, 0)
+    if position != len(tokens):
+        raise InvalidTypeSignatureError(f"Unexpected trailing content in type signature: {type_signature}")
+
+    return expression
+
+
+def _tokenize(type_signature: str) -> List[str]:
+    tokens: List[str] = []
+    position = 0
+    stripped = type_signature.rstrip()
+
+    while position < len(stripped):
+        match = _TOKEN_PATTERN.match(stripped, position)
+        if not match:
+            raise InvalidTypeSignatureError(f"Bad type signature: {type_signature}")
+        tokens.append(match.group(1))
+        position = match.end()
+
+    return tokens
+
+
+def _parse_expression(type_signature: str, tokens: List[str], position: int) -> Tuple[TypeExpression, int]:
+    name = tokens[position]
+    if name in ("<", ">", ","):
+        raise InvalidTypeSignatureError(f"Bad type signature: {type_signature}")
+
+    position += 1
+    if position >= len(tokens) or tokens[position] != "<":
+        return TypeExpression(name), position
+
+    parameters: List[TypeExpression] = []
+    position += 1
+
+    while True:
+        if position >= len(tokens):
+            raise InvalidTypeSignatureError(f"Unbalanced type signature: {type_signature}")
+
+        parameter, position = _parse_expression(type_signature, tokens, position)
+        parameters.append(parameter)
+
+        if position >= len(tokens):
+            raise InvalidTypeSignatureError(f"Unbalanced type signature: {type_signature}")
+
+        separator = tokens[position]
+        position += 1
+
+        if separator == ">":
+            return TypeExpression(name, parameters), position
+        if separator != ",":
+            raise InvalidTypeSignatureError(f"Bad type signature: {type_signature}")
+
+
+def _create_unsigned_integer_encoder(type_signature: str, size: int) -> TypeEncoder:
+    def encode_nested(value: Any, buffer: bytearray) -> None:
+        buffer += value.to_bytes(size, byteorder="big", signed=False)
+
+    def encode_top_level(value: Any) -> bytes:
+        return value.to_bytes(size, byteorder="big", signed=False).lstrip(b"\x00")
+
+    return TypeEncoder(type_signature, encode_nested, encode_top_level)
+
+
+def _create_signed_integer_encoder(type_signature: str, size: int) -> TypeEncoder:
+    def encode_nested(value: Any, buffer: bytearray) -> None:
+        buffer += value.to_bytes(size, byteorder="big", signed=True)
+
+    def encode_top_level(value: Any) -> bytes:
+        # only for the range check
+        value.to_bytes(size, byteorder="big", signed=True)
+        return encode_signed_number(value)
+
+    return TypeEncoder(type_signature, encode_nested, encode_top_level)
+
+
+def _create_big_integer_encoder(type_signature: str, signed: bool) -> TypeEncoder:
+    def encode_top_level(value: Any) -> bytes:
+        if not isinstance(value, int):
+            raise TypeError(f"Expected integer, got {type(value)}")
+        if signed:
+            return encode_signed_number(value)
+        return value.to_bytes((value.bit_length() + 7) // 8, byteorder="big", signed=False)
+
+    def encode_nested(value: Any, buffer: bytearray) -> None:
+        encoded = encode_top_level(value)
+        buffer += len(encoded).to_bytes(LENGTH_PREFIX_NUM_BYTES, byteorder="big")
+        buffer += encoded
+
+    return TypeEncoder(type_signature, encode_nested, encode_top_level)
+
+
+def _create_bool_encoder(type_signature: str) -> TypeEncoder:
+    def encode_nested(value: Any, buffer: bytearray) -> None:
+        buffer.append(1 if value else 0)
+
+    def encode_top_level(value: Any) -> bytes:
+        return b"\x01" if value else b""
+
+    return TypeEncoder(type_signature, encode_nested, encode_top_level)
+
+
+def _create_bytes_encoder(type_signature: str) -> TypeEncoder:
+    def encode_top_level(value: Any) -> bytes:
+        if isinstance(value, str):
+            return value.encode("utf-8")
+        if isinstance(value, (bytes, bytearray)):
+            return bytes(value)
+        raise TypeError(f"Expected bytes, bytearray or str for {type_signature}, got: {type(value).__name__}")
+
+    def encode_nested(value: Any, buffer: bytearray) -> None:
+        encoded = encode_top_level(value)
+        buffer += len(encoded).to_bytes(LENGTH_PREFIX_NUM_BYTES, byteorder="big")
+        buffer += encoded
+
+    return TypeEncoder(type_signature, encode_nested, encode_top_level)
+
+
+def _create_address_encoder(type_signature: str) -> TypeEncoder:
+    def encode_top_level(value: Any) -> bytes:
+        if isinstance(value, (bytes, bytearray)):
+            pubkey = bytes(value)
+        elif hasattr(value, "get_public_key"):
+            pubkey = value.get_public_key()
+        else:
+            pubkey = bytes.fromhex(value.to_hex())
+
+        if len(pubkey) != PUBKEY_LENGTH:
+            raise ValueError(f"Expected {PUBKEY_LENGTH} bytes, got {len(pubkey)}")
+        return pubkey
+
+    def encode_nested(value: Any, buffer: bytearray) -> None:
+        buffer += encode_top_level(value)
+
+    return TypeEncoder(type_signature, encode_nested, encode_top_level)
+
+
+def _create_option_encoder(type_signature: str, inner: TypeEncoder) -> TypeEncoder:
+    inner_encode_nested = inner.encode_nested
+
+    def encode_nested(value: Any, buffer: bytearray) -> None:
+        if value is None:
+            buffer.append(0)
+            return
+
+        buffer.append(1)
+        inner_encode_nested(value, buffer)
+
+    def encode_top_level(value: Any) -> bytes:
+        if value is None:
+            return b""
+
+        buffer = bytearray([1])
+        inner_encode_nested(value, buffer)
+        return bytes(buffer)
+
+    return TypeEncoder(type_signature, encode_nested, encode_top_level)
+
+
+def _create_list_encoder(type_signature: str, inner: TypeEncoder) -> TypeEncoder:
+    inner_encode_nested = inner.encode_nested
+
+    def encode_nested(value: Any, buffer: bytearray) -> None:
+        buffer += len(value).to_bytes(LENGTH_PREFIX_NUM_BYTES, byteorder="big")
+        for item in value:
+            inner_encode_nested(item, buffer)
+
+    def encode_top_level(value: Any) -> bytes:
+        buffer = bytearray()
+        for item in value:
+            inner_encode_nested(item, buffer)
+        return bytes(buffer)
+
+    return TypeEncoder(type_signature, encode_nested, encode_top_level)
+
+
+def _create_array_encoder(type_signature: str, length: int, inner: TypeEncoder) -> TypeEncoder:
+    inner_encode_nested = inner.encode_nested
+
+    def encode_nested(value: Any, buffer: bytearray) -> None:
+        if len(value) != length:
+            raise ValueError(f"Expected {length} items, got {len(value)}")
+        for item in value:
+            inner_encode_nested(item, buffer)
+
+    def encode_top_level(value: Any) -> bytes:
+        buffer = bytearray()
+        encode_nested(value, buffer)
+        return bytes(buffer)
+
+    return TypeEncoder(type_signature, encode_nested, encode_top_level)
+
+
+def _create_tuple_encoder(type_signature: str, items: List[TypeEncoder]) -> TypeEncoder:
+    item_encoders = [item.encode_nested for item in items]
+
+    def encode_nested(value: Any, buffer: bytearray) -> None:
+        if len(value) != len(item_encoders):
+            raise ValueError(f"Expected {len(item_encoders)} items, got {len(value)}")
+        for encode_item, item in zip(item_encoders, value):
+            encode_item(item, buffer)
+
+    def encode_top_level(value: Any) -> bytes:
+        buffer = bytearray()
+        encode_nested(value, buffer)
+        return bytes(buffer)
+
+    return TypeEncoder(type_signature, encode_nested, encode_top_level)
+
+
+def _create_struct_encoder(type_signature: str, field_names: List[str], get_field_encoders: Callable[[], List[TypeEncoder]]) -> TypeEncoder:
+    resolved_fields: Optional[List[Tuple[str, NestedEncoderFunction]]] = None
+
+    def encode_nested(value: Any, buffer: bytearray) -> None:
+        nonlocal resolved_fields
+        if resolved_fields is None:
+            resolved_fields = [(field_name, encoder.encode_nested) for field_name, encoder in zip(field_names, get_field_encoders())]
+
+        fields = resolved_fields
+        if isinstance(value, Mapping):
+            for field_name, encode_field in fields:
+                encode_field(value[field_name], buffer)
+        else:
+            for field_name, encode_field in fields:
+                encode_field(getattr(value, field_name), buffer)
+
+    def encode_top_level(value: Any) -> bytes:
+        buffer = bytearray()
+        encode_nested(value, buffer)
+        return bytes(buffer)
+
+    return TypeEncoder(type_signature, encode_nested, encode_top_level)
+
+
+default_codec = TypedCodec()
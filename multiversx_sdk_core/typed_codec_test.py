@@ -0,0 +1,131 @@
+import pytest
+
+from multiversx_sdk_core.address import Address
+from multiversx_sdk_core.errors import (ErrCannotSerializeArgument,
+                                        InvalidTypeSignatureError)
+from multiversx_sdk_core.serializer import args_to_strings
+from multiversx_sdk_core.typed_codec import (TypedCodec, TypedValue,
+                                             parse_type_signature)
+
+alice = Address.new_from_bech32("erd1qyu5wthldzr8wx5c9ucg8kjagg0jfs53s8nr3zpz3hypefsdd8ssycr6th")
+
+
+class TestTypedCodec:
+    codec = TypedCodec()
+
+    def test_parse_type_signature(self):
+        assert str(parse_type_signature("u32")) == "u32"
+        assert str(parse_type_signature("List< tuple<TokenIdentifier, u64,BigUint> >")) == "List<tuple<TokenIdentifier,u64,BigUint>>"
+
+        with pytest.raises(InvalidTypeSignatureError):
+            parse_type_signature("List<u32")
+
+        with pytest.raises(InvalidTypeSignatureError):
+            parse_type_signature("u32>")
+
+        with pytest.raises(InvalidTypeSignatureError):
+            self.codec.get_encoder("Foobar")
+
+        with pytest.raises(InvalidTypeSignatureError):
+            self.codec.get_encoder("Option<u8,u16>")
+
+    def test_encode_numbers(self):
+        assert self.codec.encode_top_level("u32", 0) == b""
+        assert self.codec.encode_top_level("u32", 258) == bytes([0x01, 0x02])
+        assert self.codec.encode_nested("u32", 258) == bytes([0x00, 0x00, 0x01, 0x02])
+        assert self.codec.encode_nested("u8", 7) == bytes([0x07])
+        assert self.codec.encode_top_level("i64", -1) == bytes([0xFF])
+        assert self.codec.encode_nested("i16", -1) == bytes([0xFF, 0xFF])
+        assert self.codec.encode_top_level("BigUint", 256) == bytes([0x01, 0x00])
+        assert self.codec.encode_nested("BigUint", 256) == bytes([0x00, 0x00, 0x00, 0x02, 0x01, 0x00])
+        assert self.codec.encode_nested("BigUint", 0) == bytes([0x00, 0x00, 0x00, 0x00])
+        assert self.codec.encode_nested("BigInt", -256) == bytes([0x00, 0x00, 0x00, 0x02, 0xFF, 0x00])
+
+        with pytest.raises(ErrCannotSerializeArgument):
+            self.codec.encode_top_level("u8", 256)
+
+        with pytest.raises(ErrCannotSerializeArgument):
+            self.codec.encode_top_level("BigUint", -1)
+
+        with pytest.raises(ErrCannotSerializeArgument):
+            self.codec.encode_top_level("i8", 128)
+
+    def test_encode_bool_bytes_and_address(self):
+        assert self.codec.encode_top_level("bool", True) == b"\x01"
+        assert self.codec.encode_top_level("bool", False) == b""
+        assert self.codec.encode_nested("bool", False) == b"\x00"
+        assert self.codec.encode_top_level("TokenIdentifier", "FOO-abcdef") == b"FOO-abcdef"
+        assert self.codec.encode_nested("bytes", b"abc") == bytes([0x00, 0x00, 0x00, 0x03]) + b"abc"
+        assert self.codec.encode_top_level("Address", alice) == alice.get_public_key()
+        assert self.codec.encode_nested("Address", alice.get_public_key()) == alice.get_public_key()
+
+        # reported as any other bad value
+        with pytest.raises(ErrCannotSerializeArgument) as error:
+            self.codec.encode_top_level("bytes", 5)
+        assert str(error.value.__cause__) == "Expected bytes, bytearray or str for bytes, got: int"
+
+        with pytest.raises(ErrCannotSerializeArgument):
+            self.codec.encode_nested("List<TokenIdentifier>", [b"a", 5])
+
+    def test_encode_option_list_tuple_and_array(self):
+        assert self.codec.encode_top_level("Option<u32>", None) == b""
+        assert self.codec.encode_nested("Option<u32>", None) == b"\x00"
+        assert self.codec.encode_top_level("Option<u32>", 7).hex() == "0100000007"
+        assert self.codec.encode_top_level("List<u16>", [1, 2]).hex() == "00010002"
+        assert self.codec.encode_nested("List<u16>", [1, 2]).hex() == "0000000200010002"
+        assert self.codec.encode_top_level("List<bytes>", [b"a"]).hex() == "0000000161"
+        assert self.codec.encode_top_level("tuple<u8,BigUint>", (1, 2)).hex() == "010000000102"
+        assert self.codec.encode_top_level("array2<u8>", [1, 2]).hex() == "0102"
+
+        with pytest.raises(ErrCannotSerializeArgument):
+            self.codec.encode_top_level("tuple<u8,u8>", (1,))
+
+        with pytest.raises(ErrCannotSerializeArgument):
+            self.codec.encode_top_level("array2<u8>", [1])
+
+    def test_encode_struct(self):
+        codec = TypedCodec()
+        codec.register_struct("EsdtTokenPayment", [
+            ("token_identifier", "TokenIdentifier"),
+            ("token_nonce", "u64"),
+            ("amount", "BigUint")
+        ])
+
+        class Payment:
+            def __init__(self) -> None:
+                self.token_identifier = "FOO"
+                self.token_nonce = 1
+                self.amount = 10
+
+        expected = "00000003464f4f" + "0000000000000001" + "000000010a"
+        assert codec.encode_top_level("EsdtTokenPayment", Payment()).hex() == expected
+        assert codec.encode_top_level("EsdtTokenPayment", {"token_identifier": "FOO", "token_nonce": 1, "amount": 10}).hex() == expected
+        assert codec.encode_top_level("List<EsdtTokenPayment>", [Payment(), Payment()]).hex() == expected * 2
+
+    def test_encode_recursive_struct(self):
+        codec = TypedCodec()
+        codec.register_struct("Node", [("value", "u8"), ("children", "List<Node>")])
+        codec.register_struct("A", [("b", "Option<B>")])
+        codec.register_struct("B", [("a", "A")])
+
+        leaf = {"value": 2, "children": []}
+        assert codec.encode_top_level("Node", {"value": 1, "children": [leaf]}).hex() == "01" + "00000001" + "02" + "00000000"
+        assert codec.encode_top_level("A", {"b": {"a": {"b": None}}}).hex() == "0100"
+
+        # the fields are compiled on first use
+        codec.register_struct("Broken", [("value", "u33")])
+        encoder = codec.get_encoder("Broken")
+        with pytest.raises(InvalidTypeSignatureError, match="Unknown type: u33"):
+            encoder.encode_top_level({"value": 1})
+
+    def test_encoders_are_cached(self):
+        codec = TypedCodec()
+        encoder = codec.get_encoder("List<Option<u32>>")
+
+        assert codec.get_encoder("List<Option<u32>>") is encoder
+        assert codec.get_encoder("Option<u32>") is codec.get_encoder("Option<u32>")
+
+
+def test_args_to_strings_with_types():
+    assert args_to_strings([7, [1, 2], None], ["u32", "List<u8>", "Option<BigUint>"]) == ["07", "0102", ""]
+    assert args_to_strings([TypedValue("List<u8>", [1, 2]), 42]) == ["0102", "2a"]